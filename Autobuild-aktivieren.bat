@@ -4,8 +4,14 @@ rem In das Verzeichnis der Batch-Datei wechseln
 pushd "%~dp0"
 rem (Optional) Virtuelle Umgebung aktivieren, wenn vorhanden
 if exist ".venv\Scripts\activate.bat" call ".venv\Scripts\activate.bat"
-rem Live-Server starten und Browser öffnen
-sphinx-autobuild -b html -t dev source build/html --open-browser
+rem Render-Daemon für Abbildungen starten (hält matplotlib, numpy & plotly geladen)
+start "Render-Daemon" /min python plots\renderd.py serve
+rem Live-Server starten und Browser öffnen; vor jedem Build veraltete Abbildungen erzeugen
+sphinx-autobuild -b html -t dev source build/html --open-browser ^
+    --watch plots --ignore "*/_static/plots/*" --ignore "*/plots/.build-manifest.*" ^
+    --pre-build "python plots/build.py --daemon"
+rem Render-Daemon beenden
+python plots\renderd.py stop
 rem Aufräumen und Pfad zurücksetzen (nach Beenden)
 popd
 endlocal
\ No newline at end of file
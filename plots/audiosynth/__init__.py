@@ -0,0 +1,84 @@
+"""
+audiosynth – Töne und Akkorde mit Obertönen als Audiodateien erzeugen.
+
+Bibliotheksfassung der Tutorial-Skripte aus
+``source/dev/rezepte/audio/toene_erzeugen_code`` (gleiche Funktionsnamen und
+Parameter), optimiert für lange und viele Renderings. Die Inhalte werden
+erst beim ersten Zugriff geladen (PEP 562).
+
+Module:
+    notes      Notennamen, Akkorde, Obertonspektren (nur Standardbibliothek)
+    synth      additive Synthese als Matrixprodukt in Blöcken (numpy)
+    pcm        Float → PCM-Samples (int16/24/32, float32), blockweise Normierung (numpy)
+    wavstream  WAV-Dateien stückweise schreiben (numpy)
+    tones      make_tone_wav, make_chord_with_partials, … (numpy)
+    batch      render_batch: viele Dateien nach einem Manifest (YAML/JSON, Prozess-Pool)
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .batch import render_batch
+    from .notes import (INSTRUMENT_PARTIALS, QUALITY_INTERVALS, chord_frequencies,
+                        get_partials, note_to_freq, parse_chord_name)
+    from .pcm import SAMPLE_FORMATS, SampleFormat, quantize, quantize_int16, to_int16, to_pcm
+    from .synth import (PartialTable, analytic_peak, iter_blocks, partial_table, peak_bound,
+                        shared_block_basis, synthesize)
+    from .tones import (ToneSpec, chord_spec, make_chord_wav, make_chord_with_partials,
+                        make_instrument_tone_wav, make_named_chord_wav,
+                        make_named_chord_with_partials, make_tone_wav, make_tone_with_partials,
+                        tone_spec)
+    from .wavstream import WavWriter, stream_peak, write_wav_stream
+
+# öffentlicher Name -> Untermodul
+_LAZY = {
+    "INSTRUMENT_PARTIALS": "notes",
+    "QUALITY_INTERVALS": "notes",
+    "note_to_freq": "notes",
+    "parse_chord_name": "notes",
+    "chord_frequencies": "notes",
+    "get_partials": "notes",
+    "PartialTable": "synth",
+    "partial_table": "synth",
+    "synthesize": "synth",
+    "iter_blocks": "synth",
+    "analytic_peak": "synth",
+    "peak_bound": "synth",
+    "shared_block_basis": "synth",
+    "WavWriter": "wavstream",
+    "stream_peak": "wavstream",
+    "write_wav_stream": "wavstream",
+    "to_int16": "pcm",
+    "quantize_int16": "pcm",
+    "to_pcm": "pcm",
+    "quantize": "pcm",
+    "SampleFormat": "pcm",
+    "SAMPLE_FORMATS": "pcm",
+    "make_tone_wav": "tones",
+    "make_tone_with_partials": "tones",
+    "make_instrument_tone_wav": "tones",
+    "make_chord_wav": "tones",
+    "make_named_chord_wav": "tones",
+    "make_chord_with_partials": "tones",
+    "make_named_chord_with_partials": "tones",
+    "ToneSpec": "tones",
+    "tone_spec": "tones",
+    "chord_spec": "tones",
+    "render_batch": "batch",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value  # nächster Zugriff ohne __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
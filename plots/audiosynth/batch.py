@@ -0,0 +1,361 @@
+"""
+Töne und Akkorde im Stapel erzeugen – gesteuert über ein Manifest (YAML/JSON).
+
+Statt die Tutorial-Skripte Datei für Datei laufen zu lassen, beschreibt ein
+Manifest alle Audiobeispiele einer Seite:
+
+    output: ../../../_static/audio/toene_erzeugen   # relativ zum Manifest
+    defaults: {sr: 44100, amp: 0.9, duration: 2.0, format: mp3}
+    jobs:
+      - {file: tone_C4, tone: C4}
+      - {file: violine_C4, tone: C4, partials: violine}
+      - {file: chord_C4_Dur, chord: C4-Dur, duration: 1.5}
+      - {file: C4_maj_tuba, chord: [C4, E4, G4], partials: tuba}
+
+:func:`render_batch` fasst dabei zusammen, was sich teilen lässt:
+
+- gleiche Aufträge (auch unter verschiedenen Dateinamen) werden nur einmal
+  berechnet und danach kopiert,
+- Aufträge mit gleichem Klang, gleicher Abtastrate und Dauer teilen
+  Sinusanteile und Normierung (ein Spitzenwert für alle Ausgabeformate),
+- die Zeitbasis kommt aus einem Cache je Frequenz
+  (:func:`audiosynth.synth.shared_block_basis`), der Grundton C4 wird also
+  für Sinus, Instrumente und Akkorde nur einmal ausgewertet,
+- die Klänge werden auf einen Prozess-Pool verteilt.
+
+MP3 wird mit dem ``ffmpeg``-Programm (LAME) kodiert. Ist es nicht installiert,
+bricht :func:`render_batch` vor dem ersten Auftrag mit einem Fehler ab (der
+Aufruf endet mit Exit-Code 1) – die Seiten verweisen auf die MP3-Dateien,
+stillschweigend daneben geschriebene WAV-Dateien würden veraltete Audios
+verdecken. Mit ``--wav`` (``wav_only=True``) entstehen ausdrücklich WAV-Dateien.
+
+Aufruf (aus ``plots/``):
+
+    python -m audiosynth.batch ../source/dev/rezepte/audio/toene_erzeugen_audio.yaml
+    python -m audiosynth.batch manifest.json -j 4 --wav -o /tmp/audio
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from .notes import chord_frequencies, parse_chord_name
+from .pcm import get_sample_format
+from .synth import DEFAULT_BLOCK, iter_blocks, shared_block_basis
+from .tones import ToneSpec, chord_spec, normalization_peak, tone_spec
+from .wavstream import write_wav_stream
+
+# Vorgaben für Aufträge (überschreibbar über 'defaults' im Manifest)
+DEFAULTS: dict[str, Any] = {
+    "sr": 44100,
+    "amp": 0.9,
+    "duration": 1.0,
+    "A4": 440.0,
+    "fade": 0.01,
+    "norm": "sum",
+    "headroom_db": 0.0,
+    "sample_format": "int16",
+    "format": "wav",
+    "bitrate": "192k",
+}
+JOB_KEYS = {"file", "tone", "chord", "partials", *DEFAULTS}
+CONTAINERS = ("wav", "mp3")
+
+
+@dataclass(frozen=True)
+class Output:
+    """Zieldatei eines Auftrags und wie sie kodiert wird."""
+
+    path: Path
+    container: str = "wav"
+    sample_format: str = "int16"
+    headroom_db: float = 0.0
+    bitrate: str = "192k"
+
+    @property
+    def encoding(self) -> tuple:
+        """Alles außer dem Pfad – gleiche Kodierung ergibt die gleiche Datei."""
+        return self.container, self.sample_format, self.headroom_db, self.bitrate
+
+
+@dataclass(frozen=True)
+class Job:
+    """Ein Klang (Stimmen, Teiltöne, Dauer, Abtastrate) und seine Zieldatei."""
+
+    spec: ToneSpec
+    sr: int
+    duration_s: float
+    fade_s: float
+    output: Output
+
+    @property
+    def signal(self) -> tuple:
+        """Schlüssel des Float-Signals: Aufträge mit gleichem Schlüssel teilen die Synthese."""
+        compute = get_sample_format(self.output.sample_format).compute
+        return self.spec, self.sr, self.duration_s, self.fade_s, compute
+
+
+# ------------------------------------------------------------------
+#  Manifest
+# ------------------------------------------------------------------
+def load_manifest(path: str | Path) -> Any:
+    """Liest ein Manifest aus einer YAML- (.yaml/.yml) oder JSON-Datei (.json)."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        return json.loads(text)
+    if path.suffix.lower() in (".yaml", ".yml"):
+        import yaml
+        return yaml.safe_load(text)
+    raise ValueError(f"Unbekanntes Manifest-Format: {path.name} (erwartet .yaml, .yml oder .json)")
+
+
+def parse_job(entry: Mapping[str, Any], defaults: Mapping[str, Any], out_dir: Path) -> Job:
+    """Ein Eintrag der Job-Liste (mit Vorgaben ergänzt) → :class:`Job`."""
+    unknown = set(entry) - JOB_KEYS
+    if unknown:
+        raise ValueError(f"Unbekannte Schlüssel {sorted(unknown)} (erlaubt: {sorted(JOB_KEYS)})")
+    if ("tone" in entry) == ("chord" in entry):
+        raise ValueError("Jeder Auftrag braucht genau einen der Schlüssel 'tone' oder 'chord'")
+    if "file" not in entry:
+        raise ValueError("Jeder Auftrag braucht einen Dateinamen ('file')")
+    opts = {**DEFAULTS, **defaults, **entry}
+
+    container = str(opts["format"]).lower()
+    if container not in CONTAINERS:
+        raise ValueError(f"Unbekanntes Format: {opts['format']!r} (bekannt: {', '.join(CONTAINERS)})")
+    sample_format = get_sample_format(opts["sample_format"]).name
+    partials = opts.get("partials")
+    if isinstance(partials, Mapping):                   # YAML/JSON-Schlüssel sind ggf. Strings
+        partials = {int(k): float(a) for k, a in partials.items()}
+
+    if "tone" in entry:
+        spec = tone_spec(opts["tone"], opts["amp"], partials, A4=opts["A4"], norm_mode=opts["norm"])
+    else:
+        chord = opts["chord"]
+        if isinstance(chord, str):                      # Akkordname, z. B. "C4-Dur"
+            root, quality = parse_chord_name(chord)
+            chord = chord_frequencies(root, quality, A4=opts["A4"])
+        spec = chord_spec(chord, opts["amp"], partials, A4=opts["A4"], norm_mode=opts["norm"])
+
+    path = out_dir / opts["file"]
+    if path.suffix.lower() != f".{container}":
+        path = path.with_name(f"{path.name}.{container}")
+    output = Output(path, container, sample_format, float(opts["headroom_db"]), str(opts["bitrate"]))
+    return Job(spec, int(opts["sr"]), float(opts["duration"]), float(opts["fade"]), output)
+
+
+def parse_manifest(manifest: Any, base_dir: Path, output: Path | None = None) -> list[Job]:
+    """
+    Manifest (Mapping mit 'jobs', 'defaults', 'output' oder nur die Job-Liste)
+    → Aufträge ohne Duplikate, in der Reihenfolge des Manifests.
+    """
+    if isinstance(manifest, Mapping):
+        entries = manifest.get("jobs") or []
+        defaults = manifest.get("defaults") or {}
+        out_dir = output or (base_dir / manifest.get("output", ".")).resolve()
+    elif isinstance(manifest, Sequence) and not isinstance(manifest, str):
+        entries, defaults, out_dir = manifest, {}, output or base_dir
+    else:
+        raise ValueError("Manifest muss eine Job-Liste oder ein Mapping mit 'jobs' sein")
+    unknown = set(defaults) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unbekannte Vorgaben {sorted(unknown)} (erlaubt: {sorted(DEFAULTS)})")
+
+    jobs: dict[Job, None] = {}
+    by_path: dict[Path, Job] = {}
+    for i, entry in enumerate(entries):
+        try:
+            job = parse_job(entry, defaults, Path(out_dir))
+        except (ValueError, TypeError) as err:
+            raise ValueError(f"Auftrag {i + 1} ({entry!r}): {err}") from None
+        if job.output.path in by_path and by_path[job.output.path] != job:
+            raise ValueError(f"Auftrag {i + 1}: {job.output.path.name} ist schon anders belegt")
+        by_path[job.output.path] = job
+        jobs[job] = None                                # gleiche Aufträge nur einmal
+    return list(jobs)
+
+
+# ------------------------------------------------------------------
+#  Rendern
+# ------------------------------------------------------------------
+def ffmpeg_path() -> str | None:
+    """Pfad des ffmpeg-Programms (None: nicht installiert)."""
+    return shutil.which("ffmpeg")
+
+
+def encode_mp3(src: Path, dst: Path, bitrate: str = "192k") -> None:
+    """Kodiert eine WAV-Datei mit ffmpeg (libmp3lame) als MP3."""
+    tmp = dst.with_name(dst.name + ".tmp")
+    subprocess.run(
+        [ffmpeg_path() or "ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-i", str(src),
+         "-codec:a", "libmp3lame", "-b:a", bitrate, "-f", "mp3", str(tmp)],
+        check=True,
+    )
+    os.replace(tmp, dst)
+
+
+def _render_signal(jobs: Sequence[Job]) -> list[tuple[str, float]]:
+    """Rendert alle Aufträge mit demselben Float-Signal (ein Spitzenwert, eine Zeitbasis)."""
+    start = time.perf_counter()
+    first = jobs[0]
+    sr, dtype = first.sr, first.signal[-1]
+    table = first.spec.table(sr)
+    n_samples = int(sr * first.duration_s)
+    fadelen = max(int(first.fade_s * sr), 1)
+    basis = shared_block_basis(table.freqs, sr, DEFAULT_BLOCK, dtype) if len(table) else None
+
+    def blocks():
+        return iter_blocks(table, n_samples, sr, fadelen=fadelen, dtype=dtype, basis=basis)
+
+    level = normalization_peak(table, n_samples, sr, blocks, fadelen=fadelen)
+    written: dict[tuple, Path] = {}
+    done = []
+    for job in jobs:
+        out = job.output
+        out.path.parent.mkdir(parents=True, exist_ok=True)
+        if out.encoding in written:                     # gleiche Datei unter anderem Namen
+            shutil.copyfile(written[out.encoding], out.path)
+        elif out.container == "mp3":
+            wav = out.path.with_name(out.path.stem + ".render.wav")
+            try:
+                write_wav_stream(wav, sr, blocks(), peak=level, headroom_db=out.headroom_db,
+                                 sample_format=out.sample_format)
+                encode_mp3(wav, out.path, out.bitrate)
+            finally:
+                wav.unlink(missing_ok=True)
+        else:
+            write_wav_stream(out.path, sr, blocks(), peak=level, headroom_db=out.headroom_db,
+                             sample_format=out.sample_format)
+        written.setdefault(out.encoding, out.path)
+        done.append((str(out.path), time.perf_counter() - start))
+    return done
+
+
+def _render_task(groups: Sequence[Sequence[Job]]) -> list[tuple[str, float]]:
+    """Worker: mehrere Signalgruppen nacheinander (teilen den Basis-Cache des Prozesses)."""
+    return [item for jobs in groups for item in _render_signal(jobs)]
+
+
+def render_batch(
+    manifest: str | Path | Mapping[str, Any] | Sequence[Mapping[str, Any]],
+    *,
+    base_dir: str | Path | None = None,
+    output: str | Path | None = None,
+    jobs: int | None = None,
+    wav_only: bool = False,
+) -> list[Path]:
+    """
+    Erzeugt alle Dateien eines Manifests.
+
+    Parameters
+    ----------
+    manifest : str | Path | Mapping | Sequence
+        Pfad einer YAML-/JSON-Datei oder der bereits geladene Inhalt.
+    base_dir : str | Path | None
+        Bezugsordner für 'output' (Standard: Ordner der Manifest-Datei bzw.
+        das Arbeitsverzeichnis).
+    output : str | Path | None
+        Zielordner statt 'output' aus dem Manifest.
+    jobs : int | None
+        Anzahl paralleler Prozesse (None → Anzahl CPU-Kerne, 1 → ohne Pool).
+    wav_only : bool
+        WAV statt MP3 schreiben.
+
+    Rückgabe
+    --------
+    list[Path]
+        Geschriebene Dateien in der Reihenfolge des Manifests.
+
+    Raises
+    ------
+    RuntimeError
+        Das Manifest verlangt MP3, ffmpeg ist aber nicht installiert (und
+        'wav_only' nicht gesetzt). Es wird dann keine Datei geschrieben.
+    """
+    if isinstance(manifest, (str, Path)):
+        base_dir = Path(manifest).resolve().parent if base_dir is None else base_dir
+        manifest = load_manifest(manifest)
+    base_dir = Path.cwd() if base_dir is None else Path(base_dir)
+    todo = parse_manifest(manifest, base_dir, Path(output) if output else None)
+
+    if any(job.output.container == "mp3" for job in todo) and not wav_only and not ffmpeg_path():
+        raise RuntimeError("ffmpeg nicht gefunden: MP3-Dateien können nicht erzeugt werden "
+                           "(ffmpeg installieren oder mit --wav ausdrücklich WAV schreiben)")
+    if wav_only:
+        todo = [replace(job, output=replace(job.output, container="wav",
+                                            path=job.output.path.with_suffix(".wav")))
+                if job.output.container == "mp3" else job for job in todo]
+
+    # Aufträge mit gleichem Signal zusammenfassen; gleiche Abtastrate und
+    # Frequenzen nebeneinander, damit sie im selben Worker landen
+    groups: dict[tuple, list[Job]] = {}
+    for job in todo:
+        groups.setdefault(job.signal, []).append(job)
+    ordered = sorted(groups.values(), key=lambda g: (g[0].sr, g[0].spec.voices, g[0].spec.partials))
+
+    n_tasks = max(1, min(jobs or os.cpu_count() or 1, len(ordered)))
+    tasks = [ordered[len(ordered) * i // n_tasks:len(ordered) * (i + 1) // n_tasks]
+             for i in range(n_tasks)]
+    if n_tasks == 1:
+        results = [_render_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_tasks,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(_render_task, tasks))
+
+    seconds = dict(item for result in results for item in result)
+    for job in todo:
+        print(f"[erzeugt]  {job.output.path} ({seconds[str(job.output.path)]:.2f} s)")
+    return [job.output.path for job in todo]
+
+
+def _positive_int(value: str) -> int:
+    """argparse-Typ für Anzahlen ≥ 1 (z. B. -j 0 ablehnen statt still alle Kerne)."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein: {value}")
+    return number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Töne und Akkorde nach einem Manifest erzeugen.")
+    parser.add_argument("manifest", type=Path, help="YAML- oder JSON-Datei")
+    parser.add_argument("-j", "--jobs", type=_positive_int, help="parallele Prozesse (Standard: CPU-Kerne)")
+    parser.add_argument("-o", "--output", type=Path, help="Zielordner statt 'output' im Manifest")
+    parser.add_argument("--wav", action="store_true", help="WAV statt MP3 schreiben")
+    parser.add_argument("--list", action="store_true", help="nur die Aufträge anzeigen")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        todo = parse_manifest(load_manifest(args.manifest), args.manifest.resolve().parent,
+                              args.output)
+        for job in todo:
+            print(f"{job.output.path}  {job.sr} Hz, {job.duration_s} s, "
+                  f"{len(job.spec.voices)} Stimme(n) × {len(job.spec.partials)} Teilton/Teiltöne")
+        print(f"{len(todo)} Aufträge, {len({job.signal for job in todo})} verschiedene Klänge")
+        return 0
+    start = time.perf_counter()
+    try:
+        written = render_batch(args.manifest, output=args.output, jobs=args.jobs,
+                               wav_only=args.wav)
+    except RuntimeError as err:
+        print(f"[Fehler]   {err}", file=sys.stderr)
+        return 1
+    print(f"{len(written)} Dateien in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
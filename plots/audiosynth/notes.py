@@ -0,0 +1,111 @@
+"""
+Noten, Akkorde und Obertonspektren.
+
+Entspricht den Bausteinen aus ``source/dev/rezepte/audio/toene_erzeugen_code``
+(``note_to_freq``, ``parse_chord_name``, ``chord_frequencies``,
+``get_partials``), damit die Tutorial-Skripte und die Bibliothek dieselben
+Töne erzeugen.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from typing import Union
+
+NoteOrFreq = Union[str, float, int]
+
+# -- Töne ----------------------------------------------------------------------
+_NOTE_RE = re.compile(r"^([A-Ga-g])([#b]?)(-?\d+)$")
+_SEMITONES = {
+    "C": -9, "C#": -8, "Db": -8, "D": -7, "D#": -6, "Eb": -6, "E": -5,
+    "F": -4, "F#": -3, "Gb": -3, "G": -2, "G#": -1, "Ab": -1, "A": 0,
+    "A#": 1, "Bb": 1, "B": 2,
+}
+
+# -- Akkordqualität ------------------------------------------------------------
+_CHORD_RE = re.compile(r"^\s*([A-Ga-g][#b]?-?\d+)\s*[-\s_]+\s*([A-Za-zäöüÄÖÜ]+[24]?)\s*$")
+QUALITY_INTERVALS = {
+    "major":      [0, 4, 7], "dur":  [0, 4, 7], "maj":          [0, 4, 7],
+    "minor":      [0, 3, 7], "moll": [0, 3, 7], "min":          [0, 3, 7],
+    "diminished": [0, 3, 6], "dim":  [0, 3, 6], "vermindert":   [0, 3, 6],
+    "augmented":  [0, 4, 8], "aug":  [0, 4, 8], "uebermaessig": [0, 4, 8], "übermäßig": [0, 4, 8],
+    "sus2":       [0, 2, 7],
+    "sus4":       [0, 5, 7],
+}
+
+# -- Obertongewichtung ---------------------------------------------------------
+INSTRUMENT_PARTIALS = {
+    "sinus":    {1: 1.00},                                              # reiner Sinuston
+    "floete":   {1: 1.00, 2: 0.20, 3: 0.10, 4: 0.05},                   # weich, fast sinusförmig
+    "violine":  {1: 1.00, 2: 0.70, 3: 0.50, 4: 0.30, 5: 0.25, 6: 0.15}, # obertonreich, brillant
+    "klavier":  {1: 1.00, 2: 0.60, 3: 0.35, 4: 0.20, 5: 0.12, 6: 0.08}, # harmonisch, leicht gedämpft
+    "tuba":     {1: 1.00, 2: 0.10, 3: 0.50, 4: 0.05, 5: 0.25},          # tief, weich, ungerade betont
+}
+
+
+def note_to_freq(note: str, A4: float = 440.0) -> float:
+    """Gleichstufige Stimmung. Notation: A4, C#5, Db3, …"""
+    m = _NOTE_RE.match(note)
+    if not m:
+        raise ValueError(f"Ungültiger Notenname: {note!r} (erwartet z.B. 'A4', 'C#5', 'Db3')")
+    key = m.group(1).upper() + m.group(2)       # z. B. "C#", "Bb", "A"
+    if key not in _SEMITONES:
+        raise ValueError(f"Unbekannter Ton {key!r} in {note!r}")
+    n = _SEMITONES[key] + 12 * (int(m.group(3)) - 4)   # Halbtöne relativ zu A4
+    return A4 * (2.0 ** (n / 12.0))
+
+
+def to_freq(note_or_freq: NoteOrFreq, A4: float = 440.0) -> float:
+    """Nimmt 'A4' oder 440.0 und gibt Hz zurück."""
+    if isinstance(note_or_freq, (int, float)):
+        return float(note_or_freq)
+    return note_to_freq(str(note_or_freq), A4=A4)
+
+
+def to_freqs(notes_or_freqs: Sequence[NoteOrFreq], A4: float = 440.0) -> list[float]:
+    """Wie :func:`to_freq` für mehrere Stimmen."""
+    return [to_freq(nf, A4=A4) for nf in notes_or_freqs]
+
+
+def parse_chord_name(chord: str) -> tuple[str, str]:
+    """Grundton und (normalisierte) Akkordqualität, z. B. 'D4-Major' → ('D4', 'major')."""
+    m = _CHORD_RE.match(chord)
+    if not m:
+        raise ValueError(f"Ungültiges Akkordformat: {chord!r} (erwartet z.B. 'D4-Major' oder 'A3-dur')")
+    quality = (m.group(2).lower()
+               .replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss"))
+    return m.group(1), quality
+
+
+def chord_frequencies(root_note: str, quality: str, A4: float = 440.0) -> list[float]:
+    """Frequenzen aller Töne eines Akkords."""
+    if quality not in QUALITY_INTERVALS:
+        raise ValueError(f"Unbekannte Qualität {quality!r}. Erlaubt: {sorted(set(QUALITY_INTERVALS))}")
+    f0 = note_to_freq(root_note, A4=A4)
+    return [f0 * (2.0 ** (k / 12.0)) for k in QUALITY_INTERVALS[quality]]
+
+
+def normalize_partials(partials: Mapping[int, float], mode: str = "sum") -> dict[int, float]:
+    """
+    Normiert Teiltongewichte.
+
+    mode='sum' → Summe a_k = 1, mode='max' → max a_k = 1.
+    """
+    if not partials:
+        return {1: 1.0}
+    vals = list(partials.values())
+    div = (sum(vals) if mode == "sum" else max(vals)) or 1.0
+    return {k: a / div for k, a in partials.items()}
+
+
+def get_partials(preset_or_dict: str | Mapping[int, float], *, norm: str = "sum") -> dict[int, float]:
+    """Preset-Name (str) oder eigenes Dict → normierte Teiltongewichte."""
+    if isinstance(preset_or_dict, str):
+        key = preset_or_dict.lower()
+        if key not in INSTRUMENT_PARTIALS:
+            known = ", ".join(sorted(INSTRUMENT_PARTIALS))
+            raise ValueError(f"Unbekanntes Preset: {preset_or_dict!r} (bekannt: {known})")
+        base = INSTRUMENT_PARTIALS[key]
+    else:
+        base = dict(preset_or_dict)
+    return normalize_partials(base, mode=norm)
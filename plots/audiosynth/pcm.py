@@ -0,0 +1,191 @@
+"""
+Wandlung von Float-Signalen in PCM-Samples.
+
+Normiert wird in zwei Schritten: zuerst den Spitzenwert bestimmen (aus den
+Teiltonamplituden, siehe :func:`audiosynth.synth.analytic_peak`, oder in
+einem Durchgang über die Blöcke), dann blockweise skalieren und quantisieren.
+:func:`quantize` arbeitet dabei in einem wiederverwendeten Arbeitspuffer – es
+entstehen keine Zwischenarrays in Signallänge.
+
+Ausgabeformate (:data:`SAMPLE_FORMATS`): ``int16`` (Standard), ``int24``,
+``int32`` und ``float32``. Bei ``float32`` wird auch die Synthese in float32
+gerechnet (halbe Speicherbandbreite); die Ganzzahlformate rechnen in float64.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+INT16_FULL_SCALE = 32767.0
+QUANTIZE_BLOCK = 65536              # Samples je Block in to_pcm
+
+
+@dataclass(frozen=True)
+class SampleFormat:
+    """Speicherformat eines Samples in der WAV-Datei."""
+
+    name: str
+    bits: int               # Bits je Sample in der Datei
+    dtype: np.dtype         # dtype im Speicher (int24: int32 mit Werten im 24-bit-Bereich)
+    full_scale: float       # Vollaussteuerung (Ganzzahl: 2^(bits-1) - 1, float: 1.0)
+    compute: type           # Rechengenauigkeit der Synthese
+
+    @property
+    def is_float(self) -> bool:
+        return self.dtype.kind == "f"
+
+
+SAMPLE_FORMATS = {
+    "int16":   SampleFormat("int16", 16, np.dtype("<i2"), 32767.0, np.float64),
+    "int24":   SampleFormat("int24", 24, np.dtype("<i4"), 8388607.0, np.float64),
+    "int32":   SampleFormat("int32", 32, np.dtype("<i4"), 2147483647.0, np.float64),
+    "float32": SampleFormat("float32", 32, np.dtype("<f4"), 1.0, np.float32),
+}
+
+
+def get_sample_format(sample_format: str | SampleFormat) -> SampleFormat:
+    """Name ('int16', 'int24', 'int32', 'float32') oder SampleFormat → SampleFormat."""
+    if isinstance(sample_format, SampleFormat):
+        return sample_format
+    try:
+        return SAMPLE_FORMATS[sample_format]
+    except KeyError:
+        known = ", ".join(SAMPLE_FORMATS)
+        raise ValueError(f"Unbekanntes Sampleformat: {sample_format!r} (bekannt: {known})") from None
+
+
+def pcm_scale(peak: float, headroom_db: float = 0.0, full_scale: float = INT16_FULL_SCALE) -> float:
+    """Faktor, der 'peak' auf Vollaussteuerung minus 'headroom_db' bringt (Stille: 0)."""
+    if peak < 1e-12:
+        return 0.0
+    return (full_scale * 10 ** (headroom_db / 20.0)) / peak
+
+
+def array_peak(x: np.ndarray) -> float:
+    """Größter Betrag von x, ohne ``np.abs(x)`` in voller Länge anzulegen."""
+    if not x.size:
+        return 0.0
+    return float(max(np.max(x), -np.min(x)))
+
+
+def tpdf_dither(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Dreieckverteiltes Rauschen (TPDF) mit ±1 LSB Spitze, Länge n."""
+    return rng.random(n) - rng.random(n)
+
+
+def quantize(
+    x: np.ndarray,
+    scale: float,
+    sample_format: str | SampleFormat = "int16",
+    *,
+    out: np.ndarray | None = None,
+    work: np.ndarray | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Skaliert einen Block und wandelt ihn ins Sampleformat.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Float-Block (wird nicht verändert).
+    scale : float
+        Faktor aus :func:`pcm_scale` (mit ``full_scale`` des Formats).
+    sample_format : str | SampleFormat
+        Zielformat. Ganzzahlformate werden auf ihren Bereich begrenzt.
+    out : np.ndarray | None
+        Zielpuffer im dtype des Formats mit mindestens x.size Elementen
+        (None: neu anlegen).
+    work : np.ndarray | None
+        float64-Arbeitspuffer mit mindestens x.size Elementen (None: neu
+        anlegen; bei float32 nicht benötigt). Für viele Blöcke einmal anlegen
+        und wiederverwenden.
+    rng : np.random.Generator | None
+        Mit Generator: TPDF-Dither addieren und auf die nächste Stufe runden.
+        Ohne: Nachkommastellen abschneiden (wie ``astype``). Nur für
+        Ganzzahlformate.
+
+    Rückgabe
+    --------
+    np.ndarray
+        Die ersten x.size Elemente von 'out'.
+    """
+    fmt = get_sample_format(sample_format)
+    n = x.size
+    out = np.empty(n, dtype=fmt.dtype) if out is None else out[:n]
+    if fmt.is_float:
+        np.multiply(x, scale, out=out)
+        return out
+    work = np.empty(n, dtype=np.float64) if work is None else work[:n]
+    np.multiply(x, np.float64(scale), out=work)
+    if rng is not None:
+        work += tpdf_dither(n, rng)
+        np.rint(work, out=work)
+    np.clip(work, -fmt.full_scale - 1, fmt.full_scale, out=work)
+    np.copyto(out, work, casting="unsafe")
+    return out
+
+
+def quantize_int16(
+    x: np.ndarray,
+    scale: float,
+    *,
+    out: np.ndarray | None = None,
+    work: np.ndarray | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """:func:`quantize` für int16."""
+    return quantize(x, scale, "int16", out=out, work=work, rng=rng)
+
+
+def to_pcm(
+    x: np.ndarray,
+    sample_format: str | SampleFormat = "int16",
+    headroom_db: float = 0.0,
+    *,
+    peak: float | None = None,
+    dither: bool = False,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Skaliert das Float-Signal x ohne Clipping ins Sampleformat (Spitzenwert = Vollaussteuerung).
+
+    headroom_db < 0 lässt Headroom (z. B. -1.0 dB). 'peak' ersetzt die Suche
+    nach dem Spitzenwert (z. B. aus den Teiltonamplituden); 'dither' addiert
+    TPDF-Dither (reproduzierbar über 'seed'). Gerechnet wird blockweise, neben
+    dem Ergebnis wird nur ein Block als Zwischenspeicher angelegt.
+    """
+    fmt = get_sample_format(sample_format)
+    x = np.asarray(x)
+    if x.dtype.kind != "f":
+        x = x.astype(np.float64)
+    scale = pcm_scale(array_peak(x) if peak is None else peak, headroom_db, fmt.full_scale)
+    if scale == 0.0:                                    # Stille → direkt Nullen
+        return np.zeros_like(x, dtype=fmt.dtype)
+    out = np.empty_like(x, dtype=fmt.dtype)
+    flat_x, flat_out = x.reshape(-1), out.reshape(-1)
+    work = None if fmt.is_float else np.empty(min(QUANTIZE_BLOCK, flat_x.size), dtype=np.float64)
+    rng = np.random.default_rng(seed) if dither and not fmt.is_float else None
+    for i in range(0, flat_x.size, QUANTIZE_BLOCK):
+        block = flat_x[i:i + QUANTIZE_BLOCK]
+        quantize(block, scale, fmt, out=flat_out[i:i + block.size], work=work, rng=rng)
+    return out
+
+
+def to_int16(
+    x: np.ndarray,
+    headroom_db: float = 0.0,
+    *,
+    peak: float | None = None,
+    dither: bool = False,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Skaliert das Float-Signal x ohne Clipping auf int16 (Spitzenwert = Vollaussteuerung).
+
+    :func:`to_pcm` mit ``sample_format="int16"``; float32-Eingaben werden
+    in float64 skaliert.
+    """
+    return to_pcm(np.asarray(x, dtype=np.float64), "int16", headroom_db,
+                  peak=peak, dither=dither, seed=seed)
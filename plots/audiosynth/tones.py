@@ -0,0 +1,298 @@
+"""
+Töne und Akkorde (mit Obertönen) als WAV-Dateien.
+
+Gleiche Funktionen und Parameter wie in den Tutorial-Skripten
+``toene_erzeugen_code/05_obertoene.py`` und ``06_obertoene_akkorde.py``;
+die Synthese läuft aber über :mod:`audiosynth.synth` (ein Matrixprodukt
+für alle Stimmen × Teiltöne statt einer Schleife mit ``np.sin`` je Teilton).
+
+Die WAV-Dateien werden stückweise erzeugt und geschrieben
+(:mod:`audiosynth.wavstream`): der Spitzenwert für die Normierung folgt aus
+den Amplituden, wenn er dadurch feststeht (einzelner Sinus), sonst aus einem
+ersten Durchgang; der zweite quantisiert und schreibt. Der Speicherbedarf
+ist unabhängig von der Dauer.
+
+Alle ``make_*``-Funktionen schreiben standardmäßig 16-bit PCM; mit
+``sample_format`` auch ``"int24"``, ``"int32"`` oder ``"float32"`` (bei
+float32 läuft auch die Synthese in float32).
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from .notes import (NoteOrFreq, chord_frequencies, get_partials, parse_chord_name,
+                    to_freq, to_freqs)
+from .pcm import SampleFormat, get_sample_format
+from .synth import (NYQUIST_GUARD, PartialTable, analytic_peak, apply_fade, iter_blocks,
+                    partial_table, peak_bound, synthesize)
+from .wavstream import stream_peak, write_wav_stream
+
+Partials = Union[str, Mapping[int, float]]
+
+
+@dataclass(frozen=True)
+class ToneSpec:
+    """
+    Stimmen, Teiltöne und Pegel eines Klangs (alles außer Dauer und Abtastrate).
+
+    Hashbar, damit gleiche Klänge erkannt werden (:mod:`audiosynth.batch`).
+    """
+
+    voices: tuple[float, ...]
+    partials: tuple[tuple[int, float], ...]
+    gains: float
+    nyquist_guard: float | None = None
+
+    def table(self, sr: int) -> PartialTable:
+        """Sinusanteile bei Abtastrate sr."""
+        return partial_table(self.voices, dict(self.partials), self.gains, sr=sr,
+                             nyquist_guard=self.nyquist_guard)
+
+
+def tone_spec(
+    note_or_freq: NoteOrFreq,
+    amp: float,
+    partials: Partials | None = None,
+    *,
+    A4: float = 440.0,
+    norm_mode: str = "sum",
+) -> ToneSpec:
+    """Einzelton: reiner Sinus (partials=None, wie make_tone_wav) oder mit Obertönen."""
+    p = {1: 1.0} if partials is None else get_partials(partials, norm=norm_mode)
+    return ToneSpec((to_freq(note_or_freq, A4=A4),), tuple(p.items()), amp)
+
+
+def chord_spec(
+    notes_or_freqs: Sequence[NoteOrFreq],
+    amp: float,
+    partials: Partials | None = None,
+    *,
+    A4: float = 440.0,
+    norm_mode: str = "sum",
+) -> ToneSpec:
+    """
+    Akkord: Sinustöne mit Pegel amp / Anzahl Stimmen (partials=None, wie
+    make_chord_wav) oder jede Stimme mit demselben Obertonspektrum, Pegel
+    zusätzlich durch Σ a_k geteilt und Teiltöne ab 0,45 · sr weggelassen.
+    """
+    freqs = tuple(to_freqs(notes_or_freqs, A4=A4))
+    if partials is None:
+        return ToneSpec(freqs, ((1, 1.0),), amp / max(len(freqs), 1))
+    p = get_partials(partials, norm=norm_mode)
+    per_voice = amp / max(len(freqs), 1) / (sum(p.values()) or 1.0)
+    return ToneSpec(freqs, tuple(p.items()), per_voice, NYQUIST_GUARD)
+
+
+def render_partials(
+    voices: Sequence[float],
+    partials: Mapping[int, float],
+    gains: float | Sequence[float],
+    duration_s: float,
+    sr: int,
+    *,
+    fade_s: float = 0.01,
+    nyquist_guard: float | None = None,
+    dtype=np.float64,
+) -> np.ndarray:
+    """Float-Signal (ganz im Speicher) aller Stimmen × Teiltöne inklusive Fades."""
+    table = partial_table(voices, partials, gains, sr=sr, nyquist_guard=nyquist_guard)
+    x = synthesize(table, int(sr * duration_s), sr, dtype=dtype)
+    return apply_fade(x, int(fade_s * sr))
+
+
+def write_partials_wav(
+    filename: str,
+    voices: Sequence[float],
+    partials: Mapping[int, float],
+    gains: float | Sequence[float],
+    duration_s: float,
+    sr: int,
+    *,
+    fade_s: float = 0.01,
+    nyquist_guard: float | None = None,
+    headroom_db: float = 0.0,
+    peak: str = "auto",
+    dither: bool = False,
+    sample_format: str | SampleFormat = "int16",
+) -> None:
+    """
+    Wie :func:`render_partials`, aber stückweise als normierte WAV-Datei.
+
+    'peak' legt fest, worauf normiert wird: "scan" misst den Spitzenwert in
+    einem ersten Durchgang, "bound" nimmt die Schranke Σ|a| (ein Durchgang,
+    etwas leiser), "auto" rechnet ihn aus den Amplituden aus, wo er dadurch
+    exakt feststeht, und misst sonst. 'dither' addiert TPDF-Dither.
+    'sample_format' wählt das Ausgabeformat und damit die Rechengenauigkeit
+    (:data:`audiosynth.pcm.SAMPLE_FORMATS`).
+    """
+    fmt = get_sample_format(sample_format)
+    table = partial_table(voices, partials, gains, sr=sr, nyquist_guard=nyquist_guard)
+    n_samples = int(sr * duration_s)
+    fadelen = max(int(fade_s * sr), 1)
+
+    def blocks():
+        return iter_blocks(table, n_samples, sr, fadelen=fadelen, dtype=fmt.compute)
+
+    level = normalization_peak(table, n_samples, sr, blocks, fadelen=fadelen, mode=peak)
+    write_wav_stream(filename, sr, blocks(), peak=level, headroom_db=headroom_db, dither=dither,
+                     sample_format=fmt)
+
+
+def write_spec_wav(filename: str, spec: ToneSpec, duration_s: float, sr: int, **kwargs) -> None:
+    """:func:`write_partials_wav` für einen :class:`ToneSpec` (kwargs wie dort)."""
+    write_partials_wav(filename, spec.voices, dict(spec.partials), spec.gains, duration_s, sr,
+                       nyquist_guard=spec.nyquist_guard, **kwargs)
+
+
+def normalization_peak(
+    table: PartialTable,
+    n_samples: int,
+    sr: int,
+    blocks: Callable[[], Iterator[np.ndarray]],
+    *,
+    fadelen: int = 0,
+    mode: str = "auto",
+) -> float:
+    """
+    Spitzenwert für die Normierung ('mode' wie 'peak' in :func:`write_partials_wav`).
+
+    'blocks' liefert bei jedem Aufruf einen neuen Durchgang über das Signal
+    und wird nur aufgerufen, wenn gemessen werden muss.
+    """
+    if mode == "bound":
+        return peak_bound(table)
+    if mode == "auto":
+        level = analytic_peak(table, n_samples, sr, fadelen=fadelen)
+        if level is not None:
+            return level
+    elif mode != "scan":
+        raise ValueError(f"Unbekannter peak-Modus: {mode!r} (erlaubt: 'auto', 'scan', 'bound')")
+    return stream_peak(blocks())
+
+
+# -- Einzeltöne -----------------------------------------------------------------
+def make_tone_wav(
+    note_or_freq: NoteOrFreq,
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    A4: float = 440.0,
+    sample_format: str = "int16",
+) -> None:
+    """Erzeugt einen Sinuston und speichert ihn als WAV (Standard: 16-bit PCM)."""
+    write_spec_wav(filename, tone_spec(note_or_freq, amp, A4=A4), duration_s, sr,
+                   sample_format=sample_format)
+
+
+def make_tone_with_partials(
+    note_or_freq: NoteOrFreq,
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    partials: Partials = "sinus",
+    A4: float = 440.0,
+    fade_s: float = 0.01,
+    norm_mode: str = "sum",
+    sample_format: str = "int16",
+) -> None:
+    """Erzeugt einen Ton mit harmonischen Obertönen und speichert ihn als WAV (Standard: 16 bit)."""
+    spec = tone_spec(note_or_freq, amp, partials, A4=A4, norm_mode=norm_mode)
+    write_spec_wav(filename, spec, duration_s, sr, fade_s=fade_s, sample_format=sample_format)
+
+
+def make_instrument_tone_wav(
+    instrument: str,
+    note_or_freq: NoteOrFreq,
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    A4: float = 440.0,
+    fade_s: float = 0.01,
+    norm_mode: str = "sum",
+    sample_format: str = "int16",
+) -> None:
+    """Komfort: direkt per Instrument-Preset speichern (wie make_tone_with_partials)."""
+    make_tone_with_partials(note_or_freq, duration_s, sr, amp, filename, partials=instrument,
+                            A4=A4, fade_s=fade_s, norm_mode=norm_mode, sample_format=sample_format)
+
+
+# -- Akkorde --------------------------------------------------------------------
+def make_chord_wav(
+    notes_or_freqs: Sequence[NoteOrFreq],
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    A4: float = 440.0,
+    headroom_db: float = 0.0,
+    sample_format: str = "int16",
+) -> None:
+    """Speichert einen mehrstimmigen Akkord (Sinustöne) als WAV (Standard: 16 bit)."""
+    write_spec_wav(filename, chord_spec(notes_or_freqs, amp, A4=A4), duration_s, sr,
+                   headroom_db=headroom_db, sample_format=sample_format)
+
+
+def make_named_chord_wav(
+    chord_name: str,
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    A4: float = 440.0,
+    headroom_db: float = 0.0,
+    sample_format: str = "int16",
+) -> None:
+    """Erzeugt direkt aus einem Akkordnamen (z. B. 'C4-Dur') eine WAV-Datei."""
+    root, qual = parse_chord_name(chord_name)
+    make_chord_wav(chord_frequencies(root, qual, A4=A4), duration_s, sr, amp, filename,
+                   A4=A4, headroom_db=headroom_db, sample_format=sample_format)
+
+
+def make_chord_with_partials(
+    notes_or_freqs: Sequence[NoteOrFreq],
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    partials: Partials = "violine",
+    A4: float = 440.0,
+    fade_s: float = 0.01,
+    norm_mode: str = "sum",
+    headroom_db: float = 0.0,
+    sample_format: str = "int16",
+) -> None:
+    """
+    Mehrstimmiger Akkord, jede Stimme mit demselben Obertonspektrum
+    (Preset oder Dict). Pegel je Stimme = amp / Anzahl Stimmen; Teiltöne ab
+    0,45 · sr werden weggelassen.
+    """
+    spec = chord_spec(notes_or_freqs, amp, partials, A4=A4, norm_mode=norm_mode)
+    write_spec_wav(filename, spec, duration_s, sr, fade_s=fade_s, headroom_db=headroom_db,
+                   sample_format=sample_format)
+
+
+def make_named_chord_with_partials(
+    chord_name: str,
+    duration_s: float,
+    sr: int,
+    amp: float,
+    filename: str,
+    partials: Partials = "violine",
+    A4: float = 440.0,
+    fade_s: float = 0.01,
+    norm_mode: str = "sum",
+    headroom_db: float = 0.0,
+    sample_format: str = "int16",
+) -> None:
+    """Komfort: z. B. 'D4-Major' → Oberton-Akkord als WAV."""
+    root, qual = parse_chord_name(chord_name)
+    make_chord_with_partials(chord_frequencies(root, qual, A4=A4), duration_s, sr, amp, filename,
+                             partials=partials, A4=A4, fade_s=fade_s, norm_mode=norm_mode,
+                             headroom_db=headroom_db, sample_format=sample_format)
@@ -0,0 +1,182 @@
+"""
+WAV-Dateien stückweise schreiben.
+
+``scipy.io.wavfile.write`` braucht das ganze Signal als Array. :class:`WavWriter`
+schreibt dagegen zuerst einen Header mit Platzhalter-Längen, hängt beliebig
+viele Sample-Blöcke an und trägt die Längen (RIFF- und data-Chunk) beim
+Schließen bzw. bei :meth:`WavWriter.flush` nach. Zusammen mit
+:func:`audiosynth.synth.iter_blocks` bleibt der Speicherbedarf unabhängig
+von der Dauer.
+
+Formate (siehe :data:`audiosynth.pcm.SAMPLE_FORMATS`): ``int16`` als
+klassisches PCM (wie ``scipy.io.wavfile``), ``int24``/``int32`` als
+WAVE_FORMAT_EXTENSIBLE (vorgeschrieben für mehr als 16 Bit) und ``float32``
+als IEEE-Float (Formatcode 3, mit ``fact``-Chunk).
+
+Geschrieben wird in ``<name>.tmp`` und erst nach erfolgreichem Abschluss per
+``os.replace`` umbenannt – eine abgebrochene Ausgabe hinterlässt keine
+halbe WAV-Datei.
+"""
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from .pcm import SampleFormat, array_peak, get_sample_format, pcm_scale, quantize
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_SUBTYPE_PCM = bytes.fromhex("0100000000001000800000aa00389b71")   # KSDATAFORMAT_SUBTYPE_PCM
+_CHANNEL_MASKS = {1: 0x4, 2: 0x3}                                   # Mitte bzw. links/rechts
+
+
+class WavWriter:
+    """
+    Schreibt Samples blockweise in eine WAV-Datei (Kontextmanager).
+
+        with WavWriter("ton.wav", 44100) as wav:
+            for block in blocks:
+                wav.write(block)          # int16-Array
+
+    Mit 'sample_format' erwartet :meth:`write` den dtype des Formats
+    (``SampleFormat.dtype``; bei int24 int32-Werte im 24-bit-Bereich, die
+    beim Schreiben auf 3 Bytes gepackt werden).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        sr: int,
+        channels: int = 1,
+        sample_format: str | SampleFormat = "int16",
+    ) -> None:
+        self.path = Path(path)
+        self.sr = int(sr)
+        self.channels = int(channels)
+        self.format = get_sample_format(sample_format)
+        self.dtype = self.format.dtype
+        self.frames = 0
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp, "wb")
+        self._file.write(self._header())
+
+    @property
+    def data_bytes(self) -> int:
+        """Bisher geschriebene Sampledaten in Bytes (ohne Füllbyte)."""
+        return self.frames * self.channels * self.format.bits // 8
+
+    def _fmt_chunk(self) -> bytes:
+        """Inhalt des fmt-Chunks für Format, Kanäle und Abtastrate."""
+        bits = self.format.bits
+        align = self.channels * bits // 8
+        common = (self.channels, self.sr, self.sr * align, align, bits)
+        if self.format.is_float:
+            return struct.pack("<HHIIHHH", _WAVE_FORMAT_IEEE_FLOAT, *common, 0)
+        if bits == 16:
+            return struct.pack("<HHIIHH", _WAVE_FORMAT_PCM, *common)
+        return struct.pack("<HHIIHHHHI16s", _WAVE_FORMAT_EXTENSIBLE, *common, 22, bits,
+                           _CHANNEL_MASKS.get(self.channels, 0), _SUBTYPE_PCM)
+
+    def _header(self) -> bytes:
+        """Header (RIFF, fmt, ggf. fact, data) für den aktuellen Stand."""
+        fmt = self._fmt_chunk()
+        chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        if self.format.is_float:                    # Pflicht für Nicht-PCM-Formate
+            chunks += b"fact" + struct.pack("<II", 4, self.frames)
+        data_bytes = self.data_bytes
+        return (
+            b"RIFF" + struct.pack("<I", 4 + len(chunks) + 8 + data_bytes + (data_bytes & 1))
+            + b"WAVE" + chunks + b"data" + struct.pack("<I", data_bytes)
+        )
+
+    def write(self, samples: np.ndarray) -> None:
+        """Hängt Samples an (Form (n,) oder (n, channels), dtype des Formats)."""
+        samples = np.asarray(samples)
+        if samples.dtype != self.dtype:
+            raise TypeError(f"Erwartet {self.dtype}, nicht {samples.dtype}")
+        if samples.ndim != (1 if self.channels == 1 else 2) or (
+                samples.ndim == 2 and samples.shape[1] != self.channels):
+            raise ValueError(f"Form {samples.shape} passt nicht zu {self.channels} Kanal/Kanälen")
+        frames = samples.shape[0]
+        samples = np.ascontiguousarray(samples)
+        if self.format.bits == 24:                  # int32 → die unteren 3 Bytes (little endian)
+            samples = np.ascontiguousarray(samples.view(np.uint8).reshape(-1, 4)[:, :3])
+        self._file.write(samples.data)
+        self.frames += frames
+
+    def flush(self) -> None:
+        """Trägt die aktuellen Längen in den Header ein (Datei ist danach lesbar)."""
+        end = self._file.tell()
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.seek(end)
+        self._file.flush()
+
+    def close(self) -> Path:
+        """Header abschließen, Füllbyte anhängen, Datei an ihren Platz verschieben."""
+        if self._file.closed:
+            return self.path
+        if self.data_bytes & 1:
+            self._file.write(b"\0")         # Chunks sind auf gerade Länge aufgefüllt
+        self.flush()
+        self._file.close()
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Verwirft die angefangene Datei."""
+        if not self._file.closed:
+            self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> WavWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def stream_peak(blocks: Iterable[np.ndarray]) -> float:
+    """Größter Betrag über alle Blöcke (erster Durchgang vor dem Schreiben)."""
+    return max((array_peak(block) for block in blocks), default=0.0)
+
+
+def write_wav_stream(
+    filename: str | Path,
+    sr: int,
+    blocks: Iterable[np.ndarray],
+    *,
+    peak: float,
+    headroom_db: float = 0.0,
+    dither: bool = False,
+    seed: int | None = None,
+    sample_format: str | SampleFormat = "int16",
+) -> Path:
+    """
+    Wandelt Float-Blöcke ins Sampleformat und schreibt sie nacheinander.
+
+    Skalierung wie :func:`audiosynth.pcm.to_pcm`: 'peak' (gemessen mit
+    :func:`stream_peak` oder aus den Amplituden) wird auf Vollaussteuerung
+    minus 'headroom_db' gesetzt. Arbeits- und Ausgabepuffer werden über alle
+    Blöcke wiederverwendet; 'dither' addiert TPDF-Dither (nur Ganzzahlformate).
+    """
+    fmt = get_sample_format(sample_format)
+    scale = pcm_scale(peak, headroom_db, fmt.full_scale)
+    rng = np.random.default_rng(seed) if dither and not fmt.is_float else None
+    work = np.empty(0, dtype=np.float64)
+    out = np.empty(0, dtype=fmt.dtype)
+    with WavWriter(filename, sr, sample_format=fmt) as wav:
+        for block in blocks:
+            if block.size > out.size:
+                out = np.empty(block.size, dtype=fmt.dtype)
+                work = np.empty(0 if fmt.is_float else block.size, dtype=np.float64)
+            wav.write(quantize(block.reshape(-1), scale, fmt, out=out, work=work, rng=rng))
+    return wav.path
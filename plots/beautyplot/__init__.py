@@ -0,0 +1,56 @@
+"""
+beautyplot – Hilfsmittel für einheitlich gestaltete Matplotlib-Abbildungen.
+
+Die Inhalte werden erst beim ersten Zugriff geladen (PEP 562):
+
+    from beautyplot import PlotStyle   # lädt nur beautyplot.style (ohne matplotlib)
+    ps = PlotStyle()
+    ps.colors["blue"]                  # kein matplotlib-/numpy-Import
+    ps.style_axes(fig, ax)             # lädt erst jetzt matplotlib.ticker & Co.
+
+pyplot wird von beautyplot nie importiert; das Backend wählt allein das
+Plot-Skript (über ``import matplotlib.pyplot``).
+
+Module:
+    style        PlotStyle
+    ticker       DecimalCommaFormatter (matplotlib.ticker, numpy)
+    extent       Datenausdehnung von Achsen mit Cache (matplotlib, numpy)
+    decimate     Min/Max-Ausdünnung von Linien (matplotlib, numpy)
+    export       Export-Profile, Mehrfach-Export (matplotlib)
+    pngopt       verlustfreie PNG-Optimierung, feste Metadaten (Pillow)
+    plotly_html  Plotly-HTML mit gemeinsamem plotly.js/MathJax aus _static/js (plotly)
+    files        atomares Schreiben (nur Standardbibliothek)
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .export import EXPORT_PROFILES, ExportProfile
+    from .plotly_html import write_plotly_html
+    from .style import PlotStyle
+    from .ticker import DecimalCommaFormatter
+
+# öffentlicher Name -> Untermodul
+_LAZY = {
+    "PlotStyle": "style",
+    "DecimalCommaFormatter": "ticker",
+    "ExportProfile": "export",
+    "EXPORT_PROFILES": "export",
+    "write_plotly_html": "plotly_html",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value  # nächster Zugriff ohne __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
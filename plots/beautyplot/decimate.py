@@ -0,0 +1,105 @@
+"""
+Ausdünnen überabgetasteter Linien (Min/Max pro Pixelspalte).
+
+Pro Bin (Bruchteil einer Pixelspalte beim Export) bleiben der erste, der
+letzte, der kleinste und der größte Punkt erhalten („M4“-Verfahren). Damit
+zeichnet der Rasterizer dieselben Pixel wie mit allen Daten, braucht aber
+nur noch O(Breite in Pixeln) statt O(Anzahl Punkte) Liniensegmente.
+"""
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+
+
+def minmax_indices(px: np.ndarray, y: np.ndarray, bins_per_unit: float = 1.0) -> np.ndarray:
+    """
+    Indizes der zu behaltenden Punkte (erster, letzter, Min, Max pro Bin).
+
+    Parameters
+    ----------
+    px : np.ndarray
+        Monoton steigende x-Position in Pixeln.
+    y : np.ndarray
+        Werte (NaN = Lücke in der Linie; pro Lücke bleibt ein NaN erhalten).
+    bins_per_unit : float
+        Anzahl Bins pro Pixel.
+
+    Rückgabe
+    --------
+    np.ndarray
+        Sortierte Indizes in px/y.
+    """
+    n = len(y)
+    bins = np.floor(px * bins_per_unit).astype(np.int64)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bins)) + 1))
+    ends = np.append(starts[1:], n) - 1
+    seg = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+
+    # NaN ignorieren (fmin/fmax), NaN-Punkte selbst separat behalten
+    lo = np.fmin.reduceat(y, starts)[seg]
+    hi = np.fmax.reduceat(y, starts)[seg]
+    idx_min = np.flatnonzero(y == lo)
+    idx_max = np.flatnonzero(y == hi)
+    # pro Bin nur den ersten Treffer (bei Plateaus sonst viele Punkte)
+    idx_min = idx_min[np.unique(seg[idx_min], return_index=True)[1]]
+    idx_max = idx_max[np.unique(seg[idx_max], return_index=True)[1]]
+
+    # je Lücke (Folge von NaN) genügt ein NaN, um die Linie zu unterbrechen
+    nan = np.isnan(y)
+    idx_gap = np.flatnonzero(nan & ~np.concatenate(([False], nan[:-1])))
+
+    keep = np.concatenate((starts, ends, idx_min, idx_max, idx_gap))
+    return np.unique(keep)
+
+
+def decimate_line(line: Line2D, ax: Axes, *, dpi: float, max_points_per_pixel: float) -> tuple[int, int]:
+    """
+    Dünnt eine Linie in-place aus; liefert (Punkte vorher, Punkte nachher).
+
+    Übersprungen werden Linien mit Markern (jeder Datenpunkt ist sichtbar)
+    oder Treppen-Zeichenstil, mit nicht monotonen x-Werten (z. B. Kreise,
+    Parameterkurven) und Linien, die ohnehin wenige Punkte haben.
+    """
+    xy = line.get_xydata()
+    n = len(xy)
+    if line.get_marker() not in (None, "None", "none", "", " ") or line.get_drawstyle() != "default":
+        return n, n
+
+    # Breite der Achse beim Export in Pixeln
+    width_px = ax.get_position().width * ax.figure.get_figwidth() * dpi
+    if n <= max(4, width_px * max_points_per_pixel):
+        return n, n
+
+    # x → Pixelspalte beim Export (Display-Koordinaten, berücksichtigt
+    # log-Skalen und Nicht-Daten-Transformationen)
+    # (NaN in y würde sich über die affine Matrix auf x übertragen → ersetzen)
+    y = xy[:, 1].astype(float)
+    probe = np.column_stack((xy[:, 0], np.where(np.isfinite(y), y, 1.0)))
+    col = line.get_transform().transform(probe)[:, 0] * (dpi / ax.figure.dpi)
+    if not np.all(np.isfinite(col)):
+        return n, n
+    step = np.diff(col)
+    if np.all(step <= 0):
+        col = -col  # invertierte x-Achse
+    elif not np.all(step >= 0):
+        return n, n  # nicht monoton (Kreise, Parameterkurven, ...)
+
+    # bis zu 4 Punkte (erster, letzter, Min, Max) pro Bin
+    keep = minmax_indices(col, y, max_points_per_pixel / 4)
+
+    xdata = np.asarray(line.get_xdata(orig=True))
+    ydata = np.asarray(line.get_ydata(orig=True))
+    line.set_data(xdata[keep], ydata[keep])
+    return n, len(keep)
+
+
+def decimate_axes(ax: Axes, *, dpi: float, max_points_per_pixel: float) -> tuple[int, int]:
+    """Dünnt alle Linien einer Achse aus; liefert (Punkte vorher, Punkte nachher)."""
+    before = after = 0
+    for line in ax.get_lines():
+        b, a = decimate_line(line, ax, dpi=dpi, max_points_per_pixel=max_points_per_pixel)
+        before += b
+        after += a
+    return before, after
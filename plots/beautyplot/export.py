@@ -0,0 +1,313 @@
+"""
+Export von Abbildungen: Profile (PNG, SVG mit Rasterebenen, PDF) und
+Mehrfach-Export in mehrere Formate/Auflösungen.
+
+Ein Profil bündelt Format, Auflösung und die Regel, welche Artists beim
+Vektor-Export als Bild eingebettet werden. Dichte Datenebenen (lange
+Linien, große Scatter, Flächen mit vielen Eckpunkten) werden gerastert,
+Text, Achsen, Ticks und Gitter bleiben Vektoren. So bleibt die Schrift
+scharf, die Datei aber klein.
+
+``export`` zeichnet die Figure pro Auflösung nur einmal (Agg) und kodiert
+daraus alle Rasterformate parallel in einem Thread-Pool. Alle Dateien
+werden atomar geschrieben (erst ``*.tmp``, dann umbenennen).
+"""
+from __future__ import annotations
+
+import io
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage, imsave
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+from .files import atomic_write, write_bytes
+from .style import _RC_LOCK
+
+# Zielordner für relative Pfade in export(): <root>/source/_static/plots
+STATIC_PLOTS_DIR = Path(__file__).resolve().parents[2] / "source" / "_static" / "plots"
+
+# Formate, die aus dem Agg-Puffer kodiert werden bzw. eigene Renderer brauchen
+RASTER_FORMATS = ("png", "webp", "jpg", "jpeg", "tiff")
+VECTOR_FORMATS = ("svg", "pdf", "eps", "ps")
+
+# Profil, das beim Mehrfach-Export für ein Vektorformat gilt
+_VECTOR_PROFILE = {"svg": "web-svg-hybrid", "pdf": "print-pdf"}
+
+
+@dataclass(frozen=True)
+class ExportProfile:
+    """
+    Einstellungen für einen Export.
+
+    Parameters
+    ----------
+    name : str
+        Name des Profils (Schlüssel in EXPORT_PROFILES).
+    format : str
+        Dateiformat ('png', 'svg', 'pdf', ...).
+    dpi : int
+        Auflösung; bei Vektorformaten die der gerasterten Ebenen.
+    rasterize_min_points : int | None
+        Artists mit mindestens so vielen Punkten werden gerastert
+        (None → nichts rastern).
+    rc : dict
+        rcParams, die nur während des Speicherns gelten.
+    metadata : dict
+        Metadaten für savefig (None-Werte entfernen Standard-Einträge).
+    """
+    name: str
+    format: str
+    dpi: int
+    rasterize_min_points: int | None = None
+    rc: dict[str, object] = field(default_factory=dict)
+    metadata: dict[str, object] = field(default_factory=dict)
+
+
+EXPORT_PROFILES: dict[str, ExportProfile] = {
+    # wie bisher: PNG mit 300 dpi
+    "web-png": ExportProfile("web-png", "png", dpi=300),
+    # SVG für Webseiten: Daten als Bild (200 dpi), Text/Achsen als Vektoren
+    "web-svg-hybrid": ExportProfile(
+        "web-svg-hybrid", "svg", dpi=200, rasterize_min_points=500,
+        rc={"svg.hashsalt": "beautyplot"},   # stabile IDs → gleiche Bytes
+        metadata={"Date": None},
+    ),
+    # PDF für den Druck: nur sehr dichte Daten rastern, TrueType-Schriften einbetten
+    "print-pdf": ExportProfile(
+        "print-pdf", "pdf", dpi=600, rasterize_min_points=5000,
+        rc={"pdf.fonttype": 42},
+        metadata={"CreationDate": None},
+    ),
+}
+
+
+def get_profile(profile: str | ExportProfile) -> ExportProfile:
+    """Profil über Namen auflösen (ValueError bei unbekanntem Namen)."""
+    if isinstance(profile, ExportProfile):
+        return profile
+    try:
+        return EXPORT_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unbekanntes Export-Profil: {profile!r} (verfügbar: {', '.join(EXPORT_PROFILES)})"
+        ) from None
+
+
+def artist_points(artist: Artist) -> int:
+    """Anzahl der Punkte/Eckpunkte, die ein Artist im Vektorformat schreibt."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    if isinstance(artist, Collection):
+        offsets = len(artist.get_offsets())
+        vertices = sum(len(path.vertices) for path in artist.get_paths())
+        # Scatter: ein Pfad je Offset; sonst (fill_between, Linien-Sammlungen) die Eckpunkte
+        return max(offsets, vertices)
+    if isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+
+def rasterize_dense(fig: Figure, min_points: int) -> list[Artist]:
+    """
+    Markiert alle Daten-Artists mit mindestens 'min_points' Punkten als gerastert.
+
+    Bilder (imshow) sind ohnehin Raster und bleiben unverändert; Text,
+    Achsen, Ticks und Gitter werden nie gerastert.
+
+    Rückgabe
+    --------
+    list[Artist]
+        Die neu gerasterten Artists.
+    """
+    changed = []
+    for ax in fig.axes:
+        for artist in [*ax.get_lines(), *ax.collections, *ax.patches]:
+            if isinstance(artist, AxesImage) or artist.get_rasterized():
+                continue
+            if artist_points(artist) >= min_points:
+                artist.set_rasterized(True)
+                changed.append(artist)
+    return changed
+
+
+def save(
+    fig: Figure,
+    path: str | Path,
+    profile: str | ExportProfile = "web-png",
+    **savefig_kwargs,
+) -> Path:
+    """
+    Speichert eine Figure mit einem Export-Profil.
+
+    Fehlt die Dateiendung, wird die des Profils angehängt. Weitere
+    Keyword-Argumente gehen an fig.savefig und haben Vorrang vor dem Profil.
+    Vom Profil gerasterte Artists werden nach dem Speichern wieder
+    zurückgesetzt, die Figure bleibt unverändert.
+
+    Rückgabe
+    --------
+    Path
+        Pfad der geschriebenen Datei.
+    """
+    prof = get_profile(profile)
+    path = Path(path)
+    if not path.suffix:
+        path = path.with_suffix(f".{prof.format}")
+
+    kwargs = {"format": prof.format, "dpi": prof.dpi}
+    if prof.metadata:
+        kwargs["metadata"] = dict(prof.metadata)
+    kwargs.update(savefig_kwargs)
+
+    # Rastern gilt nur für diese Datei, sonst erbt jeder spätere Export (z. B.
+    # PDF nach SVG) die Flags. rasterize_dense ändert nur bisher ungerasterte
+    # Artists, danach werden genau diese zurückgesetzt.
+    changed: list[Artist] = []
+    if prof.rasterize_min_points is not None:
+        changed = rasterize_dense(fig, prof.rasterize_min_points)
+    try:
+        with atomic_write(path) as tmp:
+            if prof.rc:
+                with _RC_LOCK, matplotlib.rc_context(prof.rc):
+                    fig.savefig(tmp, **kwargs)
+            else:
+                fig.savefig(tmp, **kwargs)
+    finally:
+        for artist in changed:
+            artist.set_rasterized(False)
+    return path
+
+
+def render_rgba(fig: Figure, dpi: float) -> np.ndarray:
+    """
+    Zeichnet die Figure einmal mit Agg und liefert das Bild als RGBA-Array.
+
+    Wie bei savefig wird der Canvas nur vorübergehend getauscht und die
+    dpi der Figure danach wiederhergestellt.
+    """
+    canvas, orig_dpi = fig.canvas, fig.dpi
+    try:
+        fig.dpi = dpi
+        agg = FigureCanvasAgg(fig)
+        agg.draw()
+        return np.array(agg.buffer_rgba())  # Kopie: der Puffer gehört dem Renderer
+    finally:
+        fig.dpi = orig_dpi
+        fig.set_canvas(canvas)
+
+
+def encode_raster(rgba: np.ndarray, fmt: str, dpi: float) -> bytes:
+    """Kodiert ein RGBA-Array wie savefig (matplotlib.image.imsave, Pillow)."""
+    buf = io.BytesIO()
+    imsave(buf, rgba, format=fmt, origin="upper", dpi=dpi)
+    return buf.getvalue()
+
+
+def _encode_and_write(path: Path, rgba: np.ndarray, fmt: str, dpi: float, optimize: bool) -> Path:
+    data = encode_raster(rgba, fmt, dpi)
+    if optimize and fmt == "png":
+        from .pngopt import optimize_png_bytes
+        data = optimize_png_bytes(data)
+    return write_bytes(path, data)
+
+
+def export_paths(stem: Path, formats: Sequence[str], dpis: Sequence[int]) -> dict[tuple[str, int | None], Path]:
+    """
+    Dateinamen für export(): (Format, dpi) -> Pfad.
+
+    Die erste Auflösung ist die Basis (``stem.png``), weitere erhalten den
+    Faktor relativ zur Basis (``stem@2x.png`` für 300 dpi bei Basis 150).
+    Vektorformate gibt es nur einmal (dpi None).
+    """
+    paths: dict[tuple[str, int | None], Path] = {}
+    for fmt in formats:
+        if fmt in VECTOR_FORMATS:
+            paths[(fmt, None)] = stem.with_name(f"{stem.name}.{fmt}")
+            continue
+        for dpi in dpis:
+            suffix = "" if dpi == dpis[0] else f"@{dpi / dpis[0]:g}x"
+            paths[(fmt, dpi)] = stem.with_name(f"{stem.name}{suffix}.{fmt}")
+    return paths
+
+
+def export(
+    fig: Figure,
+    stem: str | Path,
+    formats: Sequence[str] = ("png",),
+    dpis: Sequence[int] = (300,),
+    *,
+    max_workers: int | None = None,
+    optimize: bool = False,
+) -> list[Path]:
+    """
+    Exportiert eine Figure in mehrere Formate und Auflösungen.
+
+    Rasterformate: pro dpi wird genau einmal gezeichnet; die Kodierung
+    (PNG, WebP, JPEG, ...) läuft parallel in einem Thread-Pool (Pillow gibt
+    dabei das GIL frei). Vektorformate werden mit ihrem Profil (SVG →
+    'web-svg-hybrid', PDF → 'print-pdf') im aufrufenden Thread gezeichnet,
+    während der Pool kodiert.
+
+    Parameters
+    ----------
+    fig : Figure
+        Zu exportierende Figure.
+    stem : str | Path
+        Dateiname ohne Endung; relative Pfade beziehen sich auf
+        ``source/_static/plots``.
+    formats : Sequence[str]
+        z. B. ("png", "webp", "svg").
+    dpis : Sequence[int]
+        Auflösungen der Rasterformate; die erste ist die Basis (1x).
+    max_workers : int | None
+        Threads für die Kodierung (None → Standard des ThreadPoolExecutor).
+    optimize : bool
+        PNGs verlustfrei nachoptimieren (``pngopt``: kompaktester Modus,
+        zlib-Stufe 9, feste Metadaten). Standardmäßig aus: die Neukodierung
+        kostet mehr Zeit als das einmalige Zeichnen spart; der Build
+        optimiert PNGs ohnehin als eigenen Schritt (``build.optimize_outputs``).
+
+    Rückgabe
+    --------
+    list[Path]
+        Geschriebene Dateien.
+    """
+    formats = [f.lower().lstrip(".") for f in formats]
+    unknown = [f for f in formats if f not in RASTER_FORMATS + VECTOR_FORMATS]
+    if unknown:
+        raise ValueError(f"Unbekannte Formate: {unknown} (erwartet: {RASTER_FORMATS + VECTOR_FORMATS})")
+    if not dpis:
+        raise ValueError("dpis darf nicht leer sein")
+
+    stem = Path(stem)
+    if not stem.is_absolute():
+        stem = STATIC_PLOTS_DIR / stem
+    paths = export_paths(stem, formats, list(dpis))
+    raster = [f for f in formats if f in RASTER_FORMATS]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        jobs = []
+        if raster:
+            for dpi in dict.fromkeys(dpis):
+                rgba = render_rgba(fig, dpi)  # ein Zeichnen pro dpi
+                for fmt in raster:
+                    jobs.append(pool.submit(
+                        _encode_and_write, paths[(fmt, dpi)], rgba, fmt, dpi, optimize,
+                    ))
+        # Vektorformate brauchen eigene Renderer → hier, während der Pool kodiert
+        written = [
+            save(fig, paths[(fmt, None)], _VECTOR_PROFILE.get(fmt, "web-png"), format=fmt)
+            for fmt in formats if fmt in VECTOR_FORMATS
+        ]
+        written += [job.result() for job in jobs]
+    return written
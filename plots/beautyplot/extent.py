@@ -0,0 +1,176 @@
+"""
+Datenausdehnung von Achsen (für origin_axes & Co.).
+
+Die Grenzen werden pro Artist in einem Cache mit schwachen Referenzen
+gehalten; siehe ``data_version``.
+"""
+from __future__ import annotations
+import weakref
+from collections.abc import Iterator
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection, PathCollection
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.transforms import IdentityTransform
+
+# Cache der Datenausdehnung pro Artist: Artist -> (Versionsmarke, Grenzen)
+_EXTENT_CACHE: weakref.WeakKeyDictionary[Artist, tuple[tuple, tuple | None]] = weakref.WeakKeyDictionary()
+
+
+def data_artists(ax: Axes) -> Iterator[Artist]:
+    """Alle Artists der Achse, die Daten tragen (Linien, Collections, Patches, Bilder)."""
+    yield from ax.get_lines()
+    yield from ax.collections
+    yield from ax.patches
+    yield from ax.images
+
+
+def artist_xy(ax: Axes, artist: Artist) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Liefert die Daten eines Artists als (x, y)-Arrays in Datenkoordinaten,
+    ohne sie in Python-Listen zu kopieren (None, falls leer).
+
+    - Linien (ax.plot)                        → Datenpunkte
+    - Scatter (ax.scatter)                    → Offsets
+    - übrige Collections (fill_between, vlines, ...) → Pfad-Eckpunkte
+    - Patches (Rectangle, Circle, Polygon, ...)      → Pfad-Eckpunkte
+    - Bilder (ax.imshow)                      → Extent
+
+    Collections und Patches, deren Transformation nicht über ``ax.transData``
+    läuft (Achsen-/Figurkoordinaten, axvspan, ...), liefern None: Ihre
+    Datenkoordinaten hingen sonst von den aktuellen Achsengrenzen ab.
+    """
+    if isinstance(artist, Line2D):
+        # get_xydata liefert das bereits konvertierte Array
+        xy = artist.get_xydata()
+    elif isinstance(artist, PathCollection):
+        # Scatter (ax.scatter) -> Collections mit Offsets
+        xy = artist.get_offsets()
+    elif isinstance(artist, Collection):
+        # fill_between (PolyCollection), vlines/hlines (LineCollection), ...
+        paths = artist.get_paths()
+        if not paths or not artist.get_transform().contains_branch(ax.transData):
+            return None
+        xy = np.concatenate([path.vertices for path in paths])
+        trans = artist.get_transform() - ax.transData
+        if not isinstance(trans, IdentityTransform):
+            xy = trans.transform(xy)
+    elif isinstance(artist, Patch):
+        if not artist.get_transform().contains_branch(ax.transData):
+            return None
+        xy = (artist.get_transform() - ax.transData).transform(artist.get_path().vertices)
+    elif isinstance(artist, AxesImage):
+        x0, x1, y0, y1 = artist.get_extent()
+        return np.array([x0, x1], dtype=float), np.array([y0, y1], dtype=float)
+    else:
+        return None
+
+    if len(xy) == 0:
+        return None
+    return xy[:, 0], xy[:, 1]
+
+
+def iter_xy_blocks(ax: Axes) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Liefert die Daten aller Artists der Achse blockweise als (x, y)-Arrays."""
+    for artist in data_artists(ax):
+        xy = artist_xy(ax, artist)
+        if xy is not None:
+            yield xy
+
+
+def data_version(ax: Axes, artist: Artist) -> tuple | None:
+    """
+    Versionsmarke für die Daten eines Artists (None → nicht cachen).
+
+    matplotlib ersetzt beim Setzen neuer Daten (set_data, set_offsets,
+    set_paths, ...) das gespeicherte Array bzw. die Pfadliste durch ein
+    neues Objekt. Die Identität dieser Objekte ändert sich daher genau
+    dann, wenn sich die Daten ändern. (Das ``stale``-Flag taugt dafür
+    nicht: Es wird bei jedem Zeichnen zurückgesetzt und auch bei reinen
+    Stiländerungen gesetzt.)
+    """
+    if isinstance(artist, Line2D):
+        return artist.get_xdata(orig=True), artist.get_ydata(orig=True)
+    if isinstance(artist, PathCollection):
+        return (artist.get_offsets(),)
+    if isinstance(artist, Collection):
+        # nur Collections in Datenkoordinaten; sonst hängen die Grenzen
+        # von den aktuellen Achsenlimits ab
+        if isinstance(artist.get_transform() - ax.transData, IdentityTransform):
+            return (artist.get_paths(),)
+    # Patches und Bilder bestehen aus wenigen Punkten → direkt berechnen
+    return None
+
+
+def artist_bounds(ax: Axes, artist: Artist) -> tuple[float, float, float, float] | None:
+    """Grenzen (xmin, xmax, ymin, ymax) eines Artists, gecacht pro Artist."""
+    version = data_version(ax, artist)
+    if version is not None:
+        cached = _EXTENT_CACHE.get(artist)
+        if (cached is not None and len(cached[0]) == len(version)
+                and all(a is b for a, b in zip(cached[0], version))):
+            return cached[1]
+
+    xy = artist_xy(ax, artist)
+    bounds = None
+    if xy is not None:
+        x, y = xy
+        bounds = (float(np.min(x)), float(np.max(x)), float(np.min(y)), float(np.max(y)))
+
+    if version is not None:
+        _EXTENT_CACHE[artist] = (version, bounds)
+    return bounds
+
+
+def get_all_xy(ax: Axes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sammelt alle x- und y-Daten der Achse (Linien, Scatter, Collections,
+    Patches, Bilder) per Array-Verkettung.
+
+    Rückgabe:
+    ---------
+    xs, ys : np.ndarray
+        Arrays mit allen gefundenen x- und y-Werten.
+    """
+    blocks = list(iter_xy_blocks(ax))
+    if not blocks:
+        return np.array([]), np.array([])
+    xs = np.concatenate([np.ravel(x) for x, _ in blocks])
+    ys = np.concatenate([np.ravel(y) for _, y in blocks])
+    return xs, ys
+
+
+def get_xy_bounds(ax: Axes) -> tuple[float, float, float, float]:
+    """
+    Bestimmt nur die Datenausdehnung der Achse, ohne alle Punkte in ein
+    gemeinsames Array zu kopieren.
+
+    Die Grenzen werden pro Artist berechnet und gecacht (schwache Referenz
+    auf den Artist + Versionsmarke der Daten, siehe ``data_version``).
+    Wiederholte Aufrufe auf derselben Achse kosten daher nur noch
+    O(Anzahl Artists). NaN-Werte in den Daten setzen sich (wie bei np.min)
+    fort.
+
+    Rückgabe:
+    ---------
+    xmin, xmax, ymin, ymax : float
+        Grenzen aller Daten; NaN, wenn die Achse keine Daten enthält.
+    """
+    bounds = [
+        b for b in (artist_bounds(ax, a) for a in data_artists(ax))
+        if b is not None
+    ]
+    if not bounds:
+        return (np.nan,) * 4
+    arr = np.array(bounds)
+    return (float(arr[:, 0].min()), float(arr[:, 1].max()),
+            float(arr[:, 2].min()), float(arr[:, 3].max()))
+
+
+def clear_extent_cache() -> None:
+    """Leert den Cache der Datenausdehnungen (z. B. nach In-place-Änderungen)."""
+    _EXTENT_CACHE.clear()
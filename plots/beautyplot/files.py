@@ -0,0 +1,46 @@
+"""
+Atomares Schreiben von Ausgabedateien (ohne matplotlib-Abhängigkeit).
+
+Jede Ausgabe wird zusätzlich über das Audit-Ereignis ``plots.output``
+gemeldet – auch dann, wenn sie unverändert blieb und daher gar nicht
+geschrieben wurde. ``plots/build.py`` erfasst so alle Ausgaben eines Skripts.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[Path]:
+    """
+    Liefert einen temporären Pfad neben 'path' und benennt ihn am Ende um.
+
+    Bei einem Fehler bleibt eine vorhandene Datei unverändert und die
+    temporäre Datei wird entfernt.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def report_output(path: Path) -> None:
+    """Meldet 'path' als Ausgabe des laufenden Skripts (Audit-Ereignis)."""
+    sys.audit("plots.output", str(path))
+
+
+def write_bytes(path: Path, data: bytes) -> Path:
+    """Schreibt atomar; bei identischem Inhalt bleibt die Datei (und ihr mtime) unangetastet."""
+    report_output(path)
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return path
+    with atomic_write(path) as tmp:
+        tmp.write_bytes(data)
+    return path
@@ -0,0 +1,254 @@
+"""
+Plotly-Figures als HTML mit gemeinsam genutzten Skripten exportieren.
+
+``fig.write_html(..., include_plotlyjs=True)`` bettet plotly.js (mehrere MB)
+in jede einzelne HTML-Datei ein. Hier wird plotly.js stattdessen einmal
+nach ``source/_static/js/plotly/`` geschrieben (Dateiname mit Version →
+Browser-Cache bleibt gültig, bis plotly aktualisiert wird) und von jeder
+Figure über einen relativen Pfad eingebunden. MathJax wird ebenso aus der
+lokalen Kopie in ``source/_static/js/mathjax/`` geladen.
+
+Relative Pfade (wie ``_relurl`` in ``source/_ext/audiocard.py``) funktionieren
+sowohl im Sphinx-Build als auch beim direkten Öffnen der Datei.
+
+Trace-Daten (x, y, ...) lassen sich zusätzlich kompakt ablegen:
+
+* ``dtype="float32"`` – Arrays als base64-kodierte float32-Typed-Arrays
+  statt als JSON-Zahlentext (plotly.js ≥ 2.28 dekodiert sie direkt),
+* ``sidecar=True`` – Arrays in einer Binärdatei ``<name>.traces.bin`` neben
+  der HTML-Datei; die Seite lädt sie nach dem Zeichnen per ``fetch`` nach.
+  Identische Arrays (z. B. dieselbe x-Achse aller Traces) werden nur einmal
+  gespeichert. ``fetch`` funktioniert nur über http(s), nicht bei ``file://``,
+* ``quantize=n`` – nur ``n`` Mantissenbits behalten (float32 hat 23); die
+  Genauigkeit sinkt auf etwa 2⁻ⁿ relativ, die Daten werden aber deutlich
+  besser komprimierbar (gzip beim Ausliefern).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+import plotly
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+from .files import report_output, write_bytes
+
+STATIC_DIR = Path(__file__).resolve().parents[2] / "source" / "_static"
+JS_DIR = STATIC_DIR / "js"
+PLOTLY_JS = JS_DIR / "plotly" / f"plotly-{plotly.__version__}.min.js"
+MATHJAX_JS = JS_DIR / "mathjax" / "es5" / "tex-chtml-full.js"
+
+# Trace-Attribute mit Datenarrays, die kompakt abgelegt werden
+ARRAY_KEYS = ("x", "y", "z", "customdata")
+# kürzere Arrays bleiben JSON-Text (Kodierung lohnt sich nicht)
+MIN_ARRAY_LENGTH = 64
+
+
+def relurl(target: Path, html_path: Path) -> str:
+    """URL von 'target' relativ zum Ordner der HTML-Datei (immer mit '/')."""
+    return Path(os.path.relpath(target, html_path.resolve().parent)).as_posix()
+
+
+def ensure_plotlyjs(path: Path = PLOTLY_JS) -> Path:
+    """
+    Schreibt das plotly.js-Bundle einmalig (atomar) und liefert seinen Pfad.
+
+    Auch ein bereits vorhandenes Bundle wird als Ausgabe gemeldet; fehlt es
+    später, gilt jedes Skript, das es nutzt, für build.py als veraltet.
+    """
+    if path.is_file():
+        report_output(path)
+    else:
+        write_bytes(path, get_plotlyjs().encode("utf-8"))
+    return path
+
+
+# ------------------------------------------------------------------
+#  Kompakte Trace-Arrays
+# ------------------------------------------------------------------
+def quantize_mantissa(values: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Rundet float32-Werte auf 'bits' Mantissenbits (0 ≤ bits ≤ 23).
+
+    Die unteren ``23 - bits`` Bits werden zu null gerundet (round half up
+    auf dem Bitmuster), NaN und ±inf bleiben unverändert.
+    """
+    values = np.array(values, dtype=np.float32)
+    if not 0 <= bits <= 23:
+        raise ValueError(f"quantize muss zwischen 0 und 23 liegen, nicht {bits}")
+    drop = 23 - bits
+    if drop == 0:
+        return values
+    raw = values.view(np.uint32)
+    finite = np.isfinite(values)
+    rounded = (raw + np.uint32(1 << (drop - 1))) & np.uint32(~((1 << drop) - 1) & 0xFFFFFFFF)
+    raw[finite] = rounded[finite]
+    return values
+
+
+def _numeric_array(value, min_length: int) -> np.ndarray | None:
+    """Wert als numerisches 1D-Array, falls er kompakt abgelegt werden soll."""
+    if isinstance(value, (str, bytes, dict)) or value is None:
+        return None
+    try:
+        arr = np.asarray(value)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or arr.size < min_length or arr.dtype.kind not in "fiu":
+        return None
+    return arr
+
+
+def compact_traces(
+    fig: go.Figure,
+    *,
+    dtype: Literal["float32", "float64"] = "float32",
+    quantize: int | None = None,
+    min_length: int = MIN_ARRAY_LENGTH,
+) -> tuple[go.Figure, list[tuple[int, str, np.ndarray]]]:
+    """
+    Kopie von 'fig', deren Trace-Arrays als 'dtype' (ggf. quantisiert) vorliegen.
+
+    plotly serialisiert NumPy-Arrays als base64-Typed-Arrays
+    (``{"dtype": "f4", "bdata": ...}``), Listen dagegen als Zahlentext.
+
+    Rückgabe
+    --------
+    (Figure, [(Trace-Index, Attribut, Array), ...])
+        Die Kopie und alle umgewandelten Arrays.
+    """
+    fig = go.Figure(fig)
+    arrays = []
+    for index, trace in enumerate(fig.data):
+        for key in ARRAY_KEYS:
+            if key not in trace:
+                continue
+            arr = _numeric_array(trace[key], min_length)
+            if arr is None:
+                continue
+            arr = arr.astype(dtype)
+            if quantize is not None and arr.dtype == np.float32:
+                arr = quantize_mantissa(arr, quantize)
+            trace[key] = arr
+            arrays.append((index, key, arr))
+    return fig, arrays
+
+
+# Lädt die Binärdatei und setzt die Arrays in die bereits gezeichnete Figure
+_SIDECAR_JS = """fetch({url}).then(function (r) {{
+    if (!r.ok) throw new Error(r.status + " " + r.url);
+    return r.arrayBuffer();
+}}).then(function (buf) {{
+    var gd = document.getElementById('{{plot_id}}');
+    var Typed = {typed};
+    {spec}.forEach(function (s) {{
+        gd.data[s[0]][s[1]] = new Typed(buf, s[2], s[3]);
+    }});
+    Plotly.redraw(gd);
+}});"""
+
+
+def _sidecar(
+    arrays: list[tuple[int, str, np.ndarray]],
+    fig: go.Figure,
+    bin_path: Path,
+    html_path: Path,
+) -> str:
+    """Schreibt die Arrays nach 'bin_path', leert sie in 'fig', liefert das Lade-Skript."""
+    blobs: dict[bytes, int] = {}   # SHA-1 → Offset (Duplikate nur einmal)
+    chunks = []
+    offset = 0
+    spec = []
+    for index, key, arr in arrays:
+        data = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<")).tobytes()
+        digest = hashlib.sha1(data).digest()
+        if digest not in blobs:
+            blobs[digest] = offset
+            chunks.append(data)
+            offset += len(data)        # Vielfache von 4/8 → Typed-Array-Ausrichtung passt
+        spec.append([index, key, blobs[digest], arr.size])
+        fig.data[index][key] = []
+    write_bytes(bin_path, b"".join(chunks))
+    typed = "Float32Array" if arrays[0][2].dtype == np.float32 else "Float64Array"
+    return _SIDECAR_JS.format(
+        url=json.dumps(relurl(bin_path, html_path)),
+        typed=typed,
+        spec=json.dumps(spec, separators=(",", ":")),
+    )
+
+
+# ------------------------------------------------------------------
+#  Export
+# ------------------------------------------------------------------
+def write_plotly_html(
+    fig: go.Figure,
+    path: str | Path,
+    *,
+    mathjax: bool = True,
+    div_id: str | None = None,
+    dtype: Literal["float32", "float64"] | None = None,
+    sidecar: bool = False,
+    quantize: int | None = None,
+    **kwargs,
+) -> Path:
+    """
+    Schreibt eine Plotly-Figure als eigenständige HTML-Seite, die plotly.js
+    und MathJax aus ``_static/js`` lädt statt sie einzubetten.
+
+    Parameters
+    ----------
+    fig : go.Figure
+        Plotly-Figure.
+    path : str | Path
+        Ziel-HTML-Datei (meist unter ``source/_static/plots/...``).
+    mathjax : bool
+        MathJax einbinden (für LaTeX in Titeln/Achsen/Legenden).
+    div_id : str | None
+        ID des Plot-Containers; Standard: Dateiname. Eine feste ID macht
+        die Ausgabe reproduzierbar (sonst zufällige UUID).
+    dtype : {"float32", "float64"} | None
+        Datentyp der Trace-Arrays (x, y, z, customdata ab 64 Werten).
+        None: unverändert lassen bzw. float32, wenn 'sidecar' oder
+        'quantize' gesetzt ist.
+    sidecar : bool
+        Arrays in ``<name>.traces.bin`` neben der HTML-Datei auslagern und
+        von der Seite nachladen lassen (nur über http(s) lauffähig).
+    quantize : int | None
+        Anzahl der float32-Mantissenbits, die erhalten bleiben (0..23).
+    **kwargs
+        Weitere Argumente für ``plotly.io.to_html`` (z. B. config, post_script).
+
+    Rückgabe
+    --------
+    Path
+        Pfad der geschriebenen Datei. Unveränderte Dateien werden nicht
+        neu geschrieben.
+    """
+    path = Path(path)
+    if dtype is None and (sidecar or quantize is not None):
+        dtype = "float32"
+    if quantize is not None and dtype != "float32":
+        raise ValueError("quantize setzt dtype='float32' voraus")
+    if dtype is not None:
+        fig, arrays = compact_traces(fig, dtype=dtype, quantize=quantize)
+        if sidecar and arrays:
+            script = _sidecar(arrays, fig, path.with_suffix(".traces.bin"), path)
+            post_script = kwargs.pop("post_script", None) or []
+            if isinstance(post_script, str):
+                post_script = [post_script]
+            kwargs["post_script"] = [script, *post_script]
+
+    html = fig.to_html(
+        include_plotlyjs=relurl(ensure_plotlyjs(), path),
+        include_mathjax=relurl(MATHJAX_JS, path) if mathjax else False,
+        full_html=True,
+        div_id=div_id or path.stem,
+        **kwargs,
+    )
+    return write_bytes(path, html.encode("utf-8"))
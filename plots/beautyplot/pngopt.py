@@ -0,0 +1,137 @@
+"""
+Verlustfreie Nachbearbeitung von PNG-Dateien.
+
+- Palette (≤ 256 Farben) statt RGBA, wenn das Bild so wenige Farben hat,
+- RGB bzw. Graustufen statt RGBA, wenn kein Pixel transparent ist,
+- zlib-Stufe 9, je einmal mit Standard- und 'filtered'-Strategie; die
+  kleinere Kodierung gewinnt,
+- feste Metadaten: nur die Auflösung (pHYs), kein Software-/Zeit-Eintrag.
+
+Ist keine Neukodierung kleiner als die Eingabe, bleibt die Eingabe
+unverändert – eine Datei wird nie größer. Gleiche Pixel ergeben damit
+gleiche Bytes; unveränderte Abbildungen erzeugen keinen Diff und keine neue
+Änderungszeit.
+
+``build.py`` und ``PlotStyle.export`` wenden dies auf alle erzeugten PNGs an.
+Vorhandene Dateien lassen sich direkt optimieren (aus ``plots/``):
+
+    python -m beautyplot.pngopt                 # alle PNGs unter source/_static/plots
+    python -m beautyplot.pngopt pfad/zu/bild.png
+"""
+from __future__ import annotations
+
+import io
+import zlib
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .files import write_bytes
+
+# Standard-Auflösung, wenn das PNG keine dpi-Angabe enthält
+_DEFAULT_DPI = 72
+
+# zlib-Strategien, die ausprobiert werden (Pillow nimmt sonst nur Z_FILTERED)
+_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED)
+
+
+def _compact(img: Image.Image) -> Image.Image:
+    """Kleinster verlustfreier Bildmodus: L, P (≤ 256 Farben), RGB oder RGBA."""
+    rgba = img.convert("RGBA")
+    opaque = rgba.getchannel("A").getextrema() == (255, 255)
+
+    if opaque:
+        rgb = rgba.convert("RGB")
+        r, g, b = rgb.split()
+        if r.tobytes() == g.tobytes() == b.tobytes():
+            return r  # Graustufen (Band 'L')
+
+    # Palette nur, wenn alle Farben exakt hineinpassen (kein Dithering)
+    colors = rgba.getcolors(256)
+    if colors is not None:
+        palette = np.array([c for _, c in colors], dtype=np.uint8)
+        keys = palette.view(np.uint32)[:, 0]   # RGBA als eine Zahl pro Farbe
+        order = np.argsort(keys)               # feste Reihenfolge → gleiche Bytes
+        palette, keys = palette[order], keys[order]
+        packed = np.ascontiguousarray(np.asarray(rgba)).view(np.uint32)[..., 0]
+        index = np.searchsorted(keys, packed).astype(np.uint8)
+        pal = Image.fromarray(index, "P")
+        pal.putpalette(palette[:, :3].ravel().tolist(), rawmode="RGB")
+        if not opaque:
+            pal.info["transparency"] = bytes(palette[:, 3].tolist())
+        return pal
+
+    return rgb if opaque else rgba
+
+
+def optimize_png_bytes(data: bytes) -> bytes:
+    """
+    Kodiert ein PNG verlustfrei neu (kompaktester Modus, zlib-Stufe 9).
+
+    Probiert die zlib-Strategien aus _STRATEGIES und liefert die kleinste
+    Kodierung; ist keine kleiner als 'data', kommt 'data' unverändert zurück.
+    Die Pixel (RGBA) bleiben exakt gleich; von den Metadaten einer
+    Neukodierung bleibt nur die Auflösung erhalten.
+    """
+    with Image.open(io.BytesIO(data)) as src:
+        dpi = src.info.get("dpi", (_DEFAULT_DPI, _DEFAULT_DPI))
+        img = _compact(src)
+
+    kwargs = {"transparency": img.info["transparency"]} if "transparency" in img.info else {}
+    best = data
+    for strategy in _STRATEGIES:
+        buf = io.BytesIO()
+        img.save(buf, format="png", compress_level=9, compress_type=strategy,
+                 dpi=tuple(round(d) for d in dpi), **kwargs)
+        if buf.tell() < len(best):
+            best = buf.getvalue()
+    return best
+
+
+def optimize_png(path: str | Path) -> tuple[int, int]:
+    """
+    Optimiert eine PNG-Datei in-place (atomar) und liefert (Bytes vorher, nachher).
+
+    Die Datei wird nur ersetzt, wenn die Neukodierung kleiner ist.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    optimized = optimize_png_bytes(data)
+    if optimized != data:
+        write_bytes(path, optimized)
+    return len(data), len(optimized)
+
+
+def format_report(path: str, before: int, after: int) -> str:
+    """Eine Berichtszeile: 'pfad  123,4 → 80,1 KiB (−35 %)' bzw. '(+4 %)'."""
+    change = 100 * (after - before) / before if before else 0.0
+    sign = "−" if change < 0 else "+"
+    kib_before = f"{before / 1024:.1f}".replace(".", ",")
+    kib_after = f"{after / 1024:.1f}".replace(".", ",")
+    return f"{path}  {kib_before} → {kib_after} KiB ({sign}{abs(change):.0f} %)"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Optimiert vorhandene PNGs (Standard: alle unter source/_static/plots)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PNGs verlustfrei optimieren.")
+    parser.add_argument("paths", nargs="*", type=Path, help="Dateien oder Ordner")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [Path(__file__).resolve().parents[2] / "source" / "_static" / "plots"]
+    files = sorted({f for p in paths for f in (p.rglob("*.png") if p.is_dir() else [p])})
+    total_before = total_after = 0
+    for f in files:
+        before, after = optimize_png(f)
+        total_before += before
+        total_after += after
+        print(format_report(str(f), before, after))
+    if files:
+        print(format_report("gesamt", total_before, total_after))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,747 @@
+"""
+PlotStyle: einheitliches Aussehen für Matplotlib-Abbildungen.
+
+Dieses Modul importiert beim Laden weder matplotlib noch numpy; beides wird
+erst in den Methoden geladen, die es brauchen. ``PlotStyle().colors`` kostet
+daher keine Importzeit, und ein GUI-Backend wird nie initialisiert
+(pyplot wird gar nicht benötigt).
+"""
+from __future__ import annotations
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import Formatter
+
+    from .export import ExportProfile
+    from .ticker import DecimalCommaFormatter
+
+# rcParams sind prozessweit → font_context serialisiert Threads über diese Sperre
+_RC_LOCK = threading.RLock()
+
+
+@dataclass
+class PlotStyle:
+    """
+    Kleine Hilfsklasse, um Matplotlib-Plots konsistent und hübsch zu formatieren.
+
+    Features:
+    ----------
+    - Globale Schrift-Einstellungen (set_font)
+    - Schrift ohne globale Änderung (font_context / apply_font)
+    - Einheitliches Achsen-Layout (beauty / style_axes)
+    - Dezimalkomma-Formatter für Achsen (set_decimal_comma)
+    - Achsenkreuz durch den Ursprung (origin_axes)
+    - Ausdünnen überabgetasteter Linien vor dem Export (decimate)
+    - Export-Profile mit gerasterten Datenebenen (save / rasterize_dense)
+    - Mehrfach-Export in Formate/Auflösungen mit einem Zeichnen pro dpi (export)
+    """
+    background_color: str = "#f5f5f5"  # Standard-Hintergrundfarbe der Axes
+    colors: dict[str, str] = field(default_factory=lambda: {
+        "red":    "#D62728",
+        "blue":   "#1F77B4",
+        "green":  "#2CA02C",
+        "orange": "#FF7F0E",
+        "purple": "#9467BD",
+        "cyan":   "#17BECF",
+        "teal":   "#2AA198",
+        "gray":   "#6E6E6E",
+        "black":  "#000000"
+    })
+    figure_transparent: bool = True     # nur der Rand außerhalb der Axes
+
+    # ------------------------------------------------------------------
+    #  Globale Schrift-/Typografie-Einstellungen
+    # ------------------------------------------------------------------
+    def set_font(
+        self,
+        family: str = "serif",
+        weight: str = "normal",
+        style: str = "normal",
+        size: int = 12,
+        subtitlesize: int = 16,
+        labelsize: int = 12,
+        legendsize: int = 12,
+        titlesize: int = 18,
+    ) -> None:
+        """
+        Setzt globale Matplotlib-Schrifteinstellungen.
+
+        Hinweis: wirkt global über rcParams, sollte daher am Anfang
+        eines Skripts/Notebooks aufgerufen werden. Für mehrere Figures
+        in einem Prozess (Threads, Render-Daemon) siehe 'font_context'
+        und 'apply_font'.
+        """
+        import matplotlib
+
+        matplotlib.rcParams.update(self.font_rc(
+            family, weight, style, size, subtitlesize, labelsize, legendsize, titlesize,
+        ))
+
+    @staticmethod
+    def font_rc(
+        family: str = "serif",
+        weight: str = "normal",
+        style: str = "normal",
+        size: int = 12,
+        subtitlesize: int = 16,
+        labelsize: int = 12,
+        legendsize: int = 12,
+        titlesize: int = 18,
+    ) -> dict[str, object]:
+        """rcParams-Einträge von 'set_font' als dict (ohne sie zu setzen)."""
+        return {
+            "text.usetex": False,        # hier erstmal ohne LaTeX
+            "font.family":  family,
+            "font.weight":  weight,
+            "font.style":   style,
+            "font.size":    size,        # Basisschriftgröße
+            "axes.titlesize":   subtitlesize,
+            "axes.labelsize":   labelsize,
+            "xtick.labelsize":  labelsize,
+            "ytick.labelsize":  labelsize,
+            "legend.fontsize":  legendsize,
+            "figure.titlesize": titlesize,
+        }
+
+    @contextmanager
+    def font_context(self, **font) -> Iterator[None]:
+        """
+        Wie 'set_font', aber nur innerhalb eines with-Blocks.
+
+        Beim Verlassen werden die vorherigen rcParams wiederhergestellt.
+        Da rcParams prozessweit gelten, hält der Block eine globale Sperre:
+        Threads, die ebenfalls 'font_context' nutzen, warten aufeinander
+        (sicher, aber nicht parallel). Für echtes paralleles Rendern
+        'apply_font' verwenden.
+
+        Beispiel
+        --------
+        >>> with ps.font_context(family="sans", size=12):
+        ...     fig, ax = plt.subplots()
+        ...     fig.savefig("plot.png")
+        """
+        import matplotlib
+
+        with _RC_LOCK, matplotlib.rc_context(self.font_rc(**font)):
+            yield
+
+    def apply_font(
+        self,
+        fig: Figure,
+        family: str = "serif",
+        weight: str = "normal",
+        style: str = "normal",
+        size: int = 12,
+        subtitlesize: int = 16,
+        labelsize: int = 12,
+        legendsize: int = 12,
+        titlesize: int = 18,
+    ) -> None:
+        """
+        Setzt die Schrift direkt an den Texten einer Figure (ohne rcParams).
+
+        Gleiche Parameter wie 'set_font'. Es wird nur die übergebene Figure
+        verändert, daher können mehrere Threads gleichzeitig eigene Figures
+        gestalten und speichern. Wirkt auf die bereits vorhandenen Texte,
+        also erst nach Titeln, Achsenbeschriftungen und Legende aufrufen
+        (vor tight_layout/savefig).
+
+        Wie bei 'set_font' erhalten Titel, Achsenbeschriftungen, Ticks,
+        Offset-Texte und Legenden die neue Schrift; übrige Texte (ax.text,
+        annotate, fig.text) nur in den Eigenschaften, die noch auf dem
+        rcParams-Standard stehen – explizit gesetzte Größen, Stärken usw.
+        bleiben erhalten. Neu erzeugte Ticks übernehmen Größe, Familie,
+        Stärke und Stil vom ersten Tick der Achse (nicht mehr nach
+        ``tick_params(reset=True)`` oder ``ax.cla()``). Die Innenabstände
+        einer Legende legt Matplotlib bei ihrer Erzeugung fest; diese
+        bleiben unverändert.
+        """
+        # Rolle → Schriftgröße; alle übrigen Texte erhalten die Basisgröße
+        sizes: dict[int, float] = {}
+        templates: list = []    # Labels der ersten Ticks (ohne Tick-Positionen nicht in findobj)
+        suptitle = getattr(fig, "_suptitle", None)
+        if suptitle is not None:
+            sizes[id(suptitle)] = titlesize
+
+        for ax in fig.axes:
+            for name in ("title", "_left_title", "_right_title"):
+                title = getattr(ax, name, None)
+                if title is not None:
+                    sizes[id(title)] = subtitlesize
+            for axis in (ax.xaxis, ax.yaxis):
+                sizes[id(axis.label)] = labelsize
+                sizes[id(axis.offsetText)] = labelsize
+                # erster Tick als Vorlage: später erzeugte Ticks kopieren seine Schrift
+                first = [axis.majorTicks[0], axis.minorTicks[0]]
+                templates += [label for tick in first for label in (tick.label1, tick.label2)]
+                for tick in axis.get_major_ticks() + axis.get_minor_ticks() + first:
+                    sizes[id(tick.label1)] = labelsize
+                    sizes[id(tick.label2)] = labelsize
+            legend = ax.get_legend()
+            if legend is not None:
+                for text in [*legend.get_texts(), legend.get_title()]:
+                    sizes[id(text)] = legendsize
+            # Vorgaben für Ticks, die erst beim Zeichnen entstehen
+            ax.tick_params(axis="both", which="both", labelsize=labelsize, labelfontfamily=family)
+
+        for legend in fig.legends:
+            for text in [*legend.get_texts(), legend.get_title()]:
+                sizes[id(text)] = legendsize
+
+        import matplotlib
+        from matplotlib.font_manager import FontProperties
+        from matplotlib.text import Text
+
+        rc = FontProperties()  # Standardschrift der aktuellen rcParams
+        texts = {id(text): text for text in [*fig.findobj(Text), *templates]}
+        for text in texts.values():
+            role = id(text) in sizes
+            if role or text.get_usetex() == matplotlib.rcParams["text.usetex"]:
+                text.set_usetex(False)
+            if role or text.get_fontfamily() == rc.get_family():
+                text.set_fontfamily(family)
+            if role or text.get_fontweight() == rc.get_weight():
+                text.set_fontweight(weight)
+            if role or text.get_fontstyle() == rc.get_style():
+                text.set_fontstyle(style)
+            if role or text.get_fontsize() == rc.get_size_in_points():
+                text.set_fontsize(sizes.get(id(text), size))
+
+    # ------------------------------------------------------------------
+    #  Achsenlayout „aufhübschen“ (Gitter, Spines, Ticks, Hintergrund)
+    # ------------------------------------------------------------------
+    def beauty(self, fig: Figure, ax: Axes) -> None:
+        """
+        Wendet ein einheitliches, „schönes“ Layout auf eine Achse an.
+        """
+        self._beauty_axes(ax)
+
+        # Figure-Hintergrund außerhalb der Axes
+        if self.figure_transparent:
+            fig.patch.set_alpha(0.0)
+
+    def _beauty_axes(self, ax: Axes) -> None:
+        """Achsenteil von 'beauty' (Ticks, Spines, Grid, Hintergrund)."""
+        # Haupt-Ticks
+        ax.tick_params(
+            axis="both",
+            which="major",
+            direction="inout",
+            length=10,
+            width=1,
+        )
+
+        # Neben-Ticks
+        ax.minorticks_on()
+        ax.tick_params(
+            axis="both",
+            which="minor",
+            direction="inout",
+            length=5,
+            width=0.8,
+            color="gray",
+        )
+
+        # Rahmen (Spines)
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        ax.spines["left"].set_linewidth(1)
+        ax.spines["bottom"].set_linewidth(1)
+
+        # Grid + Hintergrund
+        ax.grid(True, linestyle=":", linewidth=0.5, alpha=1.0)
+        ax.set_facecolor(self.background_color)
+
+    # ------------------------------------------------------------------
+    #  Dezimalkomma-Formatter für Achsen (x, y oder beide)
+    # ------------------------------------------------------------------
+    def set_decimal_comma(
+        self,
+        ax: Axes,
+        axis: Literal["x", "y", "both"] = "both",
+        decimals: int | tuple[int, int] = 2,
+        *,
+        minor: bool = False,
+    ) -> None:
+        """
+        Setzt einen Dezimalkomma-Formatter ('.' → ',') auf x-, y- oder beide Achsen.
+
+        Parameters
+        ----------
+        ax : Axes
+            Ziel-Achse.
+        axis : {'x', 'y', 'both'}
+            Welche Achsen formatiert werden sollen.
+        decimals : int oder (int, int)
+            int  -> gleiche Nachkommastellen für x und y
+            (dx, dy) -> getrennte Nachkommastellen für x- und y-Achse
+        minor : bool
+            Falls True, werden auch die Minorticks formatiert.
+        """
+        fmt_x, fmt_y = self._comma_formatters(axis, decimals)
+        self._apply_formatters(ax, fmt_x, fmt_y, minor=minor)
+
+    def _comma_formatters(
+        self,
+        axis: Literal["x", "y", "both"],
+        decimals: int | tuple[int, int],
+    ) -> tuple[DecimalCommaFormatter | None, DecimalCommaFormatter | None]:
+        """Formatter für set_decimal_comma (None für nicht gewählte Achsen)."""
+        dec_x, dec_y = self._resolve_decimals(decimals)  # None ist hier nicht erlaubt, aber schadet nicht
+
+        fmt_x = self._make_comma_formatter(dec_x if dec_x is not None else 0)
+        fmt_y = self._make_comma_formatter(dec_y if dec_y is not None else 0)
+        return (
+            fmt_x if axis in ("x", "both") else None,
+            fmt_y if axis in ("y", "both") else None,
+        )
+
+    @staticmethod
+    def _apply_formatters(
+        ax: Axes,
+        fmt_x: Formatter | None,
+        fmt_y: Formatter | None,
+        *,
+        minor: bool = False,
+    ) -> None:
+        """Setzt die (ggf. geteilten) Formatter auf x- und y-Achse."""
+        if fmt_x is not None:
+            ax.xaxis.set_major_formatter(fmt_x)
+            if minor:
+                ax.xaxis.set_minor_formatter(fmt_x)
+
+        if fmt_y is not None:
+            ax.yaxis.set_major_formatter(fmt_y)
+            if minor:
+                ax.yaxis.set_minor_formatter(fmt_y)
+
+    # ------------------------------------------------------------------
+    #  Convenience: beauty + optional Dezimalkomma
+    # ------------------------------------------------------------------
+    def style_axes(
+        self,
+        fig: Figure,
+        ax: Axes,
+        *,
+        comma_axis: Literal["x", "y", "both", "none"] = "none",
+        decimals: int | tuple[int, int] = 2,
+        minor: bool = False,
+    ) -> None:
+        """
+        Kombiniert 'beauty' und optional den Dezimalkomma-Formatter.
+
+        Parameters
+        ----------
+        fig : Figure
+            Figure, zu der die Achse gehört.
+        ax : Axes
+            Ziel-Achse.
+        comma_axis : {'x', 'y', 'both', 'none'}
+            Welche Achse(n) im Dezimalkommaformat angezeigt werden sollen.
+        decimals : int oder (int, int)
+            Nachkommastellen für x/y.
+        minor : bool
+            Auch Minorticks formatieren.
+        """
+        self.beauty(fig, ax)
+        if comma_axis != "none":
+            self.set_decimal_comma(ax, axis=comma_axis, decimals=decimals, minor=minor)
+
+    # ------------------------------------------------------------------
+    #  Achsen durch den Ursprung legen („Origin Plot“)
+    # ------------------------------------------------------------------
+    def origin_axes(
+        self,
+        fig: Figure,
+        ax: Axes,
+        *,
+        comma_axis: Literal["x", "y", "both", "none"] = "both",
+        decimals: int | tuple[int, int] | None = None,
+        comma: bool = True,
+        hide_zero_tick: bool = True,
+        prune_ends: bool = False,
+    ) -> None:
+        """
+        Legt x- und y-Achse durch den Ursprung und formatiert Ticks.
+
+        Parameters
+        ----------
+        fig, ax : Figure, Axes
+            Ziel-Figure und -Achse.
+        comma_axis : {'x', 'y', 'both', 'none'}
+            Welche Achsen im Dezimalkommaformat angezeigt werden sollen.
+        decimals : int | (int, int) | None
+            Nachkommastellen:
+            - int       -> gleiche Stellen für x und y
+            - (dx, dy)  -> getrennt für x und y
+            - None      -> Standardformatierung (g-Format)
+        comma : bool
+            Ob '.' durch ',' ersetzt werden soll.
+        hide_zero_tick : bool
+            Tick-Beschriftung bei 0 ausblenden (sauberes Achsenkreuz).
+        prune_ends : bool
+            Äußerste Major-Ticks „abknipsen“ (MaxNLocator(prune="both")).
+        """
+        # allgemeinen Style anwenden
+        self.beauty(fig, ax)
+
+        fmt_x, fmt_y = self._origin_formatters(
+            comma_axis, decimals, comma=comma, hide_zero=hide_zero_tick,
+        )
+        self._apply_origin(ax, fmt_x, fmt_y, prune_ends=prune_ends)
+
+    def _origin_formatters(
+        self,
+        comma_axis: Literal["x", "y", "both", "none"],
+        decimals: int | tuple[int, int] | None,
+        *,
+        comma: bool,
+        hide_zero: bool,
+    ) -> tuple[DecimalCommaFormatter | None, DecimalCommaFormatter | None]:
+        """Formatter für origin_axes (None für nicht gewählte Achsen)."""
+        # Dezimalstellen für x / y getrennt bestimmen
+        dec_x, dec_y = self._resolve_decimals(decimals)
+
+        # Formatter nur für die gewünschten Achsen erzeugen
+        fmt_x = fmt_y = None
+        if comma_axis in ("x", "both"):
+            fmt_x = self._make_origin_formatter(dec_x, comma=comma, hide_zero=hide_zero)
+        if comma_axis in ("y", "both"):
+            fmt_y = self._make_origin_formatter(dec_y, comma=comma, hide_zero=hide_zero)
+        return fmt_x, fmt_y
+
+    def _apply_origin(
+        self,
+        ax: Axes,
+        fmt_x: Formatter | None,
+        fmt_y: Formatter | None,
+        *,
+        prune_ends: bool,
+    ) -> None:
+        """Achsenteil von 'origin_axes' (ohne 'beauty')."""
+        # Achsen durch den Ursprung
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        ax.spines["left"].set_position("zero")
+        ax.spines["bottom"].set_position("zero")
+        ax.spines["left"].set_linewidth(1)
+        ax.spines["bottom"].set_linewidth(1)
+
+        # Daten analysieren → ggf. Limits anpassen (NaN-Vergleiche sind False)
+        xmin, _, ymin, _ = self.get_xy_bounds(ax)
+        if xmin > 0:
+            ax.set_xlim(left=0.0)
+        if ymin > 0:
+            ax.set_ylim(bottom=0.0)
+
+        # äußerste Ticks abschneiden (Locator brauchen ihre eigene Achse → nicht teilbar)
+        if prune_ends:
+            from matplotlib.ticker import MaxNLocator
+            ax.xaxis.set_major_locator(MaxNLocator(prune="both"))
+            ax.yaxis.set_major_locator(MaxNLocator(prune="both"))
+
+        self._apply_formatters(ax, fmt_x, fmt_y)
+
+    # ------------------------------------------------------------------
+    #  Batch-Styling: alle Achsen einer Figure auf einmal
+    # ------------------------------------------------------------------
+    def style_figure(
+        self,
+        fig: Figure,
+        axes: Axes | Iterable[Axes] | np.ndarray | None = None,
+        *,
+        mode: Literal["style", "origin"] = "style",
+        layout: Literal["tight", "constrained", "none"] = "none",
+        **options,
+    ) -> None:
+        """
+        Wendet 'style_axes' bzw. 'origin_axes' auf viele Achsen auf einmal an.
+
+        Formatter werden nur einmal erzeugt und von allen Achsen geteilt
+        (der DecimalCommaFormatter hängt nicht von seiner Achse ab; so
+        teilen sich alle Panels auch den Cache). Locator wie MaxNLocator
+        lesen die Limits ihrer Achse und werden daher pro Achse erzeugt.
+        Das Layout wird erst ganz am Ende in einem einzigen Durchlauf
+        berechnet.
+
+        Parameters
+        ----------
+        fig : Figure
+            Ziel-Figure.
+        axes : Axes | Iterable[Axes] | np.ndarray | None
+            Achsen (z. B. das Array aus plt.subplots); None → alle Achsen der Figure.
+        mode : {'style', 'origin'}
+            'style'  -> wie style_axes
+            'origin' -> wie origin_axes
+        layout : {'tight', 'constrained', 'none'}
+            Abschließendes Layout ('tight' → einmal fig.tight_layout()).
+        **options
+            Keyword-Argumente von style_axes bzw. origin_axes
+            (comma_axis, decimals, minor / comma, hide_zero_tick, prune_ends).
+        """
+        import numpy as np
+        from matplotlib.axes import Axes
+
+        if axes is None:
+            axes_list = list(fig.axes)
+        elif isinstance(axes, Axes):
+            axes_list = [axes]
+        else:
+            axes_list = list(np.ravel(np.asarray(axes, dtype=object)))
+
+        if mode == "style":
+            opts = {"comma_axis": "none", "decimals": 2, "minor": False}
+        elif mode == "origin":
+            opts = {"comma_axis": "both", "decimals": None, "comma": True,
+                    "hide_zero_tick": True, "prune_ends": False}
+        else:
+            raise ValueError(f"Unbekannter mode: {mode!r} (erwartet 'style' oder 'origin')")
+        unknown = set(options) - set(opts)
+        if unknown:
+            raise TypeError(f"Unbekannte Optionen für mode={mode!r}: {sorted(unknown)}")
+        opts.update(options)
+
+        # Formatter einmal erzeugen und teilen
+        if mode == "style":
+            fmt_x = fmt_y = None
+            if opts["comma_axis"] != "none":
+                fmt_x, fmt_y = self._comma_formatters(opts["comma_axis"], opts["decimals"])
+            for ax in axes_list:
+                self._beauty_axes(ax)
+                self._apply_formatters(ax, fmt_x, fmt_y, minor=opts["minor"])
+        else:
+            fmt_x, fmt_y = self._origin_formatters(
+                opts["comma_axis"], opts["decimals"],
+                comma=opts["comma"], hide_zero=opts["hide_zero_tick"],
+            )
+            for ax in axes_list:
+                self._beauty_axes(ax)
+                self._apply_origin(ax, fmt_x, fmt_y, prune_ends=opts["prune_ends"])
+
+        # Figure-Hintergrund außerhalb der Axes
+        if self.figure_transparent:
+            fig.patch.set_alpha(0.0)
+
+        # Layout: ein einziger Durchlauf am Ende
+        if layout == "tight":
+            fig.tight_layout()
+        elif layout == "constrained":
+            fig.set_layout_engine("constrained")
+
+    # ------------------------------------------------------------------
+    #  Überabgetastete Linien ausdünnen (vor dem Export)
+    # ------------------------------------------------------------------
+    def decimate(
+        self,
+        ax: Axes,
+        max_points_per_pixel: float = 4,
+        *,
+        dpi: float = 300,
+    ) -> tuple[int, int]:
+        """
+        Ersetzt die Daten dicht abgetasteter Linien durch Min/Max pro Pixelspalte.
+
+        Pro Bin bleiben erster, letzter, kleinster und größter Punkt erhalten;
+        das gerenderte Bild bleibt (bis auf Antialiasing-Unterschiede im
+        Subpixelbereich) gleich, Renderzeit und Dateigröße sinken. Opt-in:
+        erst ganz am Ende aufrufen, nach Achsenlimits und tight_layout,
+        direkt vor savefig. Linien mit Markern, Treppenstil oder nicht
+        monotonen x-Werten bleiben unverändert.
+
+        Parameters
+        ----------
+        ax : Axes
+            Achse, deren Linien ausgedünnt werden.
+        max_points_per_pixel : float
+            Obergrenze der Punkte pro Pixelspalte (4 → ein Bin pro Pixel).
+        dpi : float
+            Auflösung des späteren Exports (savefig(dpi=...)).
+
+        Rückgabe
+        --------
+        (vorher, nachher) : tuple[int, int]
+            Anzahl der Linienpunkte vor und nach dem Ausdünnen.
+        """
+        if max_points_per_pixel <= 0:
+            raise ValueError(f"max_points_per_pixel muss > 0 sein, erhalten: {max_points_per_pixel!r}")
+        from .decimate import decimate_axes
+        return decimate_axes(ax, dpi=dpi, max_points_per_pixel=max_points_per_pixel)
+
+    # ------------------------------------------------------------------
+    #  Export-Profile (PNG / SVG mit Rasterebenen / PDF)
+    # ------------------------------------------------------------------
+    def rasterize_dense(self, fig: Figure, min_points: int = 500) -> list:
+        """
+        Rastert dichte Daten-Artists (ab 'min_points' Punkten) beim Vektor-Export;
+        Text und Achsen bleiben Vektoren. Liefert die geänderten Artists.
+        """
+        from .export import rasterize_dense
+        return rasterize_dense(fig, min_points)
+
+    def save(
+        self,
+        fig: Figure,
+        path: str | Path,
+        profile: str | ExportProfile = "web-png",
+        **savefig_kwargs,
+    ) -> Path:
+        """
+        Speichert eine Figure mit einem Export-Profil.
+
+        Parameters
+        ----------
+        fig : Figure
+            Zu speichernde Figure.
+        path : str | Path
+            Zieldatei; ohne Endung wird die des Profils angehängt.
+        profile : str | ExportProfile
+            'web-png'        -> PNG, 300 dpi (wie bisher)
+            'web-svg-hybrid' -> SVG, dichte Daten als 200-dpi-Bild
+            'print-pdf'      -> PDF, sehr dichte Daten als 600-dpi-Bild
+        **savefig_kwargs
+            Zusätzliche Argumente für fig.savefig (überschreiben das Profil).
+
+        Rückgabe
+        --------
+        Path
+            Pfad der geschriebenen Datei.
+        """
+        from .export import save
+        return save(fig, path, profile, **savefig_kwargs)
+
+    def export(
+        self,
+        fig: Figure,
+        stem: str | Path,
+        formats: Sequence[str] = ("png",),
+        dpis: Sequence[int] = (300,),
+        *,
+        max_workers: int | None = None,
+        optimize: bool = False,
+    ) -> list[Path]:
+        """
+        Exportiert eine Figure in mehrere Formate und Auflösungen auf einmal.
+
+        Pro dpi wird nur einmal gezeichnet; Rasterformate werden parallel
+        kodiert und alle Dateien atomar geschrieben.
+
+        Parameters
+        ----------
+        fig : Figure
+            Zu exportierende Figure.
+        stem : str | Path
+            Dateiname ohne Endung; relativ → unter ``source/_static/plots``.
+        formats : Sequence[str]
+            Raster ('png', 'webp', 'jpg', ...) und/oder Vektor ('svg', 'pdf').
+        dpis : Sequence[int]
+            Auflösungen der Rasterformate; die erste ist die Basis, weitere
+            heißen ``stem@2x.png`` usw.
+        max_workers : int | None
+            Threads für die Kodierung.
+        optimize : bool
+            PNGs verlustfrei nachoptimieren (siehe ``beautyplot.pngopt``;
+            Standard: aus, kostet deutlich Zeit).
+
+        Rückgabe
+        --------
+        list[Path]
+            Geschriebene Dateien.
+
+        Beispiel
+        --------
+        >>> ps.export(fig, "mechanik/kinematik/02_Ort", ["png", "webp", "svg"], [150, 300])
+        """
+        from .export import export
+        return export(fig, stem, formats, dpis, max_workers=max_workers, optimize=optimize)
+
+    # ------------------------------------------------------------------
+    #  Hilfsfunktionen: Daten auslesen & Formatter
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_all_xy(ax: Axes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sammelt alle x- und y-Daten der Achse (Linien, Scatter, Collections,
+        Patches, Bilder) per Array-Verkettung.
+
+        Rückgabe:
+        ---------
+        xs, ys : np.ndarray
+            Arrays mit allen gefundenen x- und y-Werten.
+        """
+        from .extent import get_all_xy
+        return get_all_xy(ax)
+
+    @staticmethod
+    def get_xy_bounds(ax: Axes) -> tuple[float, float, float, float]:
+        """
+        Bestimmt nur die Datenausdehnung der Achse (gecacht pro Artist),
+        ohne alle Punkte in ein gemeinsames Array zu kopieren.
+
+        Rückgabe:
+        ---------
+        xmin, xmax, ymin, ymax : float
+            Grenzen aller Daten; NaN, wenn die Achse keine Daten enthält.
+        """
+        from .extent import get_xy_bounds
+        return get_xy_bounds(ax)
+
+    @staticmethod
+    def clear_extent_cache() -> None:
+        """Leert den Cache der Datenausdehnungen (z. B. nach In-place-Änderungen)."""
+        from .extent import clear_extent_cache
+        clear_extent_cache()
+
+    @staticmethod
+    def _make_comma_formatter(decimals: int) -> DecimalCommaFormatter:
+        """
+        Erzeugt einen Formatter mit Dezimalkomma und fester Stellenzahl.
+        """
+        from .ticker import DecimalCommaFormatter
+        return DecimalCommaFormatter(decimals, comma=True, hide_zero=False)
+
+    @staticmethod
+    def _make_origin_formatter(
+        decimals: int | None,
+        *,
+        comma: bool,
+        hide_zero: bool,
+    ) -> DecimalCommaFormatter:
+        """
+        Formatter für Origin-Achsen:
+        - optional Dezimalkomma
+        - optional 0-Tick ohne Label
+        - optionale Nachkommastellen (None => Standardformat)
+        """
+        from .ticker import DecimalCommaFormatter
+        return DecimalCommaFormatter(decimals, comma=comma, hide_zero=hide_zero)
+
+    @staticmethod
+    def _resolve_decimals(
+        decimals: int | tuple[int, int] | None
+    ) -> tuple[int | None, int | None]:
+        """
+        Konvertiert eine Dezimalstellen-Angabe in (dec_x, dec_y).
+
+        - int       -> (int, int)
+        - (dx, dy)  -> (dx, dy)
+        - None      -> (None, None)
+        """
+        if decimals is None:
+            return None, None
+        if isinstance(decimals, int):
+            return decimals, decimals
+        if isinstance(decimals, tuple) and len(decimals) == 2:
+            return decimals[0], decimals[1]
+        raise ValueError(
+            f"Erwartet int, tuple[int, int] oder None, erhalten: {decimals!r} "
+            f"(Typ: {type(decimals)})"
+        )
\ No newline at end of file
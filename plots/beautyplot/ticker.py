@@ -0,0 +1,122 @@
+"""
+Tick-Formatter mit Dezimalkomma.
+
+Benötigt nur ``matplotlib.ticker`` (kein pyplot, kein GUI-Backend).
+"""
+from __future__ import annotations
+import math
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.ticker import Formatter
+
+# Toleranz für „Tick liegt auf 0“ (entspricht np.isclose(x, 0.0))
+_ZERO_ATOL = 1e-8
+
+
+# ------------------------------------------------------------------
+#  Tick-Formatter mit Dezimalkomma
+# ------------------------------------------------------------------
+class DecimalCommaFormatter(Formatter):
+    """
+    Tick-Formatter mit optionalem Dezimalkomma, der bereits formatierte
+    Werte in einem begrenzten LRU-Cache vorhält.
+
+    Bei jedem Neuzeichnen (interaktiv, Animation, mehrere Exporte) werden
+    meist dieselben Tick-Positionen formatiert; diese kommen dann direkt
+    aus dem Cache. ``format_ticks`` formatiert alle Ticks einer Achse in
+    einem Aufruf.
+
+    Parameters
+    ----------
+    decimals : int | None
+        Nachkommastellen; None => Standardformat (g-Format).
+    comma : bool
+        Ob '.' durch ',' ersetzt werden soll.
+    hide_zero : bool
+        Tick-Beschriftung bei 0 ausblenden.
+    cache_size : int
+        Maximale Anzahl gecachter Tick-Werte.
+    """
+
+    def __init__(
+        self,
+        decimals: int | None = None,
+        *,
+        comma: bool = True,
+        hide_zero: bool = False,
+        cache_size: int = 256,
+    ) -> None:
+        self.decimals = decimals
+        self.comma = comma
+        self.hide_zero = hide_zero
+        self.cache_size = cache_size
+        self._fmt = "%g" if decimals is None else f"%.{decimals}f"
+        self._cache: OrderedDict[float, str] = OrderedDict()
+
+    def _format(self, x: float) -> str:
+        """Formatiert einen Wert ohne Cache (reine Python-Prüfungen)."""
+        # NaN / Inf ausblenden
+        if not math.isfinite(x):
+            return ""
+        # 0 optional ohne Label
+        if self.hide_zero and abs(x) <= _ZERO_ATOL:
+            return ""
+        s = self._fmt % x
+        # Punkt → Komma
+        return s.replace(".", ",") if self.comma else s
+
+    def _remember(self, x: float, s: str) -> None:
+        """Legt einen formatierten Wert im Cache ab (älteste Einträge fliegen raus)."""
+        if x == 0.0:
+            return  # 0.0 und -0.0 wären als Schlüssel gleich, formatieren aber verschieden
+        if not math.isfinite(x):
+            return  # NaN trifft nie (NaN != NaN) und würde nur echte Einträge verdrängen
+        self._cache[x] = s
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def __call__(self, x: float, pos: int | None = None) -> str:
+        x = float(x)
+        if not math.isfinite(x):
+            return ""
+        s = self._cache.get(x)
+        if s is not None and x != 0.0:
+            self._cache.move_to_end(x)
+            return s
+        s = self._format(x)
+        self._remember(x, s)
+        return s
+
+    def format_ticks(self, values) -> list[str]:
+        """
+        Formatiert alle Ticks einer Achse in einem Aufruf: Treffer kommen aus
+        dem Cache, alle übrigen Werte werden gemeinsam (vektorisiert) formatiert.
+        """
+        locs = np.asarray(values, dtype=float)
+        self.set_locs(locs)
+
+        labels: list[str | None] = []
+        missing: list[int] = []
+        for i, x in enumerate(locs.tolist()):
+            s = self._cache.get(x) if x != 0.0 else None
+            if s is None:
+                missing.append(i)
+            else:
+                self._cache.move_to_end(x)
+            labels.append(s)
+
+        if missing:
+            vals = locs[missing]
+            strs = np.char.mod(self._fmt, vals)
+            if self.comma:
+                strs = np.char.replace(strs, ".", ",")
+            hide = ~np.isfinite(vals)
+            if self.hide_zero:
+                hide |= np.abs(vals) <= _ZERO_ATOL
+            strs[hide] = ""
+            for i, x, s in zip(missing, vals.tolist(), strs.tolist()):
+                labels[i] = s
+                self._remember(x, s)
+
+        return labels  # type: ignore[return-value]
@@ -0,0 +1,15 @@
+"""
+Benchmarks für die Hilfsmodule unter ``plots/`` (keine Plot-Skripte).
+
+Aufruf aus dem Projektroot, z. B.:
+
+    python plots/benchmarks/import_time.py   # Import-/Startzeit von beautyplot
+    python plots/benchmarks/styling.py       # PlotStyle-Methoden und savefig
+    python plots/benchmarks/decimation.py    # Sichtvergleich PlotStyle.decimate
+    python plots/benchmarks/export_profiles.py  # Rastern je Profil bei SVG + PDF
+    python plots/benchmarks/fourier_series.py  # Fourier-Komponenten und Partialsummen
+    python plots/benchmarks/audio_synth.py     # additive Synthese (audiosynth)
+
+Ergebnisse werden als JSON unter ``plots/benchmarks/results/`` abgelegt
+(nicht eingecheckt) und lassen sich mit ``--compare`` gegenüberstellen.
+"""
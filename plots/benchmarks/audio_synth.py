@@ -0,0 +1,116 @@
+"""
+Benchmark der additiven Synthese (``audiosynth.synth``).
+
+Verglichen wird die Schleife der Tutorial-Skripte (``np.sin`` in voller
+Signallänge je Stimme und Teilton) mit ``synthesize`` (ein Matrixprodukt
+über alle Blöcke) für einen Dreiklang mit 6 Teiltönen („violine“) und
+wachsender Dauer, dazu ``stream`` (``iter_blocks`` stückweise, wie beim
+Schreiben der WAV-Dateien) und ``stream32`` (dasselbe in float32, wie für
+``sample_format="float32"``). Neben der Zeit wird der Spitzenspeicher
+(tracemalloc) festgehalten.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/audio_synth.py
+    python plots/benchmarks/audio_synth.py --quick
+    python plots/benchmarks/audio_synth.py --compare plots/benchmarks/results/audio_synth-....json
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from common import PLOTS_DIR, compare, measure, print_table, save_results
+
+if str(PLOTS_DIR) not in sys.path:
+    sys.path.insert(0, str(PLOTS_DIR))
+
+from audiosynth.notes import chord_frequencies, get_partials  # noqa: E402
+from audiosynth.synth import NYQUIST_GUARD, iter_blocks, partial_table, synthesize  # noqa: E402
+
+DURATIONS = (1.0, 10.0, 60.0, 180.0)
+SR = 44_100
+
+
+def loop_reference(freqs: list[float], partials: dict[int, float], duration_s: float) -> np.ndarray:
+    """Bisherige Implementierung aus make_chord_with_partials (ohne Fades)."""
+    N = int(SR * duration_s)
+    t = np.arange(N) / SR
+    mix = np.zeros(N)
+    per_voice = 1.0 / len(freqs)
+    for f0 in freqs:
+        x = np.zeros(N)
+        for k, a in partials.items():
+            if k * f0 >= NYQUIST_GUARD * SR:
+                continue
+            x += a * np.sin(2 * np.pi * k * f0 * t)
+        mix += per_voice * x
+    return mix
+
+
+def engine(freqs: list[float], partials: dict[int, float], duration_s: float) -> np.ndarray:
+    table = partial_table(freqs, partials, 1.0 / len(freqs), sr=SR, nyquist_guard=NYQUIST_GUARD)
+    return synthesize(table, int(SR * duration_s), SR)
+
+
+def stream(freqs: list[float], partials: dict[int, float], duration_s: float,
+           dtype=np.float64) -> float:
+    """Stückweise Synthese; gibt den Spitzenwert zurück (wie der erste WAV-Durchgang)."""
+    table = partial_table(freqs, partials, 1.0 / len(freqs), sr=SR, nyquist_guard=NYQUIST_GUARD)
+    blocks = iter_blocks(table, int(SR * duration_s), SR, dtype=dtype)
+    return max(float(np.max(np.abs(b))) for b in blocks)
+
+
+def stream32(freqs: list[float], partials: dict[int, float], duration_s: float) -> float:
+    return stream(freqs, partials, duration_s, dtype=np.float32)
+
+
+def peak_memory(func) -> int:
+    """Spitzenwert der Python-/NumPy-Allokationen während func() in Bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark der additiven Synthese.")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Wiederholungen pro Messung")
+    parser.add_argument("--quick", action="store_true", help="nur kurze Dauern")
+    parser.add_argument("-k", "--filter", default="", help="nur Messungen, deren Name dies enthält")
+    parser.add_argument("--json", type=Path,
+                        help="Ergebnisdatei (Standard: results/audio_synth-<Zeit>.json)")
+    parser.add_argument("--compare", type=Path, help="früherer Lauf als Vergleich")
+    args = parser.parse_args(argv)
+
+    freqs = chord_frequencies("C4", "major")
+    partials = get_partials("violine")
+    results = []
+    for duration in DURATIONS[:2] if args.quick else DURATIONS:
+        for name, func in (("loop", loop_reference), ("matrix", engine), ("stream", stream),
+                           ("stream32", stream32)):
+            if args.filter not in name:
+                continue
+            params = {"seconds": duration, "sr": SR, "voices": len(freqs), "partials": len(partials)}
+            run = lambda _=None, f=func, d=duration: f(freqs, partials, d)  # noqa: E731
+            result = {"name": name, "params": params, **measure(run, repeat=args.repeat)}
+            result["peak_mib"] = peak_memory(run) / 2**20
+            results.append(result)
+            print(f"  {name} {params}: Spitzenspeicher {result['peak_mib']:.1f} MiB", file=sys.stderr)
+
+    print_table(results)
+    path = save_results("audio_synth", results, args.json)
+    print(f"\nErgebnisse: {path}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Gemeinsame Helfer der Benchmarks: Zeitmessung, Umgebung, JSON-Ergebnisse.
+"""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+PLOTS_DIR = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+_LIBRARIES = ("numpy", "matplotlib", "plotly", "scipy")
+
+
+def measure(
+    func: Callable[[object], object],
+    setup: Callable[[], object] | None = None,
+    *,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> dict[str, float | int]:
+    """
+    Misst 'func' mehrfach; 'setup' läuft vor jedem Lauf außerhalb der Messung.
+
+    Parameters
+    ----------
+    func : Callable
+        Bekommt den Rückgabewert von 'setup' (bzw. None) übergeben.
+    setup : Callable | None
+        Erzeugt den Ausgangszustand (z. B. eine frische Figure).
+    repeat : int
+        Anzahl gemessener Läufe.
+    warmup : int
+        Anzahl ungemessener Läufe vorab.
+
+    Rückgabe
+    --------
+    dict
+        median_s, min_s, max_s und repeat.
+    """
+    times = []
+    for i in range(warmup + repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return {"median_s": statistics.median(times), "min_s": min(times),
+            "max_s": max(times), "repeat": repeat}
+
+
+def environment() -> dict[str, str]:
+    """Rechner, Python-/Bibliotheksversionen und Git-Commit für den Vergleich."""
+    env = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    for lib in _LIBRARIES:
+        try:
+            env[lib] = metadata.version(lib)
+        except metadata.PackageNotFoundError:
+            env[lib] = "-"
+    try:
+        env["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PLOTS_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        env["commit"] = "-"
+    return env
+
+
+def save_results(suite: str, results: list[dict], path: Path | None = None) -> Path:
+    """Speichert Ergebnisse als JSON (Standard: results/<suite>-<Zeitstempel>.json)."""
+    now = datetime.now(timezone.utc)
+    if path is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{suite}-{now:%Y%m%d-%H%M%S}.json"
+    data = {"suite": suite, "created": now.isoformat(timespec="seconds"),
+            "environment": environment(), "results": results}
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def _key(result: dict) -> tuple:
+    return result["name"], tuple(sorted(result["params"].items()))
+
+
+def compare(results: list[dict], baseline: Path, *, threshold: float = 1.10) -> int:
+    """
+    Vergleicht mit einer früheren JSON-Datei und gibt die Faktoren aus.
+
+    Rückgabe: Anzahl der Messungen, die um mehr als 'threshold' langsamer sind.
+    """
+    old = {_key(r): r for r in json.loads(baseline.read_text(encoding="utf-8"))["results"]}
+    slower = 0
+    print(f"\nVergleich mit {baseline.name} (Faktor = neu / alt):")
+    for result in results:
+        ref = old.get(_key(result))
+        if ref is None:
+            continue
+        factor = result["median_s"] / ref["median_s"]
+        mark = ""
+        if factor > threshold:
+            slower += 1
+            mark = "  [langsamer]"
+        elif factor < 1 / threshold:
+            mark = "  [schneller]"
+        print(f"  {format_name(result):<50}{factor:>7.2f}x{mark}")
+    return slower
+
+
+def format_name(result: dict) -> str:
+    """'name[a=1, b=2]' für Tabellen."""
+    params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+    return f"{result['name']}[{params}]"
+
+
+def print_table(results: list[dict]) -> None:
+    """Gibt die Ergebnisse als Tabelle aus."""
+    print(f"{'Messung':<50}{'Median':>12}{'Min':>12}")
+    for r in results:
+        print(f"{format_name(r):<50}{1e3 * r['median_s']:>10.2f}ms{1e3 * r['min_s']:>10.2f}ms")
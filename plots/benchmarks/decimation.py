@@ -0,0 +1,133 @@
+"""
+Sichtvergleich und Nutzen von ``PlotStyle.decimate``.
+
+Jedes Testsignal wird zweimal gerendert, einmal mit allen Punkten und
+einmal ausgedünnt. Die beiden PNGs werden pixelweise verglichen. Das
+Skript schlägt fehl (Exit-Code 1), wenn mehr als ``--max-changed`` der
+Pixel um mehr als ``--tolerance`` (0…1, pro Farbkanal) abweichen.
+Zusätzlich werden die Export-Zeit und die Dateigröße berichtet.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/decimation.py
+    python plots/benchmarks/decimation.py --dpi 300 --save-diff /tmp/decimate
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.image import imread
+
+from common import PLOTS_DIR, print_table, save_results
+
+if str(PLOTS_DIR) not in sys.path:
+    sys.path.insert(0, str(PLOTS_DIR))
+
+from beautyplot import PlotStyle  # noqa: E402
+
+ps = PlotStyle()
+rng = np.random.default_rng(0)
+
+
+def _gaps(n: int) -> tuple[np.ndarray, np.ndarray]:
+    t = np.linspace(0.0, 1.0, n)
+    y = np.sin(2 * np.pi * 3 * t)
+    y[(t > 0.3) & (t < 0.35)] = np.nan
+    return t, y
+
+
+def _spikes(n: int) -> tuple[np.ndarray, np.ndarray]:
+    t = np.linspace(0.0, 1.0, n)
+    y = np.zeros(n)
+    y[rng.integers(0, n, 12)] = rng.uniform(-1, 1, 12)
+    return t, y
+
+
+# Name -> Erzeuger (x, y); Punktzahlen weit über der Pixelbreite
+SIGNALS: dict[str, Callable[[], tuple[np.ndarray, np.ndarray]]] = {
+    "sinus_200fs": lambda: (np.arange(200_000) / 4e7 * 1e3,
+                            np.sin(2 * np.pi * 440 * np.arange(200_000) / 4e7)),
+    "chirp": lambda: (t := np.linspace(0, 1, 500_000), np.sin(2 * np.pi * (5 + 400 * t) * t)),
+    "rauschen": lambda: (np.linspace(0, 1, 200_000), rng.normal(size=200_000)),
+    "spitzen": lambda: _spikes(1_000_000),
+    "luecken": lambda: _gaps(300_000),
+}
+
+
+def render(x: np.ndarray, y: np.ndarray, *, decimate: bool, dpi: int) -> tuple[bytes, float, int]:
+    """Rendert eine Figure wie die Plot-Skripte; (PNG, Sekunden für savefig, Punkte)."""
+    fig = Figure(figsize=(8, 3.5))
+    ax = fig.add_subplot()
+    ax.plot(x, y, lw=1.5, color=ps.colors["blue"])
+    ps.style_axes(fig, ax, comma_axis="y", decimals=1)
+    fig.tight_layout()
+    points = len(x)
+    if decimate:
+        _, points = ps.decimate(ax, dpi=dpi)
+    buf = io.BytesIO()
+    start = time.perf_counter()
+    fig.savefig(buf, format="png", dpi=dpi)
+    return buf.getvalue(), time.perf_counter() - start, points
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sichtvergleich für PlotStyle.decimate.")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Abweichung pro Farbkanal, ab der ein Pixel als verändert gilt")
+    parser.add_argument("--max-changed", type=float, default=0.002,
+                        help="erlaubter Anteil veränderter Pixel")
+    parser.add_argument("--save-diff", type=Path, help="Ordner für Original/Ausgedünnt/Differenz")
+    parser.add_argument("--json", type=Path, help="Ergebnisdatei (Standard: results/decimation-<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    results, failed = [], []
+    for name, make in SIGNALS.items():
+        x, y = make()
+        png_full, t_full, n_full = render(x, y, decimate=False, dpi=args.dpi)
+        png_dec, t_dec, n_dec = render(x, y, decimate=True, dpi=args.dpi)
+
+        a = imread(io.BytesIO(png_full), format="png")
+        b = imread(io.BytesIO(png_dec), format="png")
+        diff = np.abs(a - b).max(axis=-1)
+        changed = float(np.mean(diff > args.tolerance))
+        if changed > args.max_changed:
+            failed.append(name)
+
+        if args.save_diff:
+            args.save_diff.mkdir(parents=True, exist_ok=True)
+            (args.save_diff / f"{name}_voll.png").write_bytes(png_full)
+            (args.save_diff / f"{name}_ausgeduennt.png").write_bytes(png_dec)
+            diff_fig = Figure(figsize=(8, 3.5))
+            diff_fig.figimage(diff, cmap="magma", vmin=0, vmax=1)
+            diff_fig.savefig(args.save_diff / f"{name}_differenz.png", dpi=args.dpi)
+
+        params = {"signal": name, "dpi": args.dpi}
+        results += [
+            {"name": "savefig_voll", "params": params, "median_s": t_full, "min_s": t_full,
+             "points": n_full, "bytes": len(png_full)},
+            {"name": "savefig_ausgeduennt", "params": params, "median_s": t_dec, "min_s": t_dec,
+             "points": n_dec, "bytes": len(png_dec),
+             "changed_pixels": changed, "max_channel_diff": float(diff.max())},
+        ]
+        print(f"{name:<12} Punkte {n_full:>9} → {n_dec:>6}   savefig {1e3 * t_full:7.1f} → "
+              f"{1e3 * t_dec:6.1f} ms   PNG {len(png_full) / 1024:6.1f} → {len(png_dec) / 1024:6.1f} KiB   "
+              f"verändert {100 * changed:.3f} % (max. Δ {diff.max():.2f})")
+
+    print()
+    print_table(results)
+    print(f"\nErgebnisse: {save_results('decimation', results, args.json)}")
+    for name in failed:
+        print(f"[Fehler]   {name}: mehr als {100 * args.max_changed:.2f} % der Pixel verändert")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Prüfung der Export-Profile beim Speichern mehrerer Vektorformate.
+
+``export`` speichert SVG ('web-svg-hybrid', rastert ab 500 Punkten) und PDF
+('print-pdf', rastert ab 5000 Punkten) nacheinander aus derselben Figure.
+Für Linien verschiedener Länge wird geprüft, dass jede Datei genau nach
+ihrem eigenen Profil gerastert ist – unabhängig von der Reihenfolge der
+Formate – und dass die Figure danach unverändert ist. Eine Linie mit 500 bis
+5000 Punkten muss also im SVG gerastert und im PDF ein Vektorpfad sein.
+Das Skript schlägt fehl (Exit-Code 1), wenn eine Datei abweicht.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/export_profiles.py
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from common import PLOTS_DIR, print_table, save_results
+
+if str(PLOTS_DIR) not in sys.path:
+    sys.path.insert(0, str(PLOTS_DIR))
+
+from beautyplot.export import _VECTOR_PROFILE, export, get_profile  # noqa: E402
+
+POINTS = (100, 1000, 4999, 20_000)
+ORDERS = (("svg", "pdf"), ("pdf", "svg"))
+
+
+def is_rasterized(path: Path) -> bool:
+    """True, wenn die Vektordatei ein eingebettetes Rasterbild enthält."""
+    data = path.read_bytes()
+    if path.suffix == ".svg":
+        return b"<image" in data
+    return b"/Subtype /Image" in data
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rastern der Export-Profile prüfen.")
+    parser.add_argument("--json", type=Path,
+                        help="Ergebnisdatei (Standard: results/export_profiles-<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    tmp = Path(tempfile.mkdtemp(prefix="bench-profiles-"))
+    results, failed = [], []
+    for n in POINTS:
+        for order in ORDERS:
+            fig = Figure(figsize=(6, 3))
+            (line,) = fig.add_subplot().plot(rng.normal(size=n))
+            stem = tmp / f"linie_{n}_{'_'.join(order)}"
+            start = time.perf_counter()
+            paths = export(fig, stem, list(order))
+            seconds = time.perf_counter() - start
+
+            result = {"name": "export", "params": {"points": n, "order": "→".join(order)},
+                      "median_s": seconds, "min_s": seconds}
+            if line.get_rasterized():
+                failed.append(f"{n} Punkte, {' → '.join(order)}: Linie bleibt gerastert")
+            for path in paths:
+                fmt = path.suffix.lstrip(".")
+                expected = n >= get_profile(_VECTOR_PROFILE[fmt]).rasterize_min_points
+                rasterized = is_rasterized(path)
+                if rasterized != expected:
+                    failed.append(f"{path.name}: gerastert={rasterized}, erwartet {expected}")
+                result[f"{fmt}_bytes"] = path.stat().st_size
+                result[f"{fmt}_rasterized"] = rasterized
+            results.append(result)
+
+    print_table(results)
+    print(f"\nErgebnisse: {save_results('export_profiles', results, args.json)}")
+    for message in failed:
+        print(f"[Fehler]   {message}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Benchmark der Fourier-Reihen-Auswertung (``fourier.series``).
+
+Verglichen werden die frühere Schleife der Fourier-Skripte (ein ``np.cos``
+je Harmonischer, jede Partialsumme einzeln mit ``np.sum``) mit
+``cosine_components`` (broadcast / recurrence) + ``partial_sums``
+(ein ``np.cumsum``) für wachsende Anzahlen an Harmonischen. ``--leakage``
+gibt stattdessen den Genauigkeitsbericht (``leakage_report``) der Signale
+aus, mit den Einstellungen der Fourier-Skripte.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/fourier_series.py
+    python plots/benchmarks/fourier_series.py --quick
+    python plots/benchmarks/fourier_series.py --leakage
+    python plots/benchmarks/fourier_series.py --compare plots/benchmarks/results/fourier_series-....json
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from common import PLOTS_DIR, compare, measure, print_table, save_results
+
+if str(PLOTS_DIR) not in sys.path:
+    sys.path.insert(0, str(PLOTS_DIR))
+
+from fourier import signals  # noqa: E402
+from fourier.series import cosine_components, leakage_report, partial_sums  # noqa: E402
+
+TERMS = (10, 100, 1_000, 5_000)
+SAMPLES = 1_000
+# die quadratische Schleife nur bis hierhin messen (sonst Minuten)
+LOOP_MAX_TERMS = 1_000
+# Einstellungen der Fourier-Skripte (source/dev/transformationen/fourier-reihe/plots)
+LEAKAGE_SAMPLES = 4096
+LEAKAGE_TERMS = 10
+
+
+def coefficients(n_terms: int) -> tuple[float, np.ndarray, np.ndarray, float, float]:
+    """Zufällige, abklingende Koeffizienten (DC, A, phi, omega0, x0)."""
+    rng = np.random.default_rng(0)
+    A = rng.random(n_terms) / np.arange(1, n_terms + 1)
+    phi = rng.uniform(-np.pi, np.pi, n_terms)
+    return 0.1, A, phi, np.pi, -1.0
+
+
+def loop_reference(x, DC, A, phi, omega0, x0, n_terms):
+    """Bisherige Implementierung aus den Fourier-Skripten."""
+    comps = np.zeros((n_terms + 1, x.size), float)
+    comps[0, :] = DC
+    t = x - x0
+    for idx in range(n_terms):
+        comps[idx + 1, :] = A[idx] * np.cos((idx + 1) * omega0 * t + phi[idx])
+    return [np.sum(comps[0:n + 1, :], axis=0) for n in range(n_terms + 1)]
+
+
+def cases(quick: bool) -> list[tuple[str, dict, object]]:
+    """(Name, Parameter, Funktion) aller Messungen."""
+    x = np.linspace(-3, 3, SAMPLES)
+    out = []
+    for n in TERMS[:2] if quick else TERMS:
+        params = {"terms": n, "samples": SAMPLES}
+        coeffs = coefficients(n)
+        if n <= LOOP_MAX_TERMS:
+            out.append(("loop", params, lambda _, c=coeffs, n=n: loop_reference(x, *c, n)))
+        for method in ("broadcast", "recurrence"):
+            out.append((method, params, lambda _, c=coeffs, n=n, m=method:
+                        partial_sums(cosine_components(x, *c, n, method=m))))
+    return out
+
+
+def print_leakage() -> None:
+    """Genauigkeitsbericht der FFT-Koeffizienten für alle Signale der Fourier-Skripte."""
+    for sig in (signals.rechteck, signals.rampe, signals.mischsignal):
+        report = leakage_report(sig, signals.PERIOD, LEAKAGE_SAMPLES, x0=-1.0,
+                                n_terms=LEAKAGE_TERMS)
+        print(f"{sig.__name__:12s} {report}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark der Fourier-Reihen-Auswertung.")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Wiederholungen pro Messung")
+    parser.add_argument("--quick", action="store_true", help="nur kleine Größen")
+    parser.add_argument("-k", "--filter", default="", help="nur Messungen, deren Name dies enthält")
+    parser.add_argument("--json", type=Path,
+                        help="Ergebnisdatei (Standard: results/fourier_series-<Zeit>.json)")
+    parser.add_argument("--compare", type=Path, help="früherer Lauf als Vergleich")
+    parser.add_argument("--leakage", action="store_true",
+                        help="nur Genauigkeitsbericht der Fourier-Skripte ausgeben")
+    args = parser.parse_args(argv)
+
+    if args.leakage:
+        print_leakage()
+        return 0
+
+    results = []
+    for name, params, func in cases(args.quick):
+        if args.filter not in name:
+            continue
+        results.append({"name": name, "params": params, **measure(func, repeat=args.repeat)})
+        print(f"  {name} {params}", file=sys.stderr)
+
+    print_table(results)
+    path = save_results("fourier_series", results, args.json)
+    print(f"\nErgebnisse: {path}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
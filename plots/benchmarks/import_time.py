@@ -0,0 +1,96 @@
+"""
+Import-Zeit von beautyplot messen.
+
+Jedes Szenario läuft mehrfach in einem frischen Interpreter; berichtet wird
+der Median der Wandzeit (inkl. Interpreterstart) und welche schweren Module
+danach geladen sind. Das Skript schlägt fehl (Exit-Code 1), wenn der reine
+Farbzugriff ``PlotStyle().colors`` matplotlib oder numpy lädt bzw. wenn
+beautyplot irgendwo pyplot importiert.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/import_time.py
+    python plots/benchmarks/import_time.py -n 15 --json import_time.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PLOTS_DIR = Path(__file__).resolve().parents[1]
+
+# Module, deren Laden im Ergebnis vermerkt wird
+HEAVY = ("numpy", "matplotlib", "matplotlib.pyplot")
+
+# Name -> Python-Code; jedes Szenario läuft in einem eigenen Interpreter
+SCENARIOS: dict[str, str] = {
+    "python": "pass",
+    "eager (pyplot+numpy)": "import numpy, matplotlib.pyplot, matplotlib.ticker",
+    "PlotStyle().colors": "from beautyplot import PlotStyle\nPlotStyle().colors['blue']",
+    "PlotStyle().style_axes": (
+        "from beautyplot import PlotStyle\n"
+        "from matplotlib.figure import Figure\n"
+        "fig = Figure(); ax = fig.add_subplot()\n"
+        "PlotStyle().style_axes(fig, ax, comma_axis='both')"
+    ),
+}
+
+# Nach dem Szenario: geladene Module als JSON auf stdout
+_PROBE = "\nimport json, sys\nprint(json.dumps({m: m in sys.modules for m in %r}))" % (HEAVY,)
+
+
+def run_once(code: str) -> tuple[float, dict[str, bool]]:
+    """Führt 'code' in einem neuen Interpreter aus: (Sekunden, geladene Module)."""
+    env = dict(os.environ, PYTHONPATH=str(PLOTS_DIR), PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code + _PROBE],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    seconds = time.perf_counter() - start
+    return seconds, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-Zeit von beautyplot messen.")
+    parser.add_argument("-n", "--repeat", type=int, default=7, help="Wiederholungen pro Szenario")
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        run_once(code)  # Aufwärmen (Dateisystem-Cache)
+        times, loaded = [], {}
+        for _ in range(args.repeat):
+            seconds, loaded = run_once(code)
+            times.append(seconds)
+        results[name] = {"median_ms": 1e3 * statistics.median(times),
+                         "min_ms": 1e3 * min(times), "loaded": loaded}
+
+    base = results["python"]["median_ms"]
+    print(f"{'Szenario':<26}{'Median':>10}{'netto':>10}   geladen")
+    for name, r in results.items():
+        loaded = ", ".join(m for m, ok in r["loaded"].items() if ok) or "-"
+        print(f"{name:<26}{r['median_ms']:>8.1f}ms{r['median_ms'] - base:>8.1f}ms   {loaded}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    failures = []
+    if any(results["PlotStyle().colors"]["loaded"].values()):
+        failures.append("PlotStyle().colors lädt matplotlib/numpy")
+    if results["PlotStyle().style_axes"]["loaded"]["matplotlib.pyplot"]:
+        failures.append("beautyplot importiert matplotlib.pyplot")
+    for msg in failures:
+        print(f"[Fehler]   {msg}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
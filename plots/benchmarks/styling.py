@@ -0,0 +1,138 @@
+"""
+Benchmark der PlotStyle-Methoden und des PNG-Exports.
+
+Gemessen werden ``beauty``, ``origin_axes``, ``set_decimal_comma``,
+``get_all_xy`` und ``savefig`` (150/300 dpi) auf synthetischen Figures mit
+wachsender Punktzahl (1 Achse) und wachsender Anzahl an Subplots (je 10⁴
+Punkte). ``export`` vergleicht ``PlotStyle.export`` mit einzelnen
+``savefig``-Aufrufen je Format und dpi, einmal ohne und einmal mit
+PNG-Optimierung (``export_optimize``). Die Ergebnisse landen als JSON in ``plots/benchmarks/results/``;
+mit ``--compare`` wird gegen einen früheren Lauf verglichen.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/benchmarks/styling.py                 # vollständiger Lauf
+    python plots/benchmarks/styling.py --quick         # kleine Größen, schnell
+    python plots/benchmarks/styling.py --compare plots/benchmarks/results/styling-....json
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import io
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from common import PLOTS_DIR, compare, measure, print_table, save_results
+
+if str(PLOTS_DIR) not in sys.path:
+    sys.path.insert(0, str(PLOTS_DIR))
+
+from beautyplot import PlotStyle  # noqa: E402
+
+POINTS = (1_000, 10_000, 100_000, 1_000_000)
+SUBPLOTS = (1, 4, 16)
+DPIS = (150, 300)
+SUBPLOT_POINTS = 10_000
+EXPORT_FORMATS = ("png", "webp", "svg")
+
+ps = PlotStyle()
+
+
+def make_figure(points: int, subplots: int) -> Figure:
+    """Figure mit 'subplots' Achsen (quadratisches Raster), je eine Kurve + Scatter."""
+    rows = int(np.ceil(np.sqrt(subplots)))
+    cols = int(np.ceil(subplots / rows))
+    fig = Figure(figsize=(3 * cols, 2.5 * rows))
+    axes = fig.subplots(rows, cols, squeeze=False).ravel()[:subplots]
+    x = np.linspace(-1.0, 4.0, points)
+    y = np.sin(2 * np.pi * x) * np.exp(-0.3 * x)
+    for ax in axes:
+        ax.plot(x, y, color=ps.colors["blue"])
+        ax.scatter(x[:: max(1, points // 50)], y[:: max(1, points // 50)], s=4, color=ps.colors["red"])
+    return fig
+
+
+def _styled(points: int, subplots: int) -> Figure:
+    fig = make_figure(points, subplots)
+    ps.style_figure(fig, mode="origin")
+    return fig
+
+
+def cases(quick: bool) -> list[tuple[str, dict, object, object]]:
+    """(Name, Parameter, Funktion, Setup) aller Messungen."""
+    points = POINTS[:2] if quick else POINTS
+    subplots = SUBPLOTS[:2] if quick else SUBPLOTS
+    grid = [(n, 1) for n in points] + [(SUBPLOT_POINTS, s) for s in subplots if s != 1]
+
+    out = []
+    for n, s in grid:
+        params = {"points": n, "subplots": s}
+
+        def setup(n=n, s=s):
+            ps.clear_extent_cache()
+            return make_figure(n, s)
+
+        out += [
+            ("beauty", params, lambda fig: [ps.beauty(fig, ax) for ax in fig.axes], setup),
+            ("origin_axes", params, lambda fig: [ps.origin_axes(fig, ax) for ax in fig.axes], setup),
+            ("set_decimal_comma", params,
+             lambda fig: [ps.set_decimal_comma(ax, "both", 2) for ax in fig.axes], setup),
+            ("get_all_xy", params, lambda fig: [ps.get_all_xy(ax) for ax in fig.axes], setup),
+        ]
+        for dpi in DPIS:
+            out.append((
+                "savefig", {**params, "dpi": dpi},
+                lambda fig, dpi=dpi: fig.savefig(io.BytesIO(), format="png", dpi=dpi),
+                lambda n=n, s=s: _styled(n, s),
+            ))
+    # Mehrfach-Export: ein Zeichnen pro dpi vs. savefig je Format und dpi
+    tmp = Path(tempfile.mkdtemp(prefix="bench-export-"))
+    atexit.register(shutil.rmtree, tmp, True)
+    params = {"points": SUBPLOT_POINTS, "subplots": 4, "formats": "+".join(EXPORT_FORMATS)}
+    out += [
+        ("export_naive", params, lambda fig: [
+            fig.savefig(tmp / f"naiv{dpi}.{fmt}", dpi=dpi) for fmt in EXPORT_FORMATS for dpi in DPIS
+        ], lambda: _styled(SUBPLOT_POINTS, 4)),
+        ("export", params, lambda fig: ps.export(fig, tmp / "export", EXPORT_FORMATS, DPIS),
+         lambda: _styled(SUBPLOT_POINTS, 4)),
+        ("export_optimize", params,
+         lambda fig: ps.export(fig, tmp / "export_opt", EXPORT_FORMATS, DPIS, optimize=True),
+         lambda: _styled(SUBPLOT_POINTS, 4)),
+    ]
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark der PlotStyle-Methoden.")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Wiederholungen pro Messung")
+    parser.add_argument("--quick", action="store_true", help="nur kleine Größen")
+    parser.add_argument("-k", "--filter", default="", help="nur Messungen, deren Name dies enthält")
+    parser.add_argument("--json", type=Path, help="Ergebnisdatei (Standard: results/styling-<Zeit>.json)")
+    parser.add_argument("--compare", type=Path, help="früherer Lauf als Vergleich")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, params, func, setup in cases(args.quick):
+        if args.filter not in name:
+            continue
+        # große savefig-Läufe dauern Sekunden → weniger Wiederholungen
+        repeat = args.repeat if name != "savefig" or params["points"] < 10**6 else max(1, args.repeat // 2)
+        results.append({"name": name, "params": params, **measure(func, setup, repeat=repeat)})
+        print(f"  {name} {params}", file=sys.stderr)
+
+    print_table(results)
+    path = save_results("styling", results, args.json)
+    print(f"\nErgebnisse: {path}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
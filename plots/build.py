@@ -0,0 +1,569 @@
+"""
+Inkrementeller Build aller Abbildungs-Skripte.
+
+Jedes Plot-Skript unter ``plots/`` und ``source/dev/**`` erzeugt seine
+PNG-/HTML-Dateien beim Ausführen selbst. Dieses Skript findet alle diese
+Skripte, bildet pro Skript einen Hash aus
+
+- dem eigenen Quelltext,
+- allen lokal importierten Hilfsmodulen (z. B. dem Paket ``beautyplot``),
+- referenzierten Eingabedateien (Dateipfade als String-Literale) und
+- den Versionen der Plot-Bibliotheken
+
+und führt nur die Skripte erneut aus, deren Hash sich geändert hat oder
+deren Ausgaben in ``source/_static/plots/...`` fehlen bzw. verändert wurden.
+
+Aufruf (aus dem Projektroot):
+
+    python plots/build.py             # nur veraltete Abbildungen erzeugen
+    python plots/build.py -j 16       # mit 16 parallelen Worker-Prozessen
+    python plots/build.py --daemon    # über den laufenden Render-Daemon (renderd.py)
+    python plots/build.py --force     # alle Abbildungen neu erzeugen
+    python plots/build.py --list      # Status anzeigen, nichts ausführen
+    python plots/build.py fourier     # nur Skripte, deren Pfad 'fourier' enthält
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+
+
+def find_project_root(start: Path | None = None) -> Path:
+    """
+    Findet den Projektroot, indem nach einem Ordner gesucht wird,
+    der sowohl 'source' als auch 'plots' enthält.
+    """
+    here = (start or Path(__file__).resolve())
+    for p in [here] + list(here.parents):
+        if (p / "source").is_dir() and (p / "plots").is_dir():
+            return p
+    raise RuntimeError(
+        "Projektroot nicht gefunden. Erwartet Ordnerstruktur mit 'source/' und 'plots/' im selben Verzeichnis."
+    )
+
+PROJECT_ROOT = find_project_root()
+SOURCE_DIR = PROJECT_ROOT / "source"
+PLOTS_DIR = PROJECT_ROOT / "plots"
+
+# Buchführung über Hashes und erzeugte Dateien (lokal, nicht eingecheckt: eine
+# frische Arbeitskopie baut einmal alles neu)
+MANIFEST_PATH = PLOTS_DIR / ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+# -- Suchmuster für Plot-Skripte -----------------------------------------------
+# (Basisordner, Glob-Muster). In plots/ liegen die Hilfsmodule (build.py, ...)
+# direkt im Ordner, Plot-Skripte nur in Unterordnern. Ordner mit __init__.py
+# sind Pakete (z. B. beautyplot/) und enthalten keine Plot-Skripte.
+SCRIPT_GLOBS: list[tuple[Path, str]] = [
+    (PLOTS_DIR, "*/**/*.py"),
+    (SOURCE_DIR / "dev", "**/plots/*.py"),
+    (SOURCE_DIR / "dev", "**/plot_*.py"),
+]
+
+# Ein Skript zählt nur als Plot-Skript, wenn es (nicht auskommentiert) speichert
+_OUTPUT_RE = re.compile(
+    r"^[^#\n]*(\.(savefig|write_html|write_image|export)|write_plotly_html)\(", re.MULTILINE,
+)
+
+# Bibliotheken, deren Version in den Hash eingeht (andere Version → neu rendern)
+_LIBRARIES = ("matplotlib", "numpy", "scipy", "plotly")
+
+
+# ==============================================================================
+# Skripte finden & hashen
+# ==============================================================================
+def discover_scripts() -> list[Path]:
+    """Liefert alle Plot-Skripte (sortiert, ohne Duplikate)."""
+    found: set[Path] = set()
+    for base, pattern in SCRIPT_GLOBS:
+        if not base.is_dir():
+            continue
+        for path in base.glob(pattern):
+            if "__pycache__" in path.parts or not path.is_file():
+                continue
+            if _in_package(path, base):
+                continue
+            if _OUTPUT_RE.search(path.read_text(encoding="utf-8")):
+                found.add(path.resolve())
+    return sorted(found)
+
+
+def _in_package(path: Path, base: Path) -> bool:
+    """True, wenn 'path' (unterhalb von 'base') in einem Python-Paket liegt."""
+    for parent in path.parents:
+        if parent == base:
+            return False
+        if (parent / "__init__.py").is_file():
+            return True
+    return False
+
+
+def _rel(path: Path) -> str:
+    """Pfad relativ zum Projektroot (mit '/' als Trenner)."""
+    return path.resolve().relative_to(PROJECT_ROOT).as_posix()
+
+
+def _resolve_module(name: str, search_dirs: list[Path]) -> Path | None:
+    """Sucht ein lokales Modul 'a.b' als a/b.py oder a/b/__init__.py."""
+    parts = name.split(".")
+    for base in search_dirs:
+        candidate = base.joinpath(*parts)
+        for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+            if path.is_file():
+                return path.resolve()
+    return None
+
+
+def _dependencies(script: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Ermittelt (transitiv) die lokal importierten Hilfsmodule und die als
+    String-Literal referenzierten Eingabedateien eines Skripts.
+    """
+    helpers: list[Path] = []
+    inputs: list[Path] = []
+    todo = [script.resolve()]
+    seen = set(todo)
+
+    while todo:
+        current = todo.pop()
+        tree = ast.parse(current.read_text(encoding="utf-8"), filename=str(current))
+        search_dirs = [current.parent, PLOTS_DIR]
+
+        for node in ast.walk(tree):
+            names: list[str] = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            elif isinstance(node, ast.ImportFrom):
+                # relativer Import innerhalb eines Pakets (from .x import y)
+                package = current.parents[node.level - 1]
+                targets = [node.module] if node.module else [a.name for a in node.names]
+                for target in targets:
+                    module = _resolve_module(target, [package])
+                    if module is not None and module not in seen:
+                        seen.add(module)
+                        helpers.append(module)
+                        todo.append(module)
+                continue
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                value = node.value
+                if 0 < len(value) < 256 and "\n" not in value and "." in value:
+                    path = (current.parent / value)
+                    if path.suffix != ".py" and path.is_file():
+                        inputs.append(path.resolve())
+                continue
+
+            for name in names:
+                module = _resolve_module(name, search_dirs)
+                if module is None:
+                    continue
+                # Paket: alle Module mitnehmen (auch lazy per __getattr__ geladene)
+                modules = [module]
+                if module.name == "__init__.py":
+                    modules += sorted(module.parent.rglob("*.py"))
+                for module in modules:
+                    module = module.resolve()
+                    if module not in seen and "__pycache__" not in module.parts:
+                        seen.add(module)
+                        helpers.append(module)
+                        todo.append(module)
+
+    return sorted(helpers), sorted(set(inputs))
+
+
+def _environment_key() -> str:
+    """Python- und Bibliotheksversionen als Teil des Hashes."""
+    versions = [f"python={sys.version_info.major}.{sys.version_info.minor}"]
+    for lib in _LIBRARIES:
+        try:
+            versions.append(f"{lib}={metadata.version(lib)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{lib}=-")
+    return ";".join(versions)
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def script_hash(script: Path, env_key: str | None = None) -> str:
+    """Hash über Skript, Hilfsmodule, Eingabedateien und Umgebung."""
+    helpers, inputs = _dependencies(script)
+    h = hashlib.sha256()
+    h.update((env_key if env_key is not None else _environment_key()).encode())
+    for path in [script.resolve(), *helpers, *inputs]:
+        h.update(b"\0" + _rel(path).encode() + b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+# ==============================================================================
+# Manifest
+# ==============================================================================
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    """Lädt das Manifest; bei fehlender/inkompatibler Datei ein leeres."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "scripts": {}}
+    if data.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "scripts": {}}
+    return data
+
+
+def save_manifest(manifest: dict, path: Path = MANIFEST_PATH) -> None:
+    """Schreibt das Manifest atomar (erst temporär, dann umbenennen)."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def is_current(entry: dict | None, digest: str) -> bool:
+    """True, wenn Hash passt und alle Ausgaben unverändert vorhanden sind."""
+    if not entry or entry.get("hash") != digest or not entry.get("outputs"):
+        return False
+    for rel, out_digest in entry["outputs"].items():
+        path = PROJECT_ROOT / rel
+        if not path.is_file() or _file_digest(path) != out_digest:
+            return False
+    return True
+
+
+# ==============================================================================
+# Skripte ausführen
+# ==============================================================================
+@dataclass
+class ScriptResult:
+    """Ergebnis eines Skriptlaufs."""
+    script: Path
+    ok: bool
+    seconds: float
+    outputs: list[Path] = field(default_factory=list)
+    error: str = ""
+    png_sizes: dict[str, tuple[int, int]] = field(default_factory=dict)  # Datei -> (vorher, nachher)
+
+
+# Audit-Ereignis, mit dem Hilfsmodule eine (unverändert gebliebene) Ausgabe melden
+OUTPUT_AUDIT_EVENT = "plots.output"
+
+# aktive Aufzeichnungen geschriebener Dateien (siehe _record_writes)
+_active_recordings: list[set[str]] = []
+_hook_installed = False
+
+
+def _write_hook(event: str, args: tuple) -> None:
+    """
+    Audit-Hook, der alle zum Schreiben geöffneten Dateien in die aktiven
+    Aufzeichnungen einträgt. So müssen Skripte ihre Ausgabepfade nicht melden.
+
+    Atomar geschriebene Dateien (``*.tmp`` → ``os.replace``) werden über das
+    Ziel der Umbenennung erfasst, unverändert gebliebene Ausgaben über das
+    Ereignis ``OUTPUT_AUDIT_EVENT`` (siehe ``beautyplot.files``).
+    """
+    if not args or not _active_recordings:
+        return
+    if event in ("os.rename", OUTPUT_AUDIT_EVENT):
+        target = args[1] if event == "os.rename" else args[0]
+        if isinstance(target, (str, bytes, os.PathLike)):
+            _active_recordings[-1].add(os.path.abspath(os.fsdecode(target)))
+        return
+    if event != "open":
+        return
+    path, mode, flags = (tuple(args) + (None, None))[:3]
+    if not isinstance(path, (str, bytes, os.PathLike)):
+        return  # z. B. Dateideskriptor
+    if isinstance(mode, str):
+        writing = any(c in mode for c in "wax+")
+    else:
+        write_flags = os.O_WRONLY | os.O_RDWR | os.O_CREAT | os.O_APPEND
+        writing = isinstance(flags, int) and bool(flags & write_flags)
+    if writing:
+        _active_recordings[-1].add(os.path.abspath(os.fsdecode(path)))
+
+
+@contextmanager
+def _record_writes() -> Iterator[set[str]]:
+    """
+    Zeichnet im ``with``-Block alle geschriebenen Dateien auf. Der Audit-Hook
+    wird nur einmal pro Prozess registriert (er lässt sich nicht entfernen).
+    """
+    global _hook_installed
+    if not _hook_installed:
+        sys.addaudithook(_write_hook)
+        _hook_installed = True
+    written: set[str] = set()
+    _active_recordings.append(written)
+    try:
+        yield written
+    finally:
+        _active_recordings.remove(written)
+
+
+def execute_script(script: Path) -> list[Path]:
+    """
+    Führt ein Plot-Skript im *aktuellen* Prozess aus (Agg-Backend) und gibt
+    die dabei geschriebenen Dateien innerhalb des Projekts zurück.
+
+    ``sys.path``, ``sys.argv`` und das Arbeitsverzeichnis werden danach
+    wiederhergestellt; matplotlib-Zustand (rcParams, offene Figures) bleibt
+    dagegen bestehen, siehe ``run_scripts`` bzw. ``renderd.py``.
+    """
+    import runpy
+
+    os.environ["MPLBACKEND"] = "Agg"
+    script = script.resolve()
+    saved_path, saved_argv, cwd = list(sys.path), list(sys.argv), os.getcwd()
+    sys.path.insert(0, str(script.parent))
+    sys.argv = [str(script)]
+    os.chdir(script.parent)
+    try:
+        with _record_writes() as written:
+            runpy.run_path(str(script), run_name="__main__")
+    finally:
+        os.chdir(cwd)
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+
+    outputs = []
+    for name in sorted(written):
+        path = Path(name)
+        if (path.is_file() and path.suffix not in (".pyc", ".tmp")
+                and PROJECT_ROOT in path.parents and path != MANIFEST_PATH):
+            outputs.append(path)
+    return outputs
+
+
+def optimize_outputs(outputs: list[Path]) -> dict[str, tuple[int, int]]:
+    """
+    Optimiert alle erzeugten PNGs verlustfrei (siehe ``beautyplot.pngopt``).
+
+    Danach sind die Bytes nur noch von den Pixeln abhängig: Ein erneuter
+    Lauf mit gleichem Bild ändert die Datei nicht.
+
+    Rückgabe
+    --------
+    dict[str, tuple[int, int]]
+        Relativer Pfad -> (Bytes vorher, Bytes nachher).
+    """
+    from beautyplot.pngopt import optimize_png
+
+    return {_rel(p): optimize_png(p) for p in outputs if p.suffix.lower() == ".png"}
+
+
+def _init_worker() -> None:
+    """Initialisiert einen Worker-Prozess: Agg erzwingen, kein GUI-Backend."""
+    os.environ["MPLBACKEND"] = "Agg"
+
+
+def _run_in_worker(script: str) -> tuple[bool, float, list[str], str, dict[str, tuple[int, int]]]:
+    """
+    Führt ein Skript im Worker aus und optimiert die erzeugten PNGs. Ausgaben
+    des Skripts (print) werden abgefangen und nur im Fehlerfall zurückgegeben.
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log), redirect_stderr(log):
+            outputs = execute_script(Path(script))
+            png_sizes = optimize_outputs(outputs)
+    except BaseException:  # auch SystemExit aus dem Skript abfangen
+        lines = (log.getvalue() + traceback.format_exc()).strip().splitlines()
+        return False, time.perf_counter() - start, [], "\n".join(lines[-15:]), {}
+    return True, time.perf_counter() - start, [str(p) for p in outputs], "", png_sizes
+
+
+def run_scripts(scripts: list[Path], jobs: int | None = None) -> Iterator[ScriptResult]:
+    """
+    Führt Skripte parallel in einem Prozess-Pool aus.
+
+    Jeder Worker wird per 'spawn' gestartet und nach genau einem Skript
+    beendet (``max_tasks_per_child=1``). Damit läuft jedes Skript in einem
+    frischen Interpreter, globale Zustände wie ``plt.rcParams`` (siehe
+    ``PlotStyle.set_font``) können sich nicht gegenseitig beeinflussen.
+    Innerhalb eines Prozesses vermeiden ``PlotStyle.font_context`` bzw.
+    ``PlotStyle.apply_font`` diese globalen Änderungen.
+
+    Parameters
+    ----------
+    scripts : list[Path]
+        Auszuführende Skripte.
+    jobs : int | None
+        Anzahl paralleler Worker (None → Anzahl CPU-Kerne).
+
+    Yields
+    ------
+    ScriptResult
+        Ergebnisse in der Reihenfolge ihrer Fertigstellung.
+    """
+    if not scripts:
+        return
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(scripts)))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = {pool.submit(_run_in_worker, str(s)): s for s in scripts}
+        for future in as_completed(futures):
+            ok, seconds, outputs, error, png_sizes = future.result()
+            yield ScriptResult(futures[future], ok, seconds, [Path(p) for p in outputs], error, png_sizes)
+
+
+def run_scripts_via_daemon(scripts: list[Path]) -> Iterator[ScriptResult]:
+    """Lässt einen laufenden Render-Daemon (``renderd.py``) die Skripte ausführen."""
+    import renderd
+
+    for script in scripts:
+        result = renderd.render([script])[0]
+        yield ScriptResult(
+            script, result["ok"], result["seconds"],
+            [Path(p) for p in result["outputs"]], result["error"],
+            {rel: tuple(sizes) for rel, sizes in result.get("png_sizes", {}).items()},
+        )
+
+
+def run_script(script: Path) -> ScriptResult:
+    """Führt ein einzelnes Skript isoliert in einem eigenen Prozess aus."""
+    return next(run_scripts([script], jobs=1))
+
+
+# ==============================================================================
+# Build
+# ==============================================================================
+def build(
+    patterns: list[str] | None = None,
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    jobs: int | None = None,
+    daemon: bool = False,
+) -> list[ScriptResult]:
+    """
+    Erzeugt alle veralteten Abbildungen.
+
+    Parameters
+    ----------
+    patterns : list[str] | None
+        Nur Skripte, deren relativer Pfad einen der Teilstrings enthält.
+    force : bool
+        Alle ausgewählten Skripte unabhängig vom Hash ausführen.
+    dry_run : bool
+        Nur den Status ausgeben, nichts ausführen.
+    jobs : int | None
+        Anzahl paralleler Worker-Prozesse (None → Anzahl CPU-Kerne).
+    daemon : bool
+        Skripte über einen laufenden Render-Daemon ausführen (schneller, da
+        ohne Importkosten). Läuft keiner, wird der Prozess-Pool verwendet.
+    """
+    manifest = load_manifest()
+    entries: dict = manifest["scripts"]
+    env_key = _environment_key()
+
+    scripts = discover_scripts()
+    if patterns:
+        scripts = [s for s in scripts if any(p in _rel(s) for p in patterns)]
+
+    # veraltete Skripte bestimmen
+    digests: dict[Path, str] = {}
+    for script in scripts:
+        rel = _rel(script)
+        digest = script_hash(script, env_key)
+        if not force and is_current(entries.get(rel), digest):
+            print(f"[aktuell]  {rel}")
+        elif dry_run:
+            print(f"[veraltet] {rel}")
+        else:
+            digests[script] = digest
+    if dry_run:
+        return []
+
+    if daemon:
+        import renderd
+        if not renderd.is_running():
+            print("Kein Render-Daemon erreichbar, verwende Prozess-Pool.")
+            daemon = False
+    runner = run_scripts_via_daemon(list(digests)) if daemon else run_scripts(list(digests), jobs=jobs)
+
+    from beautyplot.pngopt import format_report
+
+    results: list[ScriptResult] = []
+    png_before = png_after = 0
+    try:
+        for result in runner:
+            results.append(result)
+            rel = _rel(result.script)
+            if result.ok:
+                entries[rel] = {
+                    "hash": digests[result.script],
+                    "outputs": {_rel(p): _file_digest(p) for p in result.outputs},
+                }
+                print(f"[erzeugt]  {rel} ({result.seconds:.1f} s, {len(result.outputs)} Datei(en))")
+                for png, (before, after) in result.png_sizes.items():
+                    png_before += before
+                    png_after += after
+                    print(f"           {format_report(png, before, after)}")
+            else:
+                entries.pop(rel, None)
+                print(f"[Fehler]   {rel} ({result.seconds:.1f} s)\n{result.error}")
+    finally:
+        # Einträge gelöschter Skripte entfernen
+        known = {_rel(s) for s in discover_scripts()}
+        for rel in list(entries):
+            if rel not in known:
+                del entries[rel]
+        save_manifest(manifest)
+
+    if png_before:
+        print(f"PNG-Optimierung: {format_report('gesamt', png_before, png_after)}")
+    return results
+
+
+def _positive_int(value: str) -> int:
+    """argparse-Typ für Anzahlen ≥ 1 (z. B. -j 0 ablehnen statt still alle Kerne)."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein: {value}")
+    return number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Inkrementeller Build aller Abbildungen.")
+    parser.add_argument("patterns", nargs="*", help="nur Skripte, deren Pfad diesen Text enthält")
+    parser.add_argument("--force", action="store_true", help="alle Skripte neu ausführen")
+    parser.add_argument("--list", action="store_true", help="nur Status anzeigen")
+    parser.add_argument("-j", "--jobs", type=_positive_int, default=None,
+                        help="Anzahl paralleler Worker (Standard: Anzahl CPU-Kerne)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="über den laufenden Render-Daemon ausführen (renderd.py)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = build(
+        args.patterns, force=args.force, dry_run=args.list, jobs=args.jobs, daemon=args.daemon,
+    )
+    failed = [r for r in results if not r.ok]
+    if results:
+        wall = time.perf_counter() - start
+        print(f"\n{len(results) - len(failed)} erzeugt, {len(failed)} fehlgeschlagen ({wall:.1f} s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+fourier – gemeinsame Hilfsmittel für die Fourier-Reihen-Abbildungen.
+
+Die Inhalte werden wie bei ``beautyplot`` erst beim ersten Zugriff geladen
+(PEP 562).
+
+Module:
+    series   FourierSeries, Kosinus-Komponenten und Partialsummen (numpy)
+    signals  Beispielsignale (Rechteck, Rampe, Mischsignal) mit exakten Koeffizienten
+    slider   Plotly-Slider, deren Kurven der Browser aus den Koeffizienten berechnet
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .series import (FourierSeries, LeakageReport, cosine_components, evaluate,
+                         fast_length, leakage_report, partial_sums)
+    from .signals import analytic_series
+    from .slider import kernel_script, kernel_steps
+
+# öffentlicher Name -> Untermodul
+_LAZY = {
+    "FourierSeries": "series",
+    "cosine_components": "series",
+    "partial_sums": "series",
+    "evaluate": "series",
+    "fast_length": "series",
+    "leakage_report": "series",
+    "LeakageReport": "series",
+    "analytic_series": "signals",
+    "kernel_script": "slider",
+    "kernel_steps": "slider",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value  # nächster Zugriff ohne __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,87 @@
+"""
+Beispielsignale der Fourier-Reihen-Abbildungen (Periode T = 2).
+
+Zu jedem Signal gibt es die analytischen Koeffizienten der Reihe
+
+    f(x) = DC + Σ_k a_k cos(k ω0 x) + b_k sin(k ω0 x),   ω0 = π
+
+als :class:`~fourier.series.FourierSeries` über :func:`analytic_series`.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from .series import FourierSeries
+
+PERIOD = 2.0
+OMEGA0 = 2 * np.pi / PERIOD
+
+
+def _phase(x: np.ndarray) -> np.ndarray:
+    """x auf eine Periode [-1, 1) zurückgefaltet."""
+    return ((np.asarray(x, dtype=float) + 1) % PERIOD) - 1
+
+
+# ------------------------------------------------------------------
+#  Signale
+# ------------------------------------------------------------------
+def rechteck(x: np.ndarray) -> np.ndarray:
+    """Rechtecksignal (gerade): 0,5 für |x| ≤ 0,5, sonst -0,5."""
+    return np.where(np.abs(_phase(x)) <= 0.5, 0.5, -0.5)
+
+
+def rampe(x: np.ndarray) -> np.ndarray:
+    """Rampensignal (ungerade): 0,5 · x auf [-1, 1)."""
+    return 0.5 * _phase(x)
+
+
+def mischsignal(x: np.ndarray) -> np.ndarray:
+    """Rechteck plus ungerade Verzerrung 0,3 · sin(π x) (keine Symmetrie)."""
+    x_mod = _phase(x)
+    return np.where(np.abs(x_mod) <= 0.5, 0.5, -0.5) + 0.3 * np.sin(np.pi * x_mod)
+
+
+# ------------------------------------------------------------------
+#  Analytische Koeffizienten
+# ------------------------------------------------------------------
+def _rechteck_ab(k: np.ndarray) -> tuple[float, np.ndarray, np.ndarray]:
+    # a_k = ∫_{-1/2}^{1/2} cos(kπx) dx = 2 sin(kπ/2) / (kπ)
+    return 0.0, 2 * np.sin(k * np.pi / 2) / (k * np.pi), np.zeros(k.size)
+
+
+def _rampe_ab(k: np.ndarray) -> tuple[float, np.ndarray, np.ndarray]:
+    # b_k = ∫_{-1}^{1} x/2 · sin(kπx) dx = (-1)^(k+1) / (kπ)
+    return 0.0, np.zeros(k.size), (-1.0) ** (k + 1) / (k * np.pi)
+
+
+def _mischsignal_ab(k: np.ndarray) -> tuple[float, np.ndarray, np.ndarray]:
+    DC, a, b = _rechteck_ab(k)
+    return DC, a, np.where(k == 1, 0.3, b)   # sin(πx) ist genau die erste Harmonische
+
+
+# Signal → analytische Koeffizienten (DC, a_k, b_k) für k = 1..n
+ANALYTIC = {
+    rechteck: _rechteck_ab,
+    rampe: _rampe_ab,
+    mischsignal: _mischsignal_ab,
+}
+
+
+def analytic_series(signal, n_terms: int) -> FourierSeries:
+    """
+    Fourier-Reihe eines der Beispielsignale aus den exakten Koeffizienten.
+
+    Parameters
+    ----------
+    signal : Callable
+        :func:`rechteck`, :func:`rampe` oder :func:`mischsignal`.
+    n_terms : int
+        Anzahl der Harmonischen.
+    """
+    try:
+        coefficients = ANALYTIC[signal]
+    except KeyError:
+        raise ValueError(f"Keine analytischen Koeffizienten für {signal!r}") from None
+    k = np.arange(1, n_terms + 1, dtype=float)
+    DC, a, b = coefficients(k)
+    return FourierSeries.from_ab(DC, a, b, OMEGA0)
@@ -0,0 +1,143 @@
+"""
+Fourier-Slider mit clientseitiger Berechnung der Kurven.
+
+Die Slider-Abbildungen zeigen für n = 0..N die Kosinus-Komponenten und die
+Partialsumme ``DC + Σ A_k cos(k ω0 (x - x0) + φ_k)``. Werden alle Kurven
+vorberechnet eingebettet, wächst die HTML-Datei mit O(N · Stützstellen).
+
+Hier werden stattdessen nur ``DC, A, φ, ω0, x0`` und die x-Achse (als
+Start/Ende/Anzahl) eingebettet. Ein kleines Skript berechnet beim Laden und
+bei jeder Slider-Änderung die sichtbaren Komponenten (einmal je k, danach aus
+dem Cache) und die Partialsumme und setzt sie per ``Plotly.restyle``. Die
+Dateigröße hängt damit nur noch von der Anzahl der Traces ab, nicht mehr von
+den Daten – auch 100+ Harmonische bleiben klein.
+
+Verwendung (Traces für Komponenten und Summe mit leeren Daten anlegen):
+
+    steps = kernel_steps(n_terms)
+    script = kernel_script(x, DC, A[:n_terms], phi[:n_terms], omega0, x0,
+                           dc_trace=0, component_traces=range(1, n_terms + 1),
+                           sum_trace=n_terms + 2)
+    write_plotly_html(fig, path, post_script=script)
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+
+import numpy as np
+
+# {plot_id} ersetzt plotly.io.to_html durch die ID des Plot-Containers
+_KERNEL_JS = """\
+(function () {{
+    var gd = document.getElementById('{{plot_id}}');
+    var C = {coeffs};
+    var N = C.uniform ? C.x[2] : C.x.length;
+    var x = new Float64Array(N);
+    for (var i = 0; i < N; i++) {{
+        x[i] = C.uniform ? C.x[0] + (C.x[1] - C.x[0]) * i / Math.max(N - 1, 1) : C.x[i];
+    }}
+    var comps = [];
+    function component(k) {{
+        if (!comps[k]) {{
+            var y = new Float64Array(N), a = C.A[k - 1], w = k * C.omega0, p = C.phi[k - 1];
+            for (var i = 0; i < N; i++) y[i] = a * Math.cos(w * (x[i] - C.x0) + p);
+            comps[k] = y;
+        }}
+        return comps[k];
+    }}
+    function show(n) {{
+        var s = new Float64Array(N).fill(C.DC), xs = [], ys = [], vis = [], idx = [];
+        for (var k = 1; k <= n; k++) {{
+            var y = component(k);
+            for (var i = 0; i < N; i++) s[i] += y[i];
+        }}
+        if (C.dc !== null) {{
+            idx.push(C.dc); xs.push(x); ys.push(new Float64Array(N).fill(C.DC)); vis.push(true);
+        }}
+        C.comps.forEach(function (t, j) {{
+            idx.push(t); xs.push(x); ys.push(j < n ? component(j + 1) : []); vis.push(j < n);
+        }});
+        idx.push(C.sum); xs.push(x); ys.push(s); vis.push(true);
+        Plotly.restyle(gd, {{x: xs, y: ys, visible: vis}}, idx);
+    }}
+    show(C.active);
+    gd.on('plotly_sliderchange', function (e) {{ show(+e.step.value); }});
+}})();"""
+
+
+def kernel_steps(n_terms: int) -> list[dict]:
+    """
+    Slider-Schritte n = 0..n_terms für :func:`kernel_script`.
+
+    Die Schritte ändern selbst nichts an der Figure (``method="skip"``); das
+    Skript reagiert auf ``plotly_sliderchange`` und liest ``step.value``.
+    """
+    return [dict(method="skip", args=[None], label=str(n), value=str(n))
+            for n in range(n_terms + 1)]
+
+
+def _x_spec(x: np.ndarray) -> tuple[list[float], bool]:
+    """Äquidistante x-Achsen als [Start, Ende, Anzahl], sonst alle Werte."""
+    if x.size >= 2 and np.allclose(np.diff(x), (x[-1] - x[0]) / (x.size - 1),
+                                   rtol=1e-9, atol=0.0):
+        return [float(x[0]), float(x[-1]), int(x.size)], True
+    return x.tolist(), False
+
+
+def kernel_script(
+    x: np.ndarray,
+    DC: float,
+    A: np.ndarray,
+    phi: np.ndarray,
+    omega0: float,
+    x0: float,
+    *,
+    dc_trace: int | None,
+    component_traces: Iterable[int],
+    sum_trace: int,
+    active: int = 0,
+) -> str:
+    """
+    JavaScript, das Komponenten und Partialsumme im Browser berechnet.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Stützstellen der Darstellung (äquidistant → nur 3 Zahlen eingebettet).
+    DC, A, phi, omega0, x0 :
+        Koeffizienten der Reihe ``DC + Σ A[k-1] cos(k ω0 (x - x0) + phi[k-1])``.
+    dc_trace : int | None
+        Index des Traces für den Gleichanteil (None: keiner).
+    component_traces : Iterable[int]
+        Trace-Indizes der Harmonischen k = 1, 2, ... (höchstens len(A)).
+    sum_trace : int
+        Index des Traces für die Partialsumme.
+    active : int
+        Anfangsstellung des Sliders.
+
+    Rückgabe
+    --------
+    str
+        Skript für ``write_plotly_html(..., post_script=...)``.
+    """
+    x = np.asarray(x, dtype=float)
+    A = np.asarray(A, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    component_traces = [int(t) for t in component_traces]
+    if A.shape != phi.shape or len(component_traces) > A.size:
+        raise ValueError("A und phi müssen gleich lang sein und mindestens "
+                         "so viele Einträge haben wie component_traces")
+    if not 0 <= active <= len(component_traces):
+        raise ValueError(f"active muss in 0..{len(component_traces)} liegen, nicht {active}")
+
+    xs, uniform = _x_spec(x)
+    n = len(component_traces)
+    coeffs = {
+        "x": xs, "uniform": uniform,
+        "DC": float(DC), "A": A[:n].tolist(), "phi": phi[:n].tolist(),
+        "omega0": float(omega0), "x0": float(x0),
+        "dc": dc_trace, "comps": component_traces, "sum": sum_trace,
+        "active": active,
+    }
+    return _KERNEL_JS.format(coeffs=json.dumps(coeffs, separators=(",", ":")))
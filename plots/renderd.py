@@ -0,0 +1,258 @@
+"""
+Render-Daemon für Abbildungs-Skripte.
+
+Der größte Teil der Laufzeit eines einzelnen Plot-Skripts ist der Import von
+matplotlib, numpy, scipy und plotly. Dieser Daemon lädt diese Module einmal,
+bleibt im Hintergrund aktiv und führt Skripte auf Anfrage aus. Zwischen zwei
+Aufträgen werden ``rcParams`` zurückgesetzt, alle Figures geschlossen und
+geänderte lokale Hilfsmodule (z. B. ``beautyplot``) neu geladen.
+
+Protokoll: eine TCP-Verbindung auf 127.0.0.1, pro Zeile ein JSON-Objekt.
+Ausgeführt werden nur Plot-Skripte des Projekts (``build.discover_scripts``);
+andere Pfade und fehlerhafte Anfragen werden mit ``"ok": false`` beantwortet.
+
+    → {"script": "plots/mechanik/lagrange/Energie_Federpendel.py"}
+    ← {"ok": true, "seconds": 0.41, "outputs": ["..."], "error": "",
+       "png_sizes": {"source/_static/plots/...png": [123456, 98765]}}
+
+    → {"cmd": "ping"}       ← {"ok": true}
+    → {"cmd": "shutdown"}   ← {"ok": true}
+
+Aufruf (aus dem Projektroot):
+
+    python plots/renderd.py serve             # Daemon starten
+    python plots/renderd.py render SKRIPT...  # Skripte rendern lassen
+    python plots/renderd.py stop              # Daemon beenden
+
+Zusammen mit ``python plots/build.py --daemon`` als ``--pre-build`` von
+``sphinx-autobuild`` (siehe ``Autobuild-aktivieren.bat``) werden geänderte
+Abbildungen beim Speichern ohne Importkosten neu erzeugt.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import io
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import build
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Module, die beim Start vorgeladen werden (fehlende werden übersprungen)
+PRELOAD = (
+    "numpy",
+    "matplotlib.pyplot",
+    "matplotlib.patches",
+    "matplotlib.ticker",
+    "scipy.io.wavfile",
+    "plotly.graph_objects",
+    "plotly.subplots",
+    "plotly.express",
+    "beautyplot.style",
+    "beautyplot.ticker",
+    "beautyplot.extent",
+    "beautyplot.decimate",
+    "beautyplot.export",
+    "beautyplot.pngopt",
+    "beautyplot.plotly_html",
+)
+
+
+# ==============================================================================
+# Server
+# ==============================================================================
+class RenderServer:
+    """Hält die Plot-Bibliotheken geladen und führt Skripte nacheinander aus."""
+
+    def __init__(self) -> None:
+        os.environ["MPLBACKEND"] = "Agg"
+        if str(build.PLOTS_DIR) not in sys.path:
+            sys.path.insert(0, str(build.PLOTS_DIR))
+
+        for name in PRELOAD:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+
+        import matplotlib
+        matplotlib.use("Agg")
+        # Ausgangszustand, auf den vor jedem Auftrag zurückgesetzt wird
+        self._rc_defaults = dict(matplotlib.rcParams.copy())
+        self._mtimes = self._local_module_mtimes()
+        # bekannte Plot-Skripte; neu gesucht nur, wenn ein Pfad fehlt (neues Skript)
+        self._scripts = set(build.discover_scripts())
+
+    # -- Zustand zwischen Aufträgen ---------------------------------------------
+    @staticmethod
+    def _local_module_mtimes() -> dict[str, float]:
+        """Änderungszeitpunkte aller geladenen Module aus dem Projekt."""
+        mtimes: dict[str, float] = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if not path or name == "__main__":
+                continue
+            path = Path(path).resolve()
+            if build.PROJECT_ROOT in path.parents and path.is_file():
+                mtimes[name] = path.stat().st_mtime
+        return mtimes
+
+    def _reset(self) -> None:
+        """rcParams zurücksetzen, Figures schließen, geänderte Module entladen."""
+        import matplotlib
+        import matplotlib.pyplot as plt
+
+        plt.close("all")
+        dict.update(matplotlib.rcParams, self._rc_defaults)  # wie rc_context: ohne Validierung
+
+        # geänderte Module samt ihrem Paket entladen → beim nächsten Import neu
+        changed = {
+            name.partition(".")[0]
+            for name, mtime in self._local_module_mtimes().items()
+            if name not in ("build", __name__) and self._mtimes.get(name, mtime) != mtime
+        }
+        for name in list(sys.modules):
+            if name.partition(".")[0] in changed:
+                del sys.modules[name]
+        self._mtimes = self._local_module_mtimes()
+
+    # -- Aufträge ---------------------------------------------------------------
+    def render(self, script: str) -> dict:
+        """Führt ein Skript aus und liefert das Ergebnis als dict."""
+        self._reset()
+        start = time.perf_counter()
+        log = io.StringIO()
+        try:
+            with redirect_stdout(log), redirect_stderr(log):
+                outputs = build.execute_script(Path(script))
+                png_sizes = build.optimize_outputs(outputs)
+        except (Exception, SystemExit):  # auch sys.exit() im Skript; Strg+C beendet den Daemon
+            lines = (log.getvalue() + traceback.format_exc()).strip().splitlines()
+            return {"ok": False, "seconds": time.perf_counter() - start,
+                    "outputs": [], "error": "\n".join(lines[-15:])}
+        finally:
+            self._reset()
+        return {"ok": True, "seconds": time.perf_counter() - start,
+                "outputs": [str(p) for p in outputs], "error": "", "png_sizes": png_sizes}
+
+    def resolve_script(self, script: str) -> Path | None:
+        """Absoluter Pfad, wenn 'script' ein Plot-Skript des Projekts ist, sonst None."""
+        path = (build.PROJECT_ROOT / script).resolve()
+        if path not in self._scripts:
+            self._scripts = set(build.discover_scripts())
+        return path if path in self._scripts else None
+
+    def handle(self, request: object) -> tuple[dict, bool]:
+        """Bearbeitet eine Anfrage; zweiter Rückgabewert: Server beenden?"""
+        if not isinstance(request, dict):
+            return {"ok": False, "error": f"Anfrage muss ein JSON-Objekt sein: {request!r}"}, False
+        cmd = request.get("cmd", "render")
+        if cmd == "ping":
+            return {"ok": True}, False
+        if cmd == "shutdown":
+            return {"ok": True}, True
+        if cmd == "render" and isinstance(request.get("script"), str):
+            script = self.resolve_script(request["script"])
+            if script is None:
+                return {"ok": False, "error": f"Kein Plot-Skript des Projekts: {request['script']}"}, False
+            return self.render(str(script)), False
+        return {"ok": False, "error": f"Unbekannte Anfrage: {request!r}"}, False
+
+    def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Nimmt Verbindungen an, bis ein 'shutdown' empfangen wird."""
+        with socket.create_server((host, port)) as server:
+            print(f"Render-Daemon bereit auf {host}:{port}", flush=True)
+            stop = False
+            while not stop:
+                conn, _ = server.accept()
+                try:
+                    with conn, conn.makefile("rwb") as stream:
+                        for line in stream:
+                            try:
+                                response, stop = self.handle(json.loads(line))
+                            except Exception as exc:  # eine fehlerhafte Zeile beendet den Daemon nicht
+                                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                            stream.write(json.dumps(response).encode() + b"\n")
+                            stream.flush()
+                            if stop:
+                                break
+                except OSError:  # Client vor der Antwort getrennt → nächste Verbindung
+                    pass
+
+
+# ==============================================================================
+# Client
+# ==============================================================================
+def _request(payloads: list[dict], host: str, port: int, timeout: float | None) -> list[dict]:
+    """Sendet Anfragen über eine Verbindung und sammelt die Antworten."""
+    with socket.create_connection((host, port), timeout=1.0) as conn:
+        conn.settimeout(timeout)
+        with conn.makefile("rwb") as stream:
+            responses = []
+            for payload in payloads:
+                stream.write(json.dumps(payload).encode() + b"\n")
+                stream.flush()
+                responses.append(json.loads(stream.readline()))
+            return responses
+
+
+def is_running(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> bool:
+    """True, wenn ein Daemon auf host:port antwortet."""
+    try:
+        return _request([{"cmd": "ping"}], host, port, timeout=1.0)[0].get("ok", False)
+    except OSError:
+        return False
+
+
+def render(
+    scripts: list[Path],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> list[dict]:
+    """Lässt den Daemon die Skripte (nacheinander) ausführen."""
+    payloads = [{"cmd": "render", "script": str(Path(s).resolve())} for s in scripts]
+    return _request(payloads, host, port, timeout=None)
+
+
+def stop(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """Beendet einen laufenden Daemon."""
+    _request([{"cmd": "shutdown"}], host, port, timeout=5.0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Render-Daemon für Abbildungs-Skripte.")
+    parser.add_argument("command", choices=("serve", "render", "stop"))
+    parser.add_argument("scripts", nargs="*", help="Skripte für 'render'")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        RenderServer().serve_forever(args.host, args.port)
+        return 0
+    if args.command == "stop":
+        if is_running(args.host, args.port):
+            stop(args.host, args.port)
+        return 0
+
+    failed = 0
+    for script, result in zip(args.scripts, render(args.scripts, args.host, args.port)):
+        if result["ok"]:
+            print(f"[erzeugt]  {script} ({result['seconds']:.2f} s)")
+        else:
+            failed += 1
+            print(f"[Fehler]   {script}\n{result['error']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
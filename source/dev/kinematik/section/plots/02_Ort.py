@@ -14,9 +14,10 @@ def _find_source_dir(start: Path | None = None) -> Path:
 
 # --- source auf sys.path + Pfade ableiten ---------------------
 SOURCE_DIR = _find_source_dir()
-sys.path.insert(0, str(SOURCE_DIR))
+PLOTS_DIR = SOURCE_DIR.parent / "plots"   # beautyplot.py liegt in <root>/plots
+sys.path.insert(0, str(PLOTS_DIR))
 
-from plot.beautyplot import PlotStyle
+from beautyplot import PlotStyle
 
 # Ausgabe-Verzeichnis für Plots relativ zu source/
 FIG_DIR = SOURCE_DIR / "_static" / "plots" / "mechanik" / "kinematik"
@@ -43,8 +44,8 @@ axes[1].set_title("linear\n(gleichförmig)", fontsize=12)
 axes[2].plot(t, np.cos(t)+1, linewidth=2, color=ps.colors["blue"], zorder=3)
 axes[2].set_title("gekrümmt\n(beschleunigt)", fontsize=12)
 
+ps.style_figure(fig, axes, mode="origin")
 for ax in axes:
-    ps.origin_axes(fig, ax)
     ax.set_ylim(-0.2, 2.2)
     ax.set_xlim(-0.2, 10.2)
     ax.set_xlabel(r"$t$ [s]")
@@ -12,6 +12,10 @@ def _find_source_dir(start: Path | None = None) -> Path:
 
 # -- source auf sys.path + Pfade ableiten --------------------------------------
 SOURCE_DIR = _find_source_dir()
+PLOTS_DIR = SOURCE_DIR.parent / "plots"   # beautyplot/ liegt in <root>/plots
+sys.path.insert(0, str(PLOTS_DIR))
+
+from beautyplot import write_plotly_html
 
 # Ausgabe-Verzeichnis für Plots relativ zu source/
 FIG_DIR = SOURCE_DIR / "_static" / "plots" / "python" / "plotly"
@@ -20,8 +24,6 @@ FIG_DIR.mkdir(parents=True, exist_ok=True)
 HERE = Path(__file__).resolve()
 HTML_PATH = FIG_DIR / (HERE.stem + ".html")
 
-MATHJAX = SOURCE_DIR / "_static" / "js" / "mathjax" / "tex-chtml-full.js"
-
 # -- Plot ----------------------------------------------------------------------
 import numpy as np                # NumPy für numerische Berechnungen (Arrays, linspace, sin)
 import plotly.graph_objects as go # Plotly low-level API für interaktive Plots
@@ -44,9 +46,4 @@ fig.add_trace(    # Eine Spur (Trace) zur Figur hinzufügen
 fig.show() # Figur rendern und interaktiv anzeigen
 
 # -- Export --------------------------------------------------------------------
-fig.write_html(
-    HTML_PATH,
-    include_plotlyjs=True,     # Plotly lokal
-    include_mathjax="../../../js/mathjax/tex-chtml-full.js",   # MathJax lokal
-    full_html=True
-)
\ No newline at end of file
+write_plotly_html(fig, HTML_PATH)   # plotly.js & MathJax aus _static/js
\ No newline at end of file
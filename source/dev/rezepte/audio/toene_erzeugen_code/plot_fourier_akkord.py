@@ -19,9 +19,10 @@ def _find_source_dir(start: Path | None = None) -> Path:
 
 # --- source auf sys.path + Pfade ableiten ---------------------
 SOURCE_DIR = _find_source_dir()
-sys.path.insert(0, str(SOURCE_DIR))
+PLOTS_DIR = SOURCE_DIR.parent / "plots"   # beautyplot.py liegt in <root>/plots
+sys.path.insert(0, str(PLOTS_DIR))
 
-from plot.beautyplot import PlotStyle  # jetzt sicher importierbar
+from beautyplot import PlotStyle  # jetzt sicher importierbar
 
 # Ausgabe-Verzeichnis für Plots relativ zu source/
 FIG_DIR = SOURCE_DIR / "_static" / "plots" / "python" / "rezepte" / "audio"
@@ -1,4 +1,5 @@
 from pathlib import Path
+import sys
 
 # -- Hilfsfunktion: source-Verzeichnis finden ----------------------------------
 def _find_source_dir(start: Path | None = None) -> Path:
@@ -11,6 +12,11 @@ def _find_source_dir(start: Path | None = None) -> Path:
 
 # -- source auf sys.path + Pfade ableiten --------------------------------------
 SOURCE_DIR = _find_source_dir()
+PLOTS_DIR = SOURCE_DIR.parent / "plots"   # beautyplot/ liegt in <root>/plots
+sys.path.insert(0, str(PLOTS_DIR))
+
+from beautyplot import write_plotly_html
+from fourier import FourierSeries, kernel_script, kernel_steps, partial_sums, signals
 
 # Ausgabe-Verzeichnis für Plots relativ zu source/
 FIG_DIR = SOURCE_DIR / "_static" / "plots" / "analysis" / "transformationen" / "fourier-reihe"
@@ -19,8 +25,6 @@ FIG_DIR.mkdir(parents=True, exist_ok=True)
 HERE = Path(__file__).resolve()
 HTML_PATH = FIG_DIR / (HERE.stem + ".html")
 
-MATHJAX = SOURCE_DIR / "_static" / "js" / "mathjax" / "tex-chtml-full.js"
-
 # ==============================================================================
 # Plot erstellen
 # ==============================================================================
@@ -28,72 +32,39 @@ import numpy as np                          # Numerische Berechnung
 import plotly.graph_objects as go           # Plots (allgemein)
 from plotly.subplots import make_subplots   # Subplots
 
-# -- Hilfsfunktionen -----------------------------------------------------------
-def sig(x):
-    """punktsymmetrische Rampensignal (ungerade)"""
-    x = np.asarray(x, dtype=float)          # x als NumPy-Array
-    x_mod = ((x + 1) % 2) - 1               # Phase in [-1, 1)
-    return 0.5 * x_mod
-
-def cosine_components(x_eval, DC, A, phi, omega0, x0, n_terms=None):
-    """
-    Berechnet die Kosinus-Terme der Fourier-Reihe:
-    comps[0, :] = Gleichanteil
-    comps[k, :] = k-te Harmonische (k = 1, ..., n_terms)
-    """
-    x_eval = np.asarray(x_eval, dtype=float)    # Stützstellen in NumPy-Array
-    if n_terms is None or n_terms > len(A):     # n_terms ggf. begrenzen
-        print(f"Anzahl der Harmonischen wurde von {n_terms} auf {len(A)} angepasst")
-        n_terms = len(A)                        # maximale Anzahl setzen
-
-    N_x = x_eval.size                           # Anzahl der x-Stützstellen
-    comps = np.zeros((n_terms + 1, N_x), float) # 2D-Array: (DC + n_terms, N_x)
-    comps[0, :] = DC                            # Zeile 0: reiner Gleichanteil
-
-    t = x_eval - x0                             # Zeitachse relativ zu x0
-
-    for idx in range(n_terms):                  # Schleife über Harmonische
-        k = idx + 1                             # k = 1, 2, ..., n_terms
-        comps[idx + 1, :] = A[idx] * np.cos(    # WICHTIG: + phi[idx]
-            k * omega0 * t + phi[idx]
-        )
-
-    return comps
-
-# -- Signal für die FFT (eine Periode) -----------------------------------------
-x_fft = np.linspace(-1, 1, 500)  # Stützstellen im Intervall [-1, 1]
-y_fft = sig(x_fft)               # Rampensignal an diesen Stellen
+# -- Signal und Fourier-Koeffizienten ------------------------------------------
+sig = signals.rampe                 # Signal aus fourier.signals (Periode T = 2)
 
-# -- FFT für Fourier-Koeffizienten ---------------------------------------------
-N = len(x_fft)                  # Anzahl der Stützstellen
-dt = x_fft[1] - x_fft[0]        # Schrittweite Δt
-T = N * dt                      # Länge des FFT-Intervalls ≈ Periodenlänge
-x0 = x_fft[0]                   # Startpunkt (für die Phasenlage)
-
-Y = np.fft.fft(y_fft)           # FFT des Signals
-DC = Y[0].real / N              # Gleichanteil (Mittelwert)
-
-k_max = N // 2                  # Maximal nutzbare Harmonische (Nyquist)
-A = 2 * np.abs(Y[1:k_max]) / N  # Amplituden der Kosinus-Terme (ohne DC)
-phi = np.angle(Y[1:k_max])      # Phasen der Kosinus-Terme
-omega0 = 2 * np.pi / T          # Grundkreisfrequenz ω0 = 2π / T
+# rfft über genau eine Periode [-1, 1) (je Signal/Auflösung zwischengespeichert)
+N_FFT = 4096                        # Stützstellen (Zweierpotenz)
+series = FourierSeries.from_period(sig, signals.PERIOD, N_FFT, x0=-1.0)
+DC, A, phi = series.DC, series.A, series.phi    # Gleichanteil, Amplituden, Phasen
+omega0, x0 = series.omega0, series.x0           # Grundkreisfrequenz, Phasenbezug
 
 # -- Anzahl der Harmonischen für den Slider ------------------------------------
 n_terms_slider = 10                     # Slider soll 0..10 anzeigen
 n_terms = min(n_terms_slider, len(A))   # Sicherheitsbegrenzung
 
+# True: nur DC, A, phi, omega0, x0 einbetten, der Browser berechnet die Kurven
+# False: alle Komponenten und Partialsummen vorberechnet einbetten
+CLIENT_KERNEL = True
+
 # -- x-Achse für die Darstellung (-3..3, mehrere Perioden) ---------------------
 x_sig = np.linspace(-3, 3, 1000)    # Stützstellen für beide Plots
 y_sig = sig(x_sig)                  # Original-Rampensignal auf [-3, 3]
 
-# -- Kosinus-Komponenten auf x_sig berechnen -----------------------------------
-comps = cosine_components(x_sig, DC, A, phi, omega0, x0, n_terms=n_terms)
+if CLIENT_KERNEL:
+    # -- Leere Traces, Daten setzt das Skript aus kernel_script() --------------
+    x_comp = []                                 # x-Achse der berechneten Traces
+    comps = [[]] * (n_terms + 1)                # DC + n_terms Komponenten
+    y_approx_list = [[]]                        # eine Summenkurve für alle n
+else:
+    x_comp = x_sig
+    # -- Kosinus-Komponenten auf x_sig berechnen -------------------------------
+    comps = series.components(x_sig, n_terms)
 
-# -- Partielle Summen (DC + 1..n Harmonische) vorbereiten ----------------------
-y_approx_list = []                            # Liste der Approximationen
-for n in range(n_terms + 1):                  # n = 0..n_terms
-    y_approx_n = np.sum(comps[0:n+1, :], axis=0)  # Summe Zeilen 0..n
-    y_approx_list.append(y_approx_n)
+    # -- Partielle Summen (DC + 1..n Harmonische) vorbereiten ------------------
+    y_approx_list = partial_sums(comps)         # Zeile n = Summe Zeilen 0..n
 
 # -- Plot ----------------------------------------------------------------------
 fig = make_subplots(
@@ -124,8 +95,8 @@ colors = [
 # Trace 0: DC-Komponente links
 fig.add_trace(
     go.Scatter(
-        x=x_sig,
-        y=comps[0, :],
+        x=x_comp,
+        y=comps[0],
         mode="lines",
         line=dict(width=2, color="#000000"),
         name="DC",
@@ -138,8 +109,8 @@ fig.add_trace(
 for k in range(1, n_terms + 1):
     fig.add_trace(
         go.Scatter(
-            x=x_sig,
-            y=comps[k, :],          # k-te Komponente
+            x=x_comp,
+            y=comps[k],             # k-te Komponente
             mode="lines",
             line=dict(width=1, color=colors[k-1]),
             name=f"k = {k}",
@@ -161,11 +132,12 @@ fig.add_trace(
     row=1, col=2,
 )
 
-# Für jede Sliderposition ein eigener Summen-Trace, der per Slider ein-/ausgeblendet wird.
-for n in range(n_terms + 1):
+# Für jede Sliderposition ein eigener Summen-Trace, der per Slider ein-/ausgeblendet wird
+# (CLIENT_KERNEL: nur einer, dessen Daten das Skript je Sliderposition neu setzt).
+for n in range(len(y_approx_list)):
     fig.add_trace(
         go.Scatter(
-            x=x_sig,
+            x=x_comp,
             y=y_approx_list[n],
             mode="lines",
             line=dict(width=2, color="#d62728"),
@@ -183,37 +155,40 @@ for n in range(n_terms + 1):
 #   n_terms+1      : Rampe rechts
 #   n_terms+2 .. n_terms+2+n_terms : Summen rechts (n=0..n_terms)
 
-total_traces = 2 * n_terms + 3          # Gesamtanzahl Traces
 sum_start = n_terms + 2                 # Startindex Summen rechts
-square_idx = n_terms + 1                # Index Rampe rechts
 
-steps = []                              # Slider-Schritte
+if CLIENT_KERNEL:
+    steps = kernel_steps(n_terms)           # Kurven setzt kernel_script()
+else:
+    total_traces = 2 * n_terms + 3          # Gesamtanzahl Traces
+    square_idx = n_terms + 1                # Index Rampe rechts
+    steps = []                              # Slider-Schritte
 
-for n in range(n_terms + 1):            # n = 0..n_terms
-    visible = [False] * total_traces    # alles zunächst unsichtbar
+    for n in range(n_terms + 1):            # n = 0..n_terms
+        visible = [False] * total_traces    # alles zunächst unsichtbar
 
-    # Links: DC immer sichtbar
-    visible[0] = True
+        # Links: DC immer sichtbar
+        visible[0] = True
 
-    # Links: Harmonische 1..n sichtbar
-    for k in range(1, n_terms + 1):
-        if k <= n:
-            visible[k] = True
+        # Links: Harmonische 1..n sichtbar
+        for k in range(1, n_terms + 1):
+            if k <= n:
+                visible[k] = True
 
-    # Rechts: Rampe immer sichtbar
-    visible[square_idx] = True
+        # Rechts: Rampe immer sichtbar
+        visible[square_idx] = True
 
-    # Rechts: genau eine Summenkurve sichtbar (entsprechend Sliderposition)
-    for j in range(n_terms + 1):
-        idx = sum_start + j             # Index des j-ten Summen-Traces
-        visible[idx] = (j == n)         # nur j == n sichtbar
+        # Rechts: genau eine Summenkurve sichtbar (entsprechend Sliderposition)
+        for j in range(n_terms + 1):
+            idx = sum_start + j             # Index des j-ten Summen-Traces
+            visible[idx] = (j == n)         # nur j == n sichtbar
 
-    step = dict(
-        method="update",                # nur Sichtbarkeiten updaten
-        args=[{"visible": visible}],
-        label=str(n)
-    )
-    steps.append(step)
+        step = dict(
+            method="update",                # nur Sichtbarkeiten updaten
+            args=[{"visible": visible}],
+            label=str(n)
+        )
+        steps.append(step)
 
 sliders = [dict(
     active=0,
@@ -264,10 +239,14 @@ fig.update_yaxes(               # y-Achsen-Einstellungen
 )
 
 # -- Export --------------------------------------------------------------------
-fig.write_html(
-    HTML_PATH,
-    include_plotlyjs=True,     # Plotly lokal
-    include_mathjax="../../../js/mathjax/tex-chtml-full.js",   # MathJax lokal
-    full_html=True
-)
+post_script = None
+if CLIENT_KERNEL:
+    post_script = kernel_script(
+        x_sig, DC, A, phi, omega0, x0,
+        dc_trace=0,                                 # DC links
+        component_traces=range(1, n_terms + 1),     # Harmonische links
+        sum_trace=sum_start,                        # Summe rechts
+    )
+write_plotly_html(fig, HTML_PATH, quantize=12,    # float32-base64, 12 Mantissenbits
+                  post_script=post_script)
 print(f"Unter {HTML_PATH} abgespeichert")
\ No newline at end of file